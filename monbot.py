@@ -1,18 +1,40 @@
+import os
+
 import discord
 from discord.ext import commands
 
+from src.combat.ai_scheduler import AIScheduler
 from src.combat.battle_manager import BattleManager
+from src.combat.policy import PolicyTable
+from src.core.config import STORAGE_BACKEND, SQLITE_PATH, POLICY_PATH
 from src.data.data_manager import DataManager
+from src.data.dynamo_backend import DynamoBackend
+from src.data.sqlite_backend import SQLiteBackend
 from src.discord_token import TOKEN
 from src.shop.general_shop import GeneralShop
+from src.ui.render_queue import RenderQueue
 from src.ui.view_router import ViewRouter
 
 description = "Collect elementals and battle them!"
 bot = commands.Bot(command_prefix=';', description=description)
 client = discord.Client()
 view_manager: ViewRouter = None
-battle_manager: BattleManager = BattleManager()
-data_manager: DataManager = DataManager()
+data_manager: DataManager = DataManager(SQLiteBackend(SQLITE_PATH) if STORAGE_BACKEND == 'sqlite' else DynamoBackend())
+ai_scheduler: AIScheduler = AIScheduler()
+policy: PolicyTable = PolicyTable.load(POLICY_PATH) if os.path.exists(POLICY_PATH) else None
+battle_manager: BattleManager = BattleManager(data_manager, ai_scheduler=ai_scheduler, policy=policy)
+# Shared with every Form through Form.bot.
+bot.data_manager = data_manager
+bot.battle_manager = battle_manager
+bot.render_queue = RenderQueue(bot)
+
+
+def remember_guild(message, player) -> None:
+    """
+    Rank a player among the members of the server they're playing in, so that they can be challenged there.
+    """
+    if message.server:
+        data_manager.guilds.add(message.server.id, player)
 
 
 @bot.event
@@ -28,7 +50,8 @@ async def menu(ctx):
     await view_manager.delete_message(ctx.message)
     if user.bot:
         return
-    player = data_manager.get_created_player(user)
+    player = await data_manager.aget_created_player(user)
+    remember_guild(ctx.message, player)
     if player.has_elemental:
         await view_manager.show_main_menu(player, ctx.message)
     else:
@@ -41,7 +64,8 @@ async def status(ctx):
     await view_manager.delete_message(ctx.message)
     if user.bot:
         return
-    player = data_manager.get_created_player(user)
+    player = await data_manager.aget_created_player(user)
+    remember_guild(ctx.message, player)
     if player.is_busy:
         return
     if player.has_elemental:
@@ -56,7 +80,8 @@ async def shop(ctx):
     await view_manager.delete_message(ctx.message)
     if user.bot:
         return
-    player = data_manager.get_created_player(user)
+    player = await data_manager.aget_created_player(user)
+    remember_guild(ctx.message, player)
     if not player.has_elemental or player.is_busy:
         return
     await view_manager.show_shop(GeneralShop(), player)
@@ -68,7 +93,8 @@ async def versus(ctx):
     await view_manager.delete_message(ctx.message)
     if user.bot:
         return
-    player = data_manager.get_created_player(user)
+    player = await data_manager.aget_created_player(user)
+    remember_guild(ctx.message, player)
     if not player.has_elemental:
         await view_manager.show_starter_selection(player)
         return
@@ -86,7 +112,8 @@ async def battle(ctx):
     await view_manager.delete_message(ctx.message)
     if user.bot:
         return
-    player = data_manager.get_created_player(user)
+    player = await data_manager.aget_created_player(user)
+    remember_guild(ctx.message, player)
     if not player.has_elemental:
         await view_manager.show_starter_selection(player)
     elif player.is_busy:
@@ -107,7 +134,8 @@ async def summon(ctx):
     await view_manager.delete_message(ctx.message)
     if user.bot:
         return
-    player = data_manager.get_created_player(user)
+    player = await data_manager.aget_created_player(user)
+    remember_guild(ctx.message, player)
     if player.is_busy:
         return
     if player.has_elemental:
@@ -125,7 +153,8 @@ async def on_reaction_add(reaction, user):
     """
     if user.bot:
         return
-    player = data_manager.get_created_player(user)
+    player = await data_manager.aget_created_player(user)
+    remember_guild(reaction.message, player)
     view = player.primary_view
     if view and view.matches(reaction.message):
         await view.pick_option(reaction.emoji)
@@ -139,7 +168,7 @@ async def on_reaction_add(reaction, user):
 async def on_reaction_remove(reaction, user):
     if user.bot:
         return
-    player = data_manager.get_created_player(user)
+    player = await data_manager.aget_created_player(user)
     view = player.primary_view
     if view and view.matches(reaction.message):
         await view.remove_option(reaction.emoji)
@@ -153,11 +182,16 @@ async def on_message(message):
     if message.author.bot:
         return
     await bot.process_commands(message)
-    player = data_manager.get_player(message.author)
+    player = await data_manager.aget_player(message.author)
     if not player:
         return
+    remember_guild(message, player)
     view = player.primary_view
     if view and view.is_awaiting_input:
         await view.receive_input(message)
 
-bot.run(TOKEN)
+try:
+    bot.run(TOKEN)
+finally:
+    ai_scheduler.close()
+    data_manager.close()
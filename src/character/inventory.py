@@ -1,5 +1,6 @@
 from typing import List
 
+from src.data.dirty_tracker import DirtyTracker
 from src.data.resources import ItemResource
 from src.elemental.combat_elemental import CombatElemental
 from src.elemental.elemental import Elemental
@@ -34,6 +35,7 @@ class ItemSlot:
 class Inventory:
     def __init__(self):
         self._bag = {}  # {item_name: ItemSlot}
+        self.server_state = DirtyTracker()  # What this Inventory looks like on the server.
 
     @property
     def items(self) -> List[ItemSlot]:
@@ -28,30 +28,33 @@ race_syllables_map = {
 }
 
 
-def pick_random(from_list) -> any:
-    index = random.randint(0, len(from_list) - 1)
+def pick_random(from_list, rng=random) -> any:
+    index = rng.randint(0, len(from_list) - 1)
     return from_list[index]
 
 
 class NameGenerator:
 
     @staticmethod
-    def generate_name() -> str:
-        syllables = pick_random(list(race_syllables_map.values()))
-        name = NameGenerator._construct_name(syllables)
+    def generate_name(rng=random) -> str:
+        """
+        :param rng: The random.Random to generate with. The random module's by default.
+        """
+        syllables = pick_random(list(race_syllables_map.values()), rng)
+        name = NameGenerator._construct_name(syllables, rng)
         for filtered in FILTER:
             if filtered in name:
-                name = NameGenerator._construct_name(syllables)  # Reroll once for now.
+                name = NameGenerator._construct_name(syllables, rng)  # Reroll once for now.
                 break
         return capitalize(name)
 
     @staticmethod
-    def _construct_name(syllables: List[str]) -> str:
+    def _construct_name(syllables: List[str], rng) -> str:
         syllables = list(syllables)  # Defensive copy due to popping
         name = []
-        num_components = pick_random([1, 2, 2, 3])
+        num_components = pick_random([1, 2, 2, 3], rng)
         for i in range(num_components):
-            index = random.randint(0, len(syllables) - 1)
+            index = rng.randint(0, len(syllables) - 1)
             component = syllables.pop(index)
             name.append(component)
         return ''.join(name)
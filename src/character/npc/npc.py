@@ -1,4 +1,4 @@
-from random import randint
+import random
 
 from src.character.character import Character
 from src.character.player import Player
@@ -15,15 +15,18 @@ class NPC(Character):
 
     def __init__(self,
                  nickname: str,
-                 potential_species):
+                 potential_species,
+                 rng=random):
         """
         :param nickname: Eg. 'Adventurer'
         :param potential_species: List[Species]
+        :param rng: The random.Random that teams are generated with. The random module's by default.
         """
         super().__init__()
         self._is_npc = True
         self._nickname = nickname
         self._potential_species = potential_species
+        self._rng = rng
 
     def generate_equal_team(self, opponent: 'Character') -> None:
         """
@@ -54,8 +57,8 @@ class NPC(Character):
         """
         Generates a random Team, not based off of an opponent.
         """
-        self._level = randint(min_level, max_level)
-        team_size = randint(min_team_size, max_team_size)
+        self._level = self._rng.randint(min_level, max_level)
+        team_size = self._rng.randint(min_team_size, max_team_size)
         for i in range(team_size):
             elemental = self._get_random_elemental()
             self._team.add_elemental(elemental)
@@ -68,30 +71,29 @@ class NPC(Character):
         team_average_level = opponent.team.average_elemental_level
         min_level = max(1, team_average_level - 3)  # Cannot be below 1
         max_level = team_average_level + 1
-        self._level = randint(min_level, max_level)
+        self._level = self._rng.randint(min_level, max_level)
 
-    @staticmethod
-    def _roll_team_size(opponent: 'NPC' or Player) -> int:
+    def _roll_team_size(self, opponent: 'NPC' or Player) -> int:
         """
         Generates a Team size that is not larger than the opponent's.
         """
         min_team_size = 1
         max_team_size = opponent.team.size
-        return randint(min_team_size, max_team_size)
+        return self._rng.randint(min_team_size, max_team_size)
 
     def _get_random_elemental(self) -> 'Elemental':
         species = self._get_random_species()
         level = self._roll_elemental_level()
-        return ElementalInitializer().make(species, level)
+        return ElementalInitializer().make(species, level, self._rng)
 
     def _roll_elemental_level(self) -> int:
         min_level = max(1, self._level - 2)  # Cannot be below 1
         max_level = self._level
-        return randint(min_level, max_level)
+        return self._rng.randint(min_level, max_level)
 
     def _get_random_species(self) -> 'Species':
         """
         :return: Species, the static information about an Elemental.
         """
-        pick = randint(0, len(self._potential_species) - 1)
+        pick = self._rng.randint(0, len(self._potential_species) - 1)
         return self._potential_species[pick]
@@ -33,28 +33,35 @@ class Professions(Enum):
 
 class NPCInitializer:
 
-    def get_random_opponent(self) -> NPC:
+    """
+    Each method takes the random.Random that the NPC's name and team are generated with.
+    The random module's is used by default.
+    """
+
+    def get_random_opponent(self, rng=random) -> NPC:
         opponents = [self.adventurer,
                      self.collector]
-        pick = random.randint(0, len(opponents) - 1)
-        return opponents[pick]()
+        pick = rng.randint(0, len(opponents) - 1)
+        return opponents[pick](rng)
 
     @staticmethod
-    def make_name_with_title(profession: Professions) -> str:
-        return f'{profession} {NameGenerator.generate_name()}'
+    def make_name_with_title(profession: Professions, rng=random) -> str:
+        return f'{profession} {NameGenerator.generate_name(rng)}'
 
     @staticmethod
-    def adventurer() -> NPC:
+    def adventurer(rng=random) -> NPC:
         potential_species = [Mithus(), Roaus(), Rainatu(), Sithel()]
-        return NPC(NPCInitializer.make_name_with_title(Professions.ADVENTURER),
-                   potential_species)
+        return NPC(NPCInitializer.make_name_with_title(Professions.ADVENTURER, rng),
+                   potential_species,
+                   rng)
 
     @staticmethod
-    def collector() -> NPC:
+    def collector(rng=random) -> NPC:
         potential_species = [Mithus(), Roaus(), Rainatu(), Sithel(),
                              Felix(), Manapher(), Nepharus(), Slyfe(), Noel(), Rex()]
-        return NPC(NPCInitializer.make_name_with_title(Professions.COLLECTOR),
-                   potential_species)
+        return NPC(NPCInitializer.make_name_with_title(Professions.COLLECTOR, rng),
+                   potential_species,
+                   rng)
 
     @staticmethod
     def researcher() -> NPC:
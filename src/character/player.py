@@ -1,5 +1,6 @@
 from src.character.character import Character
 from src.core.config import PLAYER_START_LEVEL
+from src.data.dirty_tracker import DirtyTracker
 from src.data.resources import PlayerResource, InventoryResource
 from src.items.consumables import Peach, Revive
 from src.ui.forms.form import Form
@@ -26,6 +27,7 @@ class Player(Character):
         self.battles_fought = battles_fought
         self._gold = gold
         self.location = location  # TODO
+        self.server_state = DirtyTracker()  # What this Player looks like on the server.
 
     def add_starter_items(self):
         self.inventory.add_item(Peach(), 2)
@@ -55,6 +57,35 @@ class Player(Character):
     def can_battle(self) -> bool:
         return not self.is_busy and not self.team.is_all_knocked_out
 
+    @property
+    def is_dirty(self) -> bool:
+        """
+        :return: True if the player's own data (not the inventory or elementals) changed since it was last saved.
+        """
+        return self.server_state.is_dirty(self.to_server())
+
+    @property
+    def is_inventory_dirty(self) -> bool:
+        return self.inventory.server_state.is_dirty(self.inventory_to_server())
+
+    @property
+    def has_unsaved_changes(self) -> bool:
+        """
+        :return: True if anything about this player would be written by a save.
+        """
+        return (self.is_dirty
+                or self.is_inventory_dirty
+                or any(elemental.is_dirty for elemental in self.elementals))
+
+    def mark_saved(self) -> None:
+        """
+        Record the player's current state, including their inventory and elementals, as what is on the server.
+        """
+        self.server_state.mark_saved(self.to_server())
+        self.inventory.server_state.mark_saved(self.inventory_to_server())
+        for elemental in self.elementals:
+            elemental.server_state.mark_saved(elemental.to_server())
+
     def has_item(self, item) -> bool:
         return self.inventory.has_item(item)
 
@@ -106,6 +137,10 @@ class Player(Character):
         """
         self._challenges[challenge.discord_message.id] = challenge
 
+    @property
+    def has_challenges(self) -> bool:
+        return len(self._challenges) > 0
+
     def get_challenge(self, message):
         """
         :param message: discord.message
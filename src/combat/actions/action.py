@@ -55,6 +55,13 @@ class Action:
     def can_execute(self) -> bool:
         raise NotImplementedError
 
+    def clone(self, clones: dict) -> 'Action':
+        """
+        Copy an Action that has been requested but not resolved yet, for a cloned Combat.
+        :param clones: {id(original): clone} of the battle being cloned. See src.core.cloning.
+        """
+        raise NotImplementedError
+
     @property
     def final_damage(self) -> int:
         return 0
@@ -67,8 +74,11 @@ class Action:
 class ActionLogger:
     """
     A collection of Actions taken across a match.
+    Only the last few rounds are kept, since each Action holds on to its actor, target and combat.
     """
 
+    MAX_ROUNDS = 3
+
     def __init__(self):
         self.logs = [[]]  # List[List[Action]]
 
@@ -78,6 +88,11 @@ class ActionLogger:
 
     def prepare_new_round(self) -> None:
         self.logs.append([])
+        if len(self.logs) > self.MAX_ROUNDS:
+            previous_round_actions = self.previous_round_actions
+            self.logs = self.logs[-self.MAX_ROUNDS:]
+            if previous_round_actions and not any(self.logs):
+                self.logs.insert(0, previous_round_actions)
 
     @property
     def previous_round_actions(self) -> List[Action]:
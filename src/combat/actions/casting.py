@@ -1,4 +1,5 @@
 from src.combat.actions.action import Action, ActionType
+from src.core.cloning import get_clone, shallow_clone
 from src.core.targetable_interface import Targetable
 from src.elemental.ability.ability import TurnPriority
 from src.elemental.ability.queueable import Castable
@@ -19,6 +20,12 @@ class Casting(Action):
         self.castable = castable
         self.ability = self.castable.ability
 
+    def clone(self, clones: dict) -> 'Casting':
+        action = shallow_clone(self, clones)
+        action.actor = get_clone(self.actor, clones)
+        action.castable = get_clone(self.castable, clones)
+        return action
+
     @property
     def can_execute(self) -> bool:
         return not self.actor.is_knocked_out
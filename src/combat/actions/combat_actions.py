@@ -1,4 +1,5 @@
 from src.combat.actions.action import Action, ActionType
+from src.core.cloning import get_clone, shallow_clone
 from src.elemental.ability.ability import Ability, TurnPriority, Target
 
 
@@ -21,6 +22,14 @@ class Switch(Action):
         self.old_active = old_active
         self.new_active = new_active
 
+    def clone(self, clones: dict) -> 'Switch':
+        action = shallow_clone(self, clones)
+        action._team = get_clone(self._team, clones)
+        action.character = None  # Cloned teams have no owner.
+        action.old_active = get_clone(self.old_active, clones)
+        action.new_active = get_clone(self.new_active, clones)
+        return action
+
     @property
     def action_type(self) -> ActionType:
         return ActionType.SWITCH
@@ -96,6 +105,13 @@ class UseItem(Action):
         self.character = combat_team.owner  # Could be None.
         self.elemental = elemental
 
+    def clone(self, clones: dict) -> 'UseItem':
+        action = shallow_clone(self, clones)
+        action.combat_team = get_clone(self.combat_team, clones)
+        action.character = None
+        action.elemental = get_clone(self.elemental, clones)
+        return action
+
     @property
     def action_type(self) -> ActionType:
         return ActionType.ITEM
@@ -1,4 +1,5 @@
 from src.combat.actions.action import ActionType, Action
+from src.core.cloning import get_clone, shallow_clone
 from src.elemental.ability.ability import TurnPriority, Ability
 from src.elemental.ability.damage_calculator import DamageCalculator
 from src.elemental.combat_elemental import CombatElemental
@@ -28,6 +29,17 @@ class ElementalAction(Action):
     def __repr__(self):
         return f"{self.recap} {self.final_damage} damage dealt."
 
+    def clone(self, clones: dict) -> 'ElementalAction':
+        action = shallow_clone(self, clones)
+        action.actor = get_clone(self.actor, clones)
+        action.combat = get_clone(self.combat, clones)
+        # The target and damage are determined again on execution.
+        action.target = None
+        action.damage_calculator = None
+        action.target_effects_applied = []
+        action.target_effects_failed = []
+        return action
+
     @property
     def team(self):
         return self.actor.team
@@ -0,0 +1,110 @@
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from src.combat.combat_ai import CombatAI, Move
+
+
+class AIScheduler:
+    """
+    Decides the moves of NPC teams on worker threads, so that an AI that thinks for a while doesn't hold up the event
+    loop, and with it every other battle and form.
+    The AI decides on a copy of the battle, made on the event loop, and the move is made in the real battle back on
+    the event loop. If the AI takes longer than the timeout or fails, CombatAI's quick choice is made instead.
+    """
+    MAX_WORKERS = 2
+    TIMEOUT_SECONDS = 2.0  # The longest an NPC keeps its opponent waiting.
+    LATENCIES_KEPT = 1000
+    SUMMARY_EVERY = 500  # Decisions between the summaries that are printed.
+
+    def __init__(self,
+                 max_workers=MAX_WORKERS,
+                 timeout=TIMEOUT_SECONDS):
+        """
+        :param max_workers: How many decisions can be made at once, across every battle.
+        :param timeout: Seconds from scheduling a decision until the AI is given up on, including time spent waiting
+        for a worker.
+        """
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='combat-ai')
+        self.timeout = timeout
+        self.latencies = deque(maxlen=AIScheduler.LATENCIES_KEPT)  # Seconds from scheduling to move, most recent.
+        self.num_decisions = 0
+        self.num_timeouts = 0  # Decisions made by CombatAI because the AI took too long.
+        self.num_errors = 0  # Decisions made by CombatAI because the AI raised an error.
+        self.num_discarded = 0  # Decisions no longer needed by the time they were made, eg. because of a forfeit.
+
+    def schedule(self, combat_team, combat) -> asyncio.Future:
+        """
+        Start deciding a team's move for the current round. Must be called from the event loop.
+        :param combat_team: The NPC CombatTeam.
+        :param combat: Combat
+        :return: Done when the move has been made, or wasn't needed anymore.
+        """
+        return asyncio.ensure_future(self._decide(combat_team, combat, combat.num_rounds, time.perf_counter()))
+
+    def percentile(self, percentile: float) -> float or None:
+        """
+        :param percentile: Between 0 and 100.
+        :return: The latency, in seconds, that the given share of recent decisions didn't exceed.
+        """
+        if not self.latencies:
+            return None
+        latencies = sorted(self.latencies)
+        return latencies[min(len(latencies) - 1, int(len(latencies) * percentile / 100))]
+
+    def summary(self) -> str:
+        p50, p99 = self.percentile(50), self.percentile(99)
+        latencies = f"{p50 * 1000:.0f} ms p50, {p99 * 1000:.0f} ms p99" if self.latencies else "no latencies"
+        return (f"NPC decisions: {self.num_decisions} made ({latencies} of the last {len(self.latencies)}), "
+                f"{self.num_timeouts} timed out, {self.num_errors} failed, {self.num_discarded} discarded.")
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+
+    async def _decide(self,
+                      combat_team,
+                      combat,
+                      num_rounds: int,
+                      start: float) -> None:
+        # By the time this runs, whatever scheduled it has finished setting up the round.
+        if not AIScheduler._is_needed(combat_team, combat, num_rounds):
+            self.num_discarded += 1
+            return
+        clone = combat.clone()
+        ai = combat.make_ai(clone.teams[combat.teams.index(combat_team)], clone)
+        loop = asyncio.get_running_loop()
+        try:
+            remaining = self.timeout - (time.perf_counter() - start)
+            move = await asyncio.wait_for(loop.run_in_executor(self._executor, ai.decide), max(0, remaining))
+        except asyncio.TimeoutError:
+            # The worker can't be stopped, but a SearchAI gives up by itself once its budget runs out.
+            self.num_timeouts += 1
+            move = self._fall_back(combat_team, combat, num_rounds)
+        except Exception as e:
+            print(f"Couldn't decide a move for {combat_team.active_elemental.nickname}: {e}")
+            self.num_errors += 1
+            move = self._fall_back(combat_team, combat, num_rounds)
+        self.latencies.append(time.perf_counter() - start)
+        self.num_decisions += 1
+        if self.num_decisions % AIScheduler.SUMMARY_EVERY == 0:
+            print(self.summary())
+        if not AIScheduler._is_needed(combat_team, combat, num_rounds):
+            self.num_discarded += 1
+        elif move:
+            CombatAI(combat_team, combat).make_move(move)
+
+    @staticmethod
+    def _fall_back(combat_team, combat, num_rounds: int) -> Move or None:
+        if AIScheduler._is_needed(combat_team, combat, num_rounds):
+            return CombatAI(combat_team, combat).decide()
+
+    @staticmethod
+    def _is_needed(combat_team, combat, num_rounds: int) -> bool:
+        """
+        :return: True if the battle is still in the round the decision was scheduled for, and waiting on the team.
+        """
+        return (combat.in_progress
+                and combat.num_rounds == num_rounds
+                and combat_team in combat.teams
+                and not any(request.team is combat_team for request in combat.action_requests))
@@ -2,7 +2,10 @@ import random
 
 from src.character.npc.npc_initializer import NPCInitializer
 from src.character.player import Player
+from src.combat.ai_scheduler import AIScheduler
 from src.combat.combat import Combat
+from src.combat.difficulty import Difficulty
+from src.combat.policy import PolicyTable
 from src.data.data_manager import DataManager
 from src.elemental.elemental_factory import ElementalInitializer
 from src.elemental.species.npc_monsters.manapher import Manapher
@@ -14,30 +17,65 @@ class BattleManager:
     """
     How a user enters combat.
     """
+    # How well random opponents play, by the number of battles their player has fought: the first tier reached.
+    # New players face random moves, or the policy if there is one.
+    DIFFICULTY_TIERS = [(50, Difficulty.HARD), (10, Difficulty.NORMAL), (0, Difficulty.EASY)]
 
-    @staticmethod
-    def create_duel(player: Player, other_player: Player) -> None:
+    def __init__(self,
+                 data_manager: DataManager,
+                 rng: random.Random = None,
+                 ai_scheduler: AIScheduler = None,
+                 policy: PolicyTable = None):
+        """
+        :param data_manager: The bot's DataManager, which saves the results of every battle.
+        :param rng: Picks the seed of each battle. Seed it to make a run of battles reproducible.
+        :param ai_scheduler: Decides the moves of NPC opponents off the event loop. If None, they're decided inline.
+        :param policy: Followed by random opponents, which otherwise make random moves. Tutorial opponents don't.
+        """
+        self.data_manager = data_manager
+        self.rng = rng or random.Random()
+        self.ai_scheduler = ai_scheduler
+        self.policy = policy
+
+    def create_duel(self, player: Player, other_player: Player) -> None:
         """
         Start a fight between two players.
         """
         Combat([CombatTeam.from_team(player.team)],
                [CombatTeam.from_team(other_player.team)],
-               data_manager=DataManager(),
+               data_manager=self.data_manager,
                allow_flee=False,
-               allow_items=False)
+               allow_items=False,
+               seed=self.rng.getrandbits(32))
+        # Neither player can be challenged until the fight is over.
+        self.data_manager.guilds.update(player)
+        self.data_manager.guilds.update(other_player)
 
-    @staticmethod
-    def create_pve_combat(player: Player) -> CombatTeam:
+    def create_pve_combat(self, player: Player) -> CombatTeam:
+        """
+        The opponent is generated from the battle's seed too, so that the seed rebuilds the whole battle.
+        """
+        seed = self.rng.getrandbits(32)
         if player.battles_fought < 2:
             opponent = BattleManager._tutorial_opponent(player)
         else:
-            opponent = BattleManager._get_random_opponent(player)
+            opponent = BattleManager._get_random_opponent(player, random.Random(seed))
+            opponent.difficulty = BattleManager.get_difficulty(player)
+            opponent.policy = self.policy
         player_team = CombatTeam.from_team(player.team)
         Combat([player_team],
                [opponent],
-               data_manager=DataManager())
+               data_manager=self.data_manager,
+               seed=seed,
+               ai_scheduler=self.ai_scheduler)
+        self.data_manager.guilds.update(player)
         return player_team
 
+    @staticmethod
+    def get_difficulty(player: Player) -> Difficulty:
+        return next(difficulty for num_battles, difficulty in BattleManager.DIFFICULTY_TIERS
+                    if player.battles_fought >= num_battles)
+
     @staticmethod
     def _tutorial_opponent(player: Player) -> CombatTeam:
         if player.battles_fought == 0:
@@ -47,21 +85,21 @@ class BattleManager:
         return CombatTeam([ElementalInitializer.make(tutorial_elemental)])
 
     @staticmethod
-    def _get_random_opponent(player: Player) -> CombatTeam:
+    def _get_random_opponent(player: Player, rng: random.Random) -> CombatTeam:
         """
         A random encounter with an Elemental or NPC.
         """
-        coin_flip = random.randint(0, 1)
+        coin_flip = rng.randint(0, 1)
         if coin_flip:
-            opponent = NPCInitializer().get_random_opponent()
+            opponent = NPCInitializer().get_random_opponent(rng)
             opponent.generate_team(player)
             return CombatTeam.from_team(opponent.team)
-        return BattleManager._get_wild_elemental(player)
+        return BattleManager._get_wild_elemental(player, rng)
 
     @staticmethod
-    def _get_wild_elemental(player: Player) -> CombatTeam:
+    def _get_wild_elemental(player: Player, rng: random.Random) -> CombatTeam:
         team_average = player.team.average_elemental_level
         min_level = team_average - 1
         max_level = team_average + player.team.size
-        level = random.randint(min_level, max_level)
-        return CombatTeam([ElementalInitializer.make_random(level)])
+        level = rng.randint(min_level, max_level)
+        return CombatTeam([ElementalInitializer.make_random(level, rng=rng)])
@@ -1,12 +1,15 @@
+import asyncio
+import random
 from itertools import groupby
 from typing import List
 
 from src.character.character import Character
 from src.combat.actions.action import ActionLogger
 from src.combat.actions.combat_actions import Action, Switch
-from src.combat.combat_ai import CombatAI
-from src.combat.event import EventLogger
+from src.combat.event import EventLogger, NullEventLogger
 from src.combat.loot_generator import LootGenerator
+from src.combat.search_ai import make_ai as make_default_ai
+from src.core.cloning import get_clone, shallow_clone
 from src.core.targetable_interface import Targetable
 from src.data.data_manager import DataManager
 from src.elemental.ability.ability import Ability, Target
@@ -27,7 +30,21 @@ class Combat:
                  data_manager: DataManager,
                  allow_items=True,
                  allow_flee=True,
-                 allow_exp_gain=True):
+                 allow_exp_gain=True,
+                 seed: int = None,
+                 ai_scheduler=None,
+                 make_ai=None):
+        """
+        :param seed: Seeds every random roll made during the battle, eg. NPC moves and loot. Replaying a battle's seed
+        with the same teams and moves plays it out the same way, unless an NPC searches on a time budget (see
+        SearchAI). A new seed is picked if None.
+        :param ai_scheduler: AIScheduler. Decides NPC moves off the event loop, in which case the battle must be
+        created on the event loop. If None, NPC moves are decided as soon as each round starts.
+        :param make_ai: Makes the CombatAI of an NPC team, given the team and the battle, eg. to instrument the AIs
+        of a simulation. search_ai.make_ai if None.
+        """
+        self.seed = seed if seed is not None else Combat.new_seed()
+        self.rng = random.Random(self.seed)
         self.side_a = side_a  # List[CombatTeam] One side of the battlefield.
         self.side_b = side_b  # List[CombatTeam] Another side of the battlefield.
         self.max_teams_per_side = 3
@@ -41,6 +58,13 @@ class Combat:
         self.winning_side = []  # List[CombatTeam] The teams who won, for rendering purposes.
         self.losing_side = []
         self.data_manager = data_manager
+        self.auto_play_npcs = True  # Make the moves of NPC teams at the start of each round.
+        self.ai_scheduler = ai_scheduler
+        self.make_ai = make_ai or make_default_ai
+        self.npc_decisions = []  # List[asyncio.Future] NPC moves of this round still being decided by ai_scheduler.
+        self.is_clone = False
+        self._is_resolving = False  # True while resolving a round; NPC moves made meanwhile queue the next one.
+        self._is_next_round_ready = False
 
         self.in_progress = True
         for team in self.side_a:
@@ -52,6 +76,43 @@ class Combat:
             team.set_combat(self)
             team.on_combat_start()
 
+    def clone(self, clones: dict = None) -> 'Combat':
+        """
+        Copy the current state of the battle, eg. to see what a move would do without making it.
+        The copy shares nothing that changes during battle with the original. It has no loggers' history, no
+        owners (so every team is an NPC team), no data manager and no loot, so playing it affects nothing else.
+        NPC moves aren't made automatically in the copy; set auto_play_npcs to play it out.
+        :param clones: {id(original): clone}, if other objects are being cloned along with the battle.
+        """
+        if clones is None:
+            clones = {}
+        combat = shallow_clone(self, clones)
+        combat.is_clone = True
+        combat.auto_play_npcs = False
+        combat.ai_scheduler = None
+        combat.make_ai = make_default_ai
+        combat.npc_decisions = []
+        combat._is_resolving = False
+        combat._is_next_round_ready = False
+        combat.data_manager = None
+        combat.action_logger = ActionLogger()
+        combat.turn_logger = NullEventLogger(combat)
+        combat.rng = random.Random()
+        combat.rng.setstate(self.rng.getstate())  # The copy rolls what the original would, without affecting it.
+        combat.side_a = [get_clone(team, clones) for team in self.side_a]
+        combat.side_b = [get_clone(team, clones) for team in self.side_b]
+        combat.winning_side = [get_clone(team, clones) for team in self.winning_side]
+        combat.losing_side = [get_clone(team, clones) for team in self.losing_side]
+        combat.action_requests = [get_clone(action, clones) for action in self.action_requests]
+        return combat
+
+    @staticmethod
+    def new_seed() -> int:
+        """
+        Drawn from the random module, so that seeding it makes the seeds of the battles that follow reproducible.
+        """
+        return random.getrandbits(32)
+
     @property
     def teams(self):
         """
@@ -90,6 +151,14 @@ class Combat:
         """
         return len(self._get_knockouts()) > 0
 
+    async def wait_for_npcs(self) -> None:
+        """
+        Wait until the NPC moves being decided off the event loop this round have been made.
+        """
+        pending = [decision for decision in self.npc_decisions if not decision.done()]
+        if pending:
+            await asyncio.wait(pending)
+
     def request_action(self, request: Action) -> None:
         """
         :param request: An Action requested by a CombatTeam/player.
@@ -157,6 +226,9 @@ class Combat:
         elif team.side == Combat.SIDE_B:
             self.side_b.remove(team)
         team.end_combat()
+        self.turn_logger.remove_viewer(team)
+        if team.owner and not team.owner.is_npc:
+            self.data_manager.guilds.update(team.owner)  # They can be challenged again.
         self._check_combat_end()
 
     def _add_knockout_replacement(self, request: Action) -> None:
@@ -166,7 +238,23 @@ class Combat:
     def _resolve_requests(self) -> None:
         """
         When all players have made an action request, resolve the order and execution of those requests.
+        If NPCs make every move of the next round while this one is being resolved, that round is resolved after this
+        one in the same loop, so that a battle between NPCs doesn't nest one level deeper for each round.
         """
+        if self._is_resolving:
+            self._is_next_round_ready = True
+            return
+        self._is_resolving = True
+        try:
+            self._is_next_round_ready = True
+            while self._is_next_round_ready:
+                self._is_next_round_ready = False
+                self._resolve_round()
+        finally:
+            self._is_resolving = False
+            self._is_next_round_ready = False
+
+    def _resolve_round(self) -> None:
         kos = []  # List[CombatElemental]: elementals knocked out this turn
         recently_active = [team.active_elemental for team in self.teams if team.active_elemental is not None]
         for action_group in self._get_priority_order_requests():
@@ -179,6 +267,8 @@ class Combat:
         for team in self.teams:
             team.end_round()
             self._check_kos(kos)
+        if self._check_combat_end():
+            return  # Eg. a status effect knocked out the last Elemental of a side, who can't send out another.
         self._prepare_new_round()
 
     @staticmethod
@@ -224,18 +314,24 @@ class Combat:
         self.num_rounds += 1
         self.action_logger.prepare_new_round()
         self.action_requests = []
+        self.npc_decisions = []
         self.turn_logger.prepare_new_round()
         if not self.in_progress:
             return
         for team in self.teams:
+            if self._is_next_round_ready:
+                return  # Every move of this round is in, so the teams left over start the round after it instead.
             if not self.is_awaiting_knockout_replacements():
                 # Do not regen mana while we wait for new Elementals to be sent in.
                 team.turn_start()
             if team.check_casting():
                 continue
-            if team.is_npc:
+            if team.is_npc and self.auto_play_npcs:
                 # Automatically make a move for NPC teams.
-                CombatAI(team, self).pick_move()
+                if self.ai_scheduler:
+                    self.npc_decisions.append(self.ai_scheduler.schedule(team, self))
+                else:
+                    self.make_ai(team, self).pick_move()
 
     def _get_priority_order_requests(self) -> List[List[Action]]:
         """
@@ -267,20 +363,25 @@ class Combat:
             return True
 
     def _generate_loot(self) -> None:
+        if self.is_clone:
+            return
         LootGenerator(winning_side=self.winning_side,
-                      losing_side=self.losing_side).generate_loot()
+                      losing_side=self.losing_side,
+                      rng=self.rng).generate_loot()
 
     def _end_combat(self) -> None:
         self.in_progress = False
         for team in self.teams:
             team.end_combat()
+        if self.is_clone:
+            return
         self._save_results()
-        print(f"Completed battle in {self.num_rounds} rounds.")
+        print(f"Completed battle in {self.num_rounds} rounds. Seed: {self.seed}")
 
     def _save_results(self) -> None:
         for team in self.teams:
             if team.owner and not team.owner.is_npc:
-                self.data_manager.save_all(team.owner)
+                self.data_manager.queue_save(team.owner)
 
     def _get_knockouts(self):
         """
@@ -1,13 +1,22 @@
-from random import randint
-from typing import List
+from typing import List, NamedTuple
 
 from src.core.elements import Effectiveness
+from src.elemental.ability.ability import Ability
 from src.team.combat_team import CombatTeam
 
 
+class Move(NamedTuple):
+    """
+    A move decided by an AI: either an Ability of the active elemental, or a switch.
+    """
+    ability: Ability = None
+    switch_to: int = None  # The position in CombatTeam.elementals of the elemental to switch to.
+
+
 class CombatAI:
     """
     An AI controller for a CombatTeam that selects Abilities and decides when to switch.
+    Deciding on a move is separate from making it, so that a move can be decided on a copy of the battle.
     """
     def __init__(self,
                  combat_team: CombatTeam,
@@ -20,39 +29,55 @@ class CombatAI:
         self.combat = combat
 
     def pick_move(self) -> None:
+        move = self.decide()
+        if move:
+            self.make_move(move)
+
+    def decide(self) -> Move or None:
+        """
+        :return: The move to make, or None if the team doesn't need to make one.
+        """
         if self.team.active_elemental.is_knocked_out and self.team.eligible_bench:
-            self.switch()
+            return self.decide_switch()
         elif not self.combat.is_awaiting_knockout_replacements():
-            self.pick_ability()
+            return self.decide_ability()
 
-    def switch(self) -> None:
+    def make_move(self, move: Move) -> None:
+        if move.switch_to is not None:
+            self.team.attempt_switch(self.team.elementals[move.switch_to])
+        else:
+            self.team.select_ability(move.ability)
+
+    def decide_switch(self) -> Move or None:
         if not self.team.eligible_bench:
             return
 
         effective_elementals = Effectiveness.find_effective(self.team.eligible_bench,
                                                             self.combat.get_active_enemy(self.team).element)
         if effective_elementals:
-            self.team.attempt_switch(effective_elementals[0])
-            return
+            return self.switch_to(effective_elementals[0])
 
         neutral_elementals = Effectiveness.find_neutral(self.team.eligible_bench,
                                                         self.combat.get_active_enemy(self.team).element)
         if neutral_elementals:
-            self.team.attempt_switch(neutral_elementals[0])
-            return
+            return self.switch_to(neutral_elementals[0])
 
-        self.team.attempt_switch(self.roll(self.team.eligible_bench))
+        return self.switch_to(self.roll(self.team.eligible_bench))
 
-    def pick_ability(self) -> None:
+    def decide_ability(self) -> Move:
         abilities = self.team.active_elemental.available_abilities
-        chosen_ability = self.roll(abilities)
-        self.team.select_ability(chosen_ability)
+        return Move(ability=self.roll(abilities))
+
+    def switch_to(self, elemental) -> Move:
+        """
+        :param elemental: CombatElemental on this team.
+        """
+        return Move(switch_to=self.team.elementals.index(elemental))
 
-    @staticmethod
-    def roll(options: List) -> any:
+    def roll(self, options: List) -> any:
         """
-        Helper method that picks a random value out of a list of equal options.
+        Helper method that picks a random value out of a list of equal options, with the Combat's RNG.
         Typically returns Ability or CombatElemental.
         """
-        pick = randint(0, len(options) - 1)
+        pick = self.combat.rng.randint(0, len(options) - 1)
         return options[pick]
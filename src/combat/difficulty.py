@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class Difficulty(Enum):
+    """
+    How well the AI plays an NPC team. See search_ai.make_ai().
+    """
+    EASY = 0  # Random abilities, and switches by element.
+    NORMAL = 1
+    HARD = 2
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, NamedTuple, Tuple
 
 from src.elemental.combat_elemental import CombatElementalLog
 
@@ -10,8 +10,8 @@ class EventLog:
     """
 
     def __init__(self,
-                 side_a: List[CombatElementalLog],
-                 side_b: List[CombatElementalLog],
+                 side_a: Tuple[CombatElementalLog, ...],
+                 side_b: Tuple[CombatElementalLog, ...],
                  recap: str,
                  acting_team):
         """
@@ -29,18 +29,40 @@ class EventLog:
         self.recap = f'{self.recap}\n{new_recap}'
 
 
+class EventRecord(NamedTuple):
+    """
+    What is kept of an EventLog once every viewer has rendered it: the recap, without the snapshots.
+    Reads like an EventLog with no elementals on either side, which rendering skips.
+    """
+    recap: str
+    side_a: tuple = ()
+    side_b: tuple = ()
+    acting_team: None = None
+
+
 class EventLogger:
     """
     Takes a snapshot of every currently-active elemental when asked to make a log.
     The snapshots are static representations of the elemental's state, which is otherwise mutable.
+    Consecutive logs share the snapshots of a side that didn't change.
+    Rounds are indexed from the start of the combat, but only the most recent ones are kept: rounds that every viewer
+    has rendered are compacted into EventRecords, and there are caps on how many full and compacted rounds are kept,
+    so that a long or abandoned battle can't grow without bound.
     """
 
+    MAX_FULL_ROUNDS = 20  # Rounds with snapshots, even if a viewer hasn't rendered them.
+    MAX_ROUNDS = 100
+
     def __init__(self, combat):
         """
         :param combat: Combat
         """
         self.combat = combat
-        self.logs = [[]]  # List[List[EventLog]]; events are grouped by rounds
+        self.logs = [[]]  # List[List[EventLog] or Tuple[EventRecord]]; events are grouped by rounds
+        self._last_log = None
+        self._num_forgotten = 0  # Rounds dropped from the front of logs.
+        self._num_compacted = 0  # Rounds at the front of logs that are compacted.
+        self._rendered = {}  # {viewer: index of the first round the viewer hasn't rendered}
 
     def add_log(self, recap: str, acting_team) -> None:
         # Ignore events with no recap message.
@@ -54,8 +76,8 @@ class EventLogger:
         :return the most recent log index, excluding the empty [] added when preparing a new round.
         """
         if self.logs[-1]:
-            return len(self.logs)
-        return len(self.logs) - 1
+            return self._num_forgotten + len(self.logs)
+        return self._num_forgotten + len(self.logs) - 1
 
     @property
     def most_recent_log(self) -> EventLog:
@@ -64,10 +86,38 @@ class EventLogger:
                 return log_group[-1]
 
     def get_turn_logs(self, from_index: int) -> List[List[EventLog]]:
-        return self.logs[from_index:self.most_recent_index]
+        """
+        :return: The rounds from from_index. Rounds that were forgotten are left out.
+        """
+        start = max(0, from_index - self._num_forgotten)
+        return self.logs[start:self.most_recent_index - self._num_forgotten]
+
+    def mark_rendered(self, viewer, index: int) -> None:
+        """
+        Record that a viewer, eg. a player's CombatTeam, has rendered the rounds before index. Rounds are only
+        compacted once every viewer has rendered them.
+        """
+        self._rendered[viewer] = index
+
+    def remove_viewer(self, viewer) -> None:
+        self._rendered.pop(viewer, None)
 
     def prepare_new_round(self) -> None:
         self.logs.append([])
+        self._compact()
+
+    def _compact(self) -> None:
+        current_round = len(self.logs) - 1
+        rendered = min(self._rendered.values(), default=self._num_forgotten + current_round)
+        compact_until = max(rendered - self._num_forgotten, current_round - self.MAX_FULL_ROUNDS)
+        for i in range(self._num_compacted, min(compact_until, current_round)):
+            self.logs[i] = tuple([EventRecord(log.recap) for log in self.logs[i]])
+            self._num_compacted = i + 1
+        num_to_forget = len(self.logs) - self.MAX_ROUNDS
+        if num_to_forget > 0:
+            del self.logs[:num_to_forget]
+            self._num_forgotten += num_to_forget
+            self._num_compacted = max(0, self._num_compacted - num_to_forget)
 
     def add_ko(self, combat_elemental) -> None:
         self.add_log(f'{combat_elemental.nickname} was knocked out!', combat_elemental.team)
@@ -91,11 +141,30 @@ class EventLogger:
             self.add_log(new_recap, acting_team)
 
     def _make_log(self, recap, acting_team) -> EventLog:
-        # Fall back on empty list if there are no active elementals on a side.
-        side_a = []
-        for elemental in self.combat.side_a_active:
-            side_a.append(elemental.snapshot())
-        side_b = []
-        for elemental in self.combat.side_b_active:
-            side_b.append(elemental.snapshot())
-        return EventLog(side_a, side_b, recap, acting_team)
+        # Fall back on empty tuple if there are no active elementals on a side.
+        side_a = tuple(elemental.snapshot() for elemental in self.combat.side_a_active)
+        side_b = tuple(elemental.snapshot() for elemental in self.combat.side_b_active)
+        last = self._last_log
+        if last:
+            side_a = last.side_a if side_a == last.side_a else side_a
+            side_b = last.side_b if side_b == last.side_b else side_b
+        self._last_log = EventLog(side_a, side_b, recap, acting_team)
+        return self._last_log
+
+
+class NullEventLogger(EventLogger):
+    """
+    Logs nothing, for battles that nobody views, eg. a cloned Combat.
+    """
+
+    def add_log(self, recap: str, acting_team) -> None:
+        pass
+
+    def append_recent(self, recap: str) -> None:
+        pass
+
+    def continue_recent(self, recap: str, acting_team) -> None:
+        pass
+
+    def prepare_new_round(self) -> None:
+        pass
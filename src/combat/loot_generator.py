@@ -1,3 +1,4 @@
+import random
 from typing import List
 
 from src.items.loot import roll_loot
@@ -7,13 +8,16 @@ from src.team.combat_team import CombatTeam
 class LootGenerator:
     def __init__(self,
                  winning_side: List[CombatTeam],
-                 losing_side: List[CombatTeam]):
+                 losing_side: List[CombatTeam],
+                 rng=random):
         """
         :param winning_side: The teams to grant loot and money to.
         :param losing_side: The teams to generate loot and money from.
+        :param rng: The random.Random that drops are rolled with, eg. the Combat's.
         """
         self.winning_side = winning_side
         self.losing_side = losing_side
+        self.rng = rng
         self.gold_earned = 0  # TODO no need to store it here?
         self.items_dropped = []
 
@@ -34,7 +38,7 @@ class LootGenerator:
             if team.owner is not None:
                 continue
             for elemental in team.elementals:
-                items += roll_loot(elemental)
+                items += roll_loot(elemental, self.rng)
         return items
 
     def _calculate_gold_earned(self) -> int:
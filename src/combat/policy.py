@@ -0,0 +1,184 @@
+import struct
+import sys
+from array import array
+from typing import Dict, List, NamedTuple, Tuple
+
+from src.combat.combat_ai import CombatAI, Move
+
+
+class PolicyKey(NamedTuple):
+    """
+    The state of an NPC team that a PolicyTable ranks choices for.
+    """
+    species: str
+    abilities: Tuple[str, ...]  # The names of the active elemental's abilities, sorted.
+    opponent_element: int  # Elements value.
+    hp_bucket: int
+    mana_bucket: int
+    defend_charges: int
+
+
+class PolicyTable:
+    """
+    The best choices of an NPC in each state, ranked offline by playing the engine against itself
+    (see src.simulation.train_policy), so that PolicyAI can decide with a lookup instead of a search.
+    Saved as a compact binary file: a header, the names used by the table, the ability sets, then one row of unsigned
+    shorts per state.
+    """
+    MAGIC = b'MPOL'
+    VERSION = 1
+    HP_BUCKETS = 4
+    MANA_BUCKETS = 4
+    MAX_CHOICES = 3  # Kept per state.
+    SWITCH = 'switch'  # The choice to switch to the elemental CombatAI would pick.
+    _HEADER = struct.Struct('<4sBHII')  # Magic, version, number of names, length of the ability sets, number of rows.
+    _NO_CHOICE = 0xFFFF
+    _ROW_WIDTH = len(PolicyKey._fields) + MAX_CHOICES
+
+    def __init__(self, entries: Dict[PolicyKey, Tuple[str, ...]] = None):
+        """
+        :param entries: {PolicyKey: the names of the abilities or SWITCH to choose, best first}
+        """
+        self.entries = entries or {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def choices(self, key: PolicyKey) -> Tuple[str, ...]:
+        return self.entries.get(key, ())
+
+    @staticmethod
+    def key(combat_team, combat) -> PolicyKey:
+        """
+        :return: The state of a team with an active elemental that isn't knocked out.
+        """
+        elemental = combat_team.active_elemental
+        return PolicyKey(elemental.name,
+                         tuple(sorted(ability.name for ability in elemental.abilities)),
+                         combat.get_active_enemy(combat_team).element.value,
+                         PolicyTable.bucket(elemental.current_hp, elemental.max_hp, PolicyTable.HP_BUCKETS),
+                         PolicyTable.bucket(elemental.current_mana, elemental.max_mana, PolicyTable.MANA_BUCKETS),
+                         elemental.defend_charges)
+
+    @staticmethod
+    def bucket(amount: int, maximum: int, num_buckets: int) -> int:
+        if maximum <= 0:
+            return 0
+        return max(0, min(num_buckets - 1, amount * num_buckets // maximum))
+
+    def save(self, path: str) -> None:
+        names = {}  # {name: id}
+        ability_sets = {}  # {ability names: id}
+
+        def name_id(name: str) -> int:
+            return names.setdefault(name, len(names))
+
+        rows = array('H')
+        for key, choices in self.entries.items():
+            ability_ids = tuple(name_id(name) for name in key.abilities)
+            rows.extend([name_id(key.species),
+                         ability_sets.setdefault(ability_ids, len(ability_sets)),
+                         key.opponent_element,
+                         key.hp_bucket,
+                         key.mana_bucket,
+                         key.defend_charges])
+            choices = choices[:PolicyTable.MAX_CHOICES]
+            rows.extend([name_id(choice) for choice in choices])
+            rows.extend([PolicyTable._NO_CHOICE] * (PolicyTable.MAX_CHOICES - len(choices)))
+        sets = array('H')
+        for ability_ids in ability_sets:
+            sets.append(len(ability_ids))
+            sets.extend(ability_ids)
+        if sys.byteorder == 'big':
+            rows.byteswap()
+            sets.byteswap()
+        with open(path, 'wb') as file:
+            file.write(PolicyTable._HEADER.pack(PolicyTable.MAGIC, PolicyTable.VERSION,
+                                                len(names), len(sets), len(self.entries)))
+            for name in names:
+                encoded = name.encode('utf-8')
+                file.write(struct.pack('<B', len(encoded)) + encoded)
+            file.write(sets.tobytes())
+            file.write(rows.tobytes())
+
+    @staticmethod
+    def load(path: str) -> 'PolicyTable':
+        with open(path, 'rb') as file:
+            data = file.read()
+        magic, version, num_names, sets_length, num_rows = PolicyTable._HEADER.unpack_from(data)
+        if magic != PolicyTable.MAGIC or version != PolicyTable.VERSION:
+            raise ValueError(f"{path} isn't a version {PolicyTable.VERSION} policy table.")
+        offset = PolicyTable._HEADER.size
+        names = []
+        for i in range(num_names):
+            length = data[offset]
+            names.append(data[offset + 1:offset + 1 + length].decode('utf-8'))
+            offset += 1 + length
+        sets = array('H')
+        sets.frombytes(data[offset:offset + sets_length * sets.itemsize])
+        offset += sets_length * sets.itemsize
+        rows = array('H')
+        rows.frombytes(data[offset:offset + num_rows * PolicyTable._ROW_WIDTH * rows.itemsize])
+        if sys.byteorder == 'big':
+            sets.byteswap()
+            rows.byteswap()
+        ability_sets = []
+        i = 0
+        while i < len(sets):
+            ability_sets.append(tuple(names[name_id] for name_id in sets[i + 1:i + 1 + sets[i]]))
+            i += 1 + sets[i]
+        entries = {}
+        width = PolicyTable._ROW_WIDTH
+        for start in range(0, len(rows), width):
+            row = rows[start:start + width]
+            key = PolicyKey(names[row[0]], ability_sets[row[1]], row[2], row[3], row[4], row[5])
+            entries[key] = tuple(names[choice] for choice in row[len(PolicyKey._fields):]
+                                 if choice != PolicyTable._NO_CHOICE)
+        return PolicyTable(entries)
+
+
+class PolicyAI(CombatAI):
+    """
+    Makes the best choice of a PolicyTable that is available, or CombatAI's choice in states the table doesn't know.
+    Knocked out elementals are replaced the way CombatAI does.
+    """
+
+    def __init__(self,
+                 combat_team,
+                 combat,
+                 policy: PolicyTable):
+        super().__init__(combat_team, combat)
+        self.policy = policy
+
+    def decide_ability(self) -> Move:
+        for choice in self.policy.choices(PolicyTable.key(self.team, self.combat)):
+            if choice == PolicyTable.SWITCH:
+                if self.team.can_switch and self.team.eligible_bench:
+                    return self.decide_switch()
+                continue
+            ability = self._available_ability(choice)
+            if ability:
+                return Move(ability=ability)
+        return super().decide_ability()
+
+    def _available_ability(self, name: str):
+        """
+        :return: Ability or None
+        """
+        return next((ability for ability in self.team.active_elemental.available_abilities
+                     if ability.name == name), None)
+
+
+def rank_choices(totals: Dict[PolicyKey, Dict[str, List[float]]], min_samples=1) -> PolicyTable:
+    """
+    :param totals: {PolicyKey: {choice: [total score, number of samples]}}
+    :param min_samples: Choices with fewer samples are left out.
+    :return: A table of each state's choices with the best average scores.
+    """
+    entries = {}
+    for key, choices in totals.items():
+        sampled = [(total / count, choice) for choice, (total, count) in choices.items() if count >= min_samples]
+        if sampled:
+            ranked = sorted(sampled, key=lambda sample: -sample[0])
+            entries[key] = tuple(choice for score, choice in ranked[:PolicyTable.MAX_CHOICES])
+    return PolicyTable(entries)
@@ -0,0 +1,152 @@
+import random
+import time
+from typing import List
+
+from src.combat.combat_ai import CombatAI, Move
+from src.combat.difficulty import Difficulty
+from src.combat.policy import PolicyAI
+
+SEARCH_BUDGETS = {
+    # Seconds of search per decision. EASY doesn't search.
+    Difficulty.NORMAL: 0.02,
+    Difficulty.HARD: 0.1,
+}
+
+
+def make_ai(combat_team, combat) -> CombatAI:
+    """
+    :return: The AI for an NPC team, based on the team's difficulty, and its policy if it doesn't search.
+    """
+    budget = SEARCH_BUDGETS.get(combat_team.difficulty)
+    if budget:
+        return SearchAI(combat_team, combat, budget)
+    if combat_team.policy is not None:
+        return PolicyAI(combat_team, combat, combat_team.policy)
+    return CombatAI(combat_team, combat)
+
+
+class SearchAI(CombatAI):
+    """
+    Tries each possible move on copies of the battle, and picks the one whose copies end up best (flat Monte Carlo
+    search). A copy plays the move against random opponent moves, then a few more rounds of random moves, and is
+    scored by the health left on each side.
+    The moves are tried in turn until the time budget runs out. If that happens before every move was tried once,
+    CombatAI's choice is made instead.
+    Only copies of self.combat are played, so the search can run in another thread, as long as self.combat doesn't
+    change meanwhile, eg. because it's a clone itself.
+    The budget is wall-clock time, so the number of rollouts, and so the move chosen, depends on how fast the machine
+    is and how busy it is. Battles with searching NPCs don't replay the same from their seed, unless max_rollouts
+    is reached before the budget runs out.
+    """
+
+    ROLLOUT_ROUNDS = 3  # Rounds of random moves played after the round of the move that is tried.
+    MAX_ROLLOUTS = 400  # Per decision, whatever the budget.
+
+    def __init__(self,
+                 combat_team,
+                 combat,
+                 budget: float,
+                 max_rollouts=MAX_ROLLOUTS):
+        """
+        :param budget: The most time to spend searching per decision, in seconds.
+        """
+        super().__init__(combat_team, combat)
+        self.budget = budget
+        self.max_rollouts = max_rollouts
+        self.num_rollouts = 0  # In the last decision.
+        self.num_failed_rollouts = 0  # In the last decision. Rollouts that raised an error are left out.
+        self.fell_back = False  # If the last decision was CombatAI's, because the budget ran out.
+
+    def decide(self) -> Move or None:
+        if self.team.active_elemental.is_knocked_out:
+            moves = [self.switch_to(elemental) for elemental in self.team.eligible_bench]
+        elif self.combat.is_awaiting_knockout_replacements():
+            return None
+        else:
+            moves = [Move(ability=ability) for ability in self.team.active_elemental.available_abilities]
+            if self.team.can_switch:
+                moves += [self.switch_to(elemental) for elemental in self.team.eligible_bench]
+        if len(moves) <= 1:
+            return moves[0] if moves else None
+        move = self.search(moves)
+        self.fell_back = move is None
+        return move or super().decide()
+
+    def search(self, moves: List[Move]) -> Move or None:
+        """
+        :return: The move with the best average score, or None if the budget didn't allow trying every move.
+        """
+        start = time.perf_counter()
+        deadline = start + self.budget
+        # Rollouts draw from their own RNG, seeded once from the battle's.
+        rng = random.Random(self.combat.rng.getrandbits(32))
+        team_index = self.combat.teams.index(self.team)
+        totals = [0.0] * len(moves)
+        counts = [0] * len(moves)
+        self.num_rollouts = 0
+        self.num_failed_rollouts = 0
+        now = start
+        # A rollout isn't started unless one of average length would end before the deadline.
+        while self.num_rollouts < self.max_rollouts and now + (now - start) / max(1, self.num_rollouts) < deadline:
+            i = self.num_rollouts % len(moves)
+            self.num_rollouts += 1
+            try:
+                score = self.rollout(moves[i], team_index, rng.getrandbits(32), deadline)
+            except Exception as e:
+                # A hypothetical future shouldn't break the real battle, but a bug in the engine shouldn't go unseen.
+                if self.num_failed_rollouts == 0:
+                    print(f"Couldn't play out a move, leaving out the rollouts that fail: {e!r}")
+                self.num_failed_rollouts += 1
+                continue
+            finally:
+                now = time.perf_counter()
+            totals[i] += score
+            counts[i] += 1
+        if 0 in counts:
+            return None
+        best = max(range(len(moves)), key=lambda i: totals[i] / counts[i])
+        return moves[best]
+
+    def rollout(self, move: Move, team_index: int, seed: int, deadline: float) -> float:
+        """
+        Play a move on a copy of the battle, and score the copy.
+        :param deadline: time.perf_counter() after which the copy is scored as it is, with fewer rounds played.
+        """
+        combat = self.combat.clone()
+        combat.rng.seed(seed)
+        team = combat.teams[team_index]
+        CombatAI(team, combat).make_move(move)
+        for i in range(SearchAI.ROLLOUT_ROUNDS + 1):
+            if not combat.in_progress or time.perf_counter() > deadline:
+                break
+            SearchAI.play_round(combat)
+        return SearchAI.evaluate(combat, team)
+
+    @staticmethod
+    def play_round(combat) -> None:
+        """
+        Make random moves for the teams that haven't moved yet this round.
+        """
+        num_rounds = combat.num_rounds
+        for team in combat.teams:
+            if combat.num_rounds != num_rounds or not combat.in_progress:
+                return
+            if not any(request.team is team for request in combat.action_requests):
+                CombatAI(team, combat).pick_move()
+
+    @staticmethod
+    def evaluate(combat, team) -> float:
+        """
+        :return: How well the battle is going for a team: the share of its health left minus its enemies',
+        plus 1 if it has won or minus 1 if it has lost.
+        """
+        def health_left(teams) -> float:
+            elementals = [elemental for team in teams for elemental in team.elementals]
+            return sum(elemental.current_hp / elemental.max_hp for elemental in elementals) / max(1, len(elementals))
+
+        score = health_left([team]) - health_left(combat.get_enemy_side(team))
+        if team in combat.winning_side:
+            score += 1
+        elif team in combat.losing_side:
+            score -= 1
+        return score
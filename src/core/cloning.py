@@ -0,0 +1,30 @@
+"""
+Helpers for the clone() methods of battle objects, which copy a Combat and everything in it.
+The objects refer to each other in cycles (a team to its combat and back, an effect to its target and applier), so
+clones are kept in a dict keyed by the id of the original, the way copy.deepcopy keeps its memo: each object is
+cloned once, and references to it from the other objects are pointed at its clone.
+"""
+
+
+def get_clone(original, clones: dict):
+    """
+    :param original: An object with a clone(clones) method, or None.
+    :return: The clone of original, cloning it if that hasn't happened yet. None if original is None.
+    """
+    if original is None:
+        return None
+    clone = clones.get(id(original))
+    if clone is None:
+        clone = original.clone(clones)
+    return clone
+
+
+def shallow_clone(original, clones: dict):
+    """
+    Copy an object's attributes without copying their values, and register the copy in clones.
+    Register before cloning anything the original refers to, so that references back to the original find the copy.
+    """
+    clone = object.__new__(type(original))
+    clone.__dict__.update(original.__dict__)
+    clones[id(original)] = clone
+    return clone
@@ -1,2 +1,5 @@
 PLAYER_START_LEVEL = 3
 SHARDS_TO_SUMMON = 3
+STORAGE_BACKEND = 'dynamodb'  # Or 'sqlite' to keep data in a local file.
+SQLITE_PATH = 'monbot.db'
+POLICY_PATH = 'policy.bin'  # Made by src.simulation.train_policy. NPC opponents make random moves without it.
@@ -48,8 +48,13 @@ class Category(Enum):
 class Effectiveness:
     """
     Compares two elements, and checks if one is effective, normal, or not very effective against the other.
+    The rules are applied once, in MULTIPLIERS; use the static methods rather than making an Effectiveness.
     """
 
+    # The multiplier of an element (row) against another (column), by Elements.value. Generated from the rules
+    # below the class.
+    MULTIPLIERS = ()
+
     def __init__(self,
                  to_check: Elements,
                  against: Elements):
@@ -68,7 +73,7 @@ class Effectiveness:
         that are *effective* against a target element, if any.
         """
         return [comparator for comparator in comparators if
-                Effectiveness(comparator.element, against_element).is_effective()]
+                Effectiveness.effective(comparator.element, against_element)]
 
     @staticmethod
     def find_neutral(comparators: List,
@@ -78,7 +83,25 @@ class Effectiveness:
         that are at least *neutral* against a target element, if any.
         """
         return [comparator for comparator in comparators if not
-        Effectiveness(comparator.element, against_element).is_resistant()]
+                Effectiveness.resisted(comparator.element, against_element)]
+
+    @staticmethod
+    def multiplier(to_check: Elements,
+                   against: Elements) -> float:
+        """
+        :return: 1.5 if to_check is effective against the other element, 0.5 if it is resisted, otherwise 1.
+        """
+        return Effectiveness.MULTIPLIERS[to_check.value][against.value]
+
+    @staticmethod
+    def effective(to_check: Elements,
+                  against: Elements) -> bool:
+        return Effectiveness.MULTIPLIERS[to_check.value][against.value] > 1
+
+    @staticmethod
+    def resisted(to_check: Elements,
+                 against: Elements) -> bool:
+        return Effectiveness.MULTIPLIERS[to_check.value][against.value] < 1
 
     def calculate_multiplier(self) -> int:
         effectiveness_multiplier = 1  # 1 = normal, <1 = resisted, >1 = effective
@@ -140,3 +163,8 @@ class Effectiveness:
     @staticmethod
     def __is_chaos(against: Elements, to_check: Elements) -> bool:
         return against == Elements.CHAOS or to_check == Elements.CHAOS
+
+
+# Elements is declared in order of value, so rows and columns line up with Elements.value.
+Effectiveness.MULTIPLIERS = tuple(tuple(Effectiveness(a, b).calculate_multiplier() for b in Elements)
+                                  for a in Elements)
@@ -1,68 +1,240 @@
-from typing import List
-
-import boto3
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import List, Tuple
 
 from src.character.player import Player
+from src.data.dirty_tracker import DirtyTracker
+from src.data.dynamo_backend import DynamoBackend
+from src.data.guild_index import GuildIndex
+from src.data.negative_cache import NegativeCache
+from src.data.player_cache import PlayerCache
 from src.data.resources import ElementalResource, PlayerResource, ItemResource, InventoryResource
+from src.data.save_queue import SaveQueue, PendingSave
+from src.data.storage_backend import StorageBackend
 from src.elemental.elemental import Elemental
 from src.elemental.elemental_factory import ElementalInitializer
 from src.items.item_initializer import ItemInitializer
 
 
 class DataManager:
-    def __init__(self):
-        dynamodb = boto3.resource('dynamodb')
-        self.elemental_table = dynamodb.Table('Elementals')
-        self.player_table = dynamodb.Table('Players')
-        self.inventory_table = dynamodb.Table('Inventories')
-        self.players = {}
+    MAX_WORKERS = 8  # How many blocking storage requests may be in flight at once.
+    CLOSE_TIMEOUT_SECONDS = 30  # How long shutdown waits for queued saves.
+
+    def __init__(self,
+                 backend: StorageBackend = None,
+                 max_workers=MAX_WORKERS,
+                 save_window=SaveQueue.WINDOW_SECONDS,
+                 cache_size=PlayerCache.MAX_SIZE,
+                 cache_idle_seconds=PlayerCache.IDLE_SECONDS):
+        """
+        :param backend: Where data is stored. DynamoDB if not given.
+        :param max_workers: The size of the thread pool that runs storage requests for the async methods.
+        :param save_window: Seconds that queued saves of a player are collected before being written.
+        :param cache_size: How many players to keep loaded before evicting the least recently used.
+        :param cache_idle_seconds: How long a player stays loaded without being used.
+        """
+        self.backend = backend or DynamoBackend()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='data-manager')
+        self._in_flight = {}  # {user id: (load method, asyncio.Future)} Loads that are already running.
+        self.save_queue = SaveQueue(self._write_pending, self._executor, window=save_window)
+        self.players = PlayerCache(cache_size,
+                                   cache_idle_seconds,
+                                   save=self._save_before_eviction,
+                                   is_saving=self.save_queue.is_pending)
+        self.non_players = NegativeCache()  # Users known to have no profile.
+        self.guilds = GuildIndex()  # Battle-ready players of each Discord server, for finding opponents.
+
+    # Write-behind saves. These return immediately, and repeated saves of a player are written once per window.
+    # Prefer these over the update methods, which write right away.
+
+    def queue_save(self, player: Player) -> None:
+        """
+        Queue everything a battle can change: the player, their inventory and their team.
+        """
+        self.save_queue.add(player, save_player=True, save_inventory=True, save_team=True)
+        self.guilds.update(player)
+
+    def queue_player(self, player: Player) -> None:
+        self.save_queue.add(player, save_player=True)
+        self.guilds.update(player)
+
+    def queue_inventory(self, player: Player) -> None:
+        self.save_queue.add(player, save_inventory=True)
+
+    def queue_elemental(self, elemental: Elemental) -> None:
+        self.save_queue.add(elemental.owner, elementals=[elemental])
+        self.guilds.update(elemental.owner)
+
+    # Async versions of the public methods, for use from the Discord event loop.
+    # boto3 is blocking, so requests run on a bounded thread pool instead of stalling every other handler.
+
+    async def aget_player(self, user) -> Player or None:
+        return self.players.get(user.id) or await self._load(self._fetch_player, user)
+
+    async def aget_created_player(self, user) -> Player:
+        return self.players.get(user.id) or await self._load(self._fetch_created_player, user)
+
+    async def asave_all(self, player: Player) -> None:
+        await self._run(self.save_all, player)
+
+    async def aupdate_player(self, player: Player) -> None:
+        await self._run(self.update_player, player)
+
+    async def aupdate_inventory(self, player: Player) -> None:
+        await self._run(self.update_inventory, player)
+
+    async def aupdate_team(self, player: Player) -> None:
+        await self._run(self.update_team, player)
+
+    async def aupdate_elemental(self, elemental: Elemental) -> None:
+        await self._run(self.update_elemental, elemental)
+
+    def close(self) -> None:
+        """
+        Write all queued saves and wait for outstanding requests. Call this on shutdown so that no saves are lost.
+        """
+        if not self.save_queue.flush(timeout=DataManager.CLOSE_TIMEOUT_SECONDS):
+            print(f"Shut down with {self.save_queue.num_pending} unsaved players.")
+        self._executor.shutdown(wait=True)
+        self.backend.close()
+
+    async def _run(self, function, *args) -> any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(function, *args))
+
+    async def _load(self, function, user) -> Player or None:
+        player = await self._run_once(function, user)
+        self.players.evict_expired()  # Loads don't evict on worker threads, so evict on the event loop.
+        return player
+
+    async def _run_once(self, function, user) -> any:
+        """
+        Share a single request between handlers that load the same user at the same time,
+        eg. when a user adds several reactions in quick succession.
+        Only one load of a user runs at a time. A different load of the user waits for it and then checks the cache,
+        so that eg. getting and creating a player at the same time can't build two Players.
+        """
+        while user.id in self._in_flight:
+            running, future = self._in_flight[user.id]
+            if running == function:
+                return await asyncio.shield(future)
+            await asyncio.wait([future])
+            player = self.players.get(user.id)
+            if player is not None:
+                return player
+        future = asyncio.ensure_future(self._run(function, user))
+        self._in_flight[user.id] = (function, future)
+        future.add_done_callback(lambda done: self._in_flight.pop(user.id, None))
+        return await asyncio.shield(future)
 
     def get_player(self, user) -> Player or None:
-        if user.id in self.players:
-            return self.players[user.id]
-        return self._fetch_player(user)
+        return self.players.get(user.id) or self._load_now(self._fetch_player, user)
 
     def get_created_player(self, user) -> Player:
         """
         Create a Player profile for a Discord user if it doesn't exist, and then return it.
         """
-        if user.id in self.players:
-            return self.players[user.id]
-        fetched = self._fetch_player(user)
-        if fetched:
-            return fetched
-        return self._create_profile(user)
+        return self.players.get(user.id) or self._load_now(self._fetch_created_player, user)
+
+    def _load_now(self, function, user) -> Player or None:
+        player = function(user)
+        self.players.evict_expired()  # Loads don't evict, since they also run on worker threads.
+        return player
 
     def save_all(self, player: Player) -> None:
         self.update_player(player)
         self.update_inventory(player)
         self.update_team(player)
 
+    # The update methods only write what changed since the last save or load. Clean entities are skipped.
+
     def update_player(self, player: Player) -> None:
-        self.player_table.put_item(Item=player.to_server())
+        self._write_changes(StorageBackend.PLAYERS, player.server_state, player.to_server())
 
     def update_inventory(self, player: Player) -> None:
-        self.inventory_table.put_item(Item=player.inventory_to_server())
+        self._write_changes(StorageBackend.INVENTORIES, player.inventory.server_state, player.inventory_to_server())
 
     def update_team(self, player: Player) -> None:
-        with self.elemental_table.batch_writer() as batch:
-            for elemental in player.team.elementals:
-                batch.put_item(Item=elemental.to_server())
+        self._write_elementals(player.team.elementals)
 
     def update_elemental(self, elemental: Elemental) -> None:
-        self.elemental_table.put_item(Item=elemental.to_server())
+        self._write_changes(StorageBackend.ELEMENTALS, elemental.server_state, elemental.to_server())
+
+    def _save_before_eviction(self, player: Player) -> None:
+        """
+        Start writing everything a player changed without waiting, so that they can be evicted once it's written.
+        """
+        dirty = [elemental for elemental in player.elementals if elemental.is_dirty]
+        self.save_queue.add(player, save_player=True, save_inventory=True, elementals=dirty)
+        self.save_queue.flush(player, timeout=0)
+
+    def _write_pending(self, pending: PendingSave) -> None:
+        if pending.save_player:
+            self._write_changes(StorageBackend.PLAYERS, pending.player.server_state, pending.player_item)
+        if pending.save_inventory:
+            self._write_changes(StorageBackend.INVENTORIES,
+                                pending.player.inventory.server_state,
+                                pending.inventory_item)
+        self._write_elemental_items(pending.elemental_items)
+
+    def _write_elementals(self, elementals: List[Elemental]) -> None:
+        self._write_elemental_items([(elemental, elemental.to_server()) for elemental in elementals])
+
+    def _write_elemental_items(self, items: List[Tuple[Elemental, dict]]) -> None:
+        """
+        Write the elementals that changed. A lone change is sent as an update with just the changed attributes.
+        Several are sent as whole items through one batch put, since DynamoDB's BatchWriteItem doesn't support
+        updates, but that saves a round trip per elemental.
+        :param items: Elementals with their server structures.
+        """
+        dirty = [(elemental, item) for elemental, item in items if elemental.server_state.is_dirty(item)]
+        if len(dirty) == 1:
+            elemental, item = dirty[0]
+            self._write_changes(StorageBackend.ELEMENTALS, elemental.server_state, item)
+        elif dirty:
+            self.backend.batch_put(StorageBackend.ELEMENTALS, [item for elemental, item in dirty])
+            for elemental, item in dirty:
+                elemental.server_state.mark_saved(item)
+
+    def _write_changes(self, table: str, server_state: DirtyTracker, item: dict) -> None:
+        """
+        Write the attributes of item that changed: the whole item if it is new, otherwise an update.
+        :param table: The StorageBackend table that item belongs to.
+        :param server_state: The DirtyTracker of the entity that item came from.
+        :param item: The entity's current server structure.
+        """
+        changes = server_state.changes(item)
+        if not changes:
+            return
+        if server_state.is_new:
+            self.backend.put(table, item)
+        else:
+            changes.pop('id', None)
+            self.backend.update(table, item['id'], changes)
+        server_state.mark_saved(item)
+
+    def _fetch_created_player(self, user) -> Player:
+        return self._fetch_player(user) or self._create_profile(user)
 
     def _fetch_player(self, user) -> Player or None:
-        response = self.player_table.get_item(Key={'id': user.id})
+        if user.id in self.non_players:
+            return None
+        item = self.backend.get(StorageBackend.PLAYERS, user.id)
+        if item is None:
+            self.non_players.add(user.id)
+            return None
         try:
-            resource = PlayerResource(**response['Item'])
-            self.players[user.id] = Player.from_resource(resource)
+            resource = PlayerResource(**item)
+            player = Player.from_resource(resource)
             elementals = self._fetch_elementals(resource.elementals)
-            self.players[user.id].set_elementals(elementals)
+            player.set_elementals(elementals)
             team = self._get_team(resource.team, elementals)
-            self.players[user.id].set_team(team)
-            self._fetch_items(self.players[user.id])
-            return self.players[user.id]
+            player.set_team(team)
+            self._fetch_items(player)
+            player.mark_saved()  # Nothing needs to be written until something changes.
+            # Only cache the player once they're fully loaded. Another load may have cached them in the meantime.
+            return self.players.put_if_absent(player)
         except KeyError:
             return None
 
@@ -70,9 +242,11 @@ class DataManager:
         """
         Retrieves the player's items and adds them to the inventory.
         """
-        response = self.inventory_table.get_item(Key={'id': player.id})
+        item = self.backend.get(StorageBackend.INVENTORIES, player.id)
+        if item is None:
+            return
         try:
-            inventory_resource = InventoryResource(**response['Item'])
+            inventory_resource = InventoryResource(**item)
             item_resources = [ItemResource(**item) for item in inventory_resource.items]
             for resource in item_resources:
                 item = ItemInitializer.from_name(resource.name)
@@ -85,23 +259,25 @@ class DataManager:
         return [elemental for elemental in elementals if elemental.id in ids]
 
     def _fetch_elementals(self, ids: List[str]) -> List[Elemental]:
+        """
+        Load a roster of Elementals in as few requests as possible.
+        :return: The Elementals that exist on the server, in the same order as ids.
+        """
+        unique_ids = list(dict.fromkeys(ids))  # DynamoDB's BatchGetItem rejects duplicate keys.
+        items = {item['id']: item for item in self.backend.batch_get(StorageBackend.ELEMENTALS, unique_ids)}
         elementals = []
-        for id in ids:
-            response = self.elemental_table.get_item(Key={'id': id})
-            try:
-                resource = response['Item']
+        for id in unique_ids:
+            if id in items:
                 elemental = ElementalInitializer.from_server(
-                    ElementalResource(**resource)
+                    ElementalResource(**items[id])
                 )
                 elementals.append(elemental)
-            except KeyError:
-                pass
         return elementals
 
     def _create_profile(self, user) -> Player:
         new_player = Player.from_user(user)
         new_player.add_starter_items()
-        self.players[user.id] = new_player
         self.update_player(new_player)
         self.update_inventory(new_player)
-        return new_player
+        self.non_players.discard(user.id)
+        return self.players.put_if_absent(new_player)
@@ -0,0 +1,37 @@
+import copy
+
+
+class DirtyTracker:
+    """
+    Remembers what an entity looked like on the server the last time it was saved or loaded,
+    so that saves can skip it when nothing changed and send only the attributes that did.
+    """
+
+    def __init__(self):
+        self._saved = None  # The server structure as of the last save or load. None if it was never saved.
+
+    @property
+    def is_new(self) -> bool:
+        """
+        :return: True if the entity doesn't exist on the server yet.
+        """
+        return self._saved is None
+
+    def is_dirty(self, item: dict) -> bool:
+        return self._saved != item
+
+    def changes(self, item: dict) -> dict:
+        """
+        :param item: The entity's current server structure, eg. from to_server().
+        :return: The attributes of item that differ from the saved version. Everything if it was never saved.
+        """
+        if self._saved is None:
+            return dict(item)
+        return {key: value for key, value in item.items() if self._saved.get(key) != value}
+
+    def mark_saved(self, item: dict) -> None:
+        """
+        :param item: The server structure that was written. Pass the same dict that was saved rather than
+        a fresh to_server(), so that changes made while the write was in flight stay dirty.
+        """
+        self._saved = copy.deepcopy(item)
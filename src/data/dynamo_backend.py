@@ -0,0 +1,88 @@
+import random
+import threading
+import time
+from typing import List
+
+from src.data.dynamo_client import thread_dynamodb
+from src.data.storage_backend import StorageBackend
+
+
+class DynamoBackend(StorageBackend):
+    """
+    Keeps data in the DynamoDB tables Players, Elementals and Inventories.
+    """
+    BATCH_GET_LIMIT = 100  # The most keys DynamoDB accepts in a single BatchGetItem request.
+    MAX_BATCH_RETRIES = 5
+    BATCH_BACKOFF_SECONDS = 0.05  # Base delay before retrying unprocessed keys; doubles every attempt.
+
+    def __init__(self, dynamodb=None):
+        """
+        :param dynamodb: A DynamoDB service resource to use from every thread, eg. a fake for tests. If not given,
+        each thread uses its own boto3 resource, since those aren't thread-safe.
+        """
+        self._dynamodb = dynamodb
+        self._local = threading.local()  # The calling thread's Table resources.
+
+    @property
+    def dynamodb(self):
+        return self._dynamodb or thread_dynamodb()
+
+    @property
+    def _tables(self) -> dict:
+        """
+        :return: {table name: Table resource} of the calling thread.
+        """
+        tables = getattr(self._local, 'tables', None)
+        if tables is None:
+            tables = {name: self.dynamodb.Table(name) for name in StorageBackend.TABLES}
+            self._local.tables = tables
+        return tables
+
+    def get(self, table: str, id: str) -> dict or None:
+        response = self._tables[table].get_item(Key={'id': id})
+        return response.get('Item')
+
+    def batch_get(self, table: str, ids: List[str]) -> List[dict]:
+        items = []
+        for i in range(0, len(ids), DynamoBackend.BATCH_GET_LIMIT):
+            items += self._batch_get(self._tables[table].name, ids[i:i + DynamoBackend.BATCH_GET_LIMIT])
+        return items
+
+    def put(self, table: str, item: dict) -> None:
+        self._tables[table].put_item(Item=item)
+
+    def batch_put(self, table: str, items: List[dict]) -> None:
+        with self._tables[table].batch_writer() as batch:
+            for item in items:
+                batch.put_item(Item=item)
+
+    def update(self, table: str, id: str, changes: dict) -> None:
+        # Attribute names go through placeholders since some of them, eg. name and level, are reserved words.
+        self._tables[table].update_item(
+            Key={'id': id},
+            UpdateExpression='SET ' + ', '.join(f'#{key} = :{key}' for key in changes),
+            ExpressionAttributeNames={f'#{key}': key for key in changes},
+            ExpressionAttributeValues={f':{key}': value for key, value in changes.items()}
+        )
+
+    def _batch_get(self, table_name: str, ids: List[str]) -> List[dict]:
+        """
+        Request up to BATCH_GET_LIMIT items by id, retrying any keys the server couldn't process with
+        exponential backoff, eg. because the table's read capacity was exceeded.
+        :return: The items found, in no particular order.
+        """
+        request = {table_name: {'Keys': [{'id': id} for id in ids]}}
+        items = []
+        attempt = 0
+        while request:
+            response = self.dynamodb.batch_get_item(RequestItems=request)
+            items += response['Responses'].get(table_name, [])
+            request = response.get('UnprocessedKeys')
+            if not request:
+                break
+            if attempt == DynamoBackend.MAX_BATCH_RETRIES:
+                raise RuntimeError(f"Couldn't load {len(request[table_name]['Keys'])} items from {table_name}.")
+            delay = DynamoBackend.BATCH_BACKOFF_SECONDS * 2 ** attempt
+            time.sleep(random.uniform(delay / 2, delay))  # Jitter so retries from many players don't align.
+            attempt += 1
+        return items
@@ -0,0 +1,32 @@
+"""
+DynamoDB connections. boto3 resources and sessions aren't thread-safe, so each thread that talks to DynamoDB builds
+its own session and resource, once, and reuses it for every request it makes.
+
+Every blocking request runs on the DataManager's thread pool, including the save queue's writes, plus the occasional
+synchronous call on the event loop. A thread makes one request at a time, so each resource's pool needs a single
+connection: the process holds at most DataManager.MAX_WORKERS + 1 connections, which is what a shared pool would need
+for the same concurrency. Building a session and resource is slow, but each thread pays for it once, on its first
+request.
+"""
+import threading
+
+import boto3
+from botocore.config import Config
+
+POOL_CONNECTIONS_PER_THREAD = 1  # A thread makes one request at a time.
+MAX_ATTEMPTS = 5  # botocore's own retries of throttled and failed requests.
+
+_local = threading.local()  # Each thread's DynamoDB resource.
+
+
+def thread_dynamodb():
+    """
+    :return: The calling thread's boto3 DynamoDB service resource.
+    """
+    dynamodb = getattr(_local, 'dynamodb', None)
+    if dynamodb is None:
+        config = Config(max_pool_connections=POOL_CONNECTIONS_PER_THREAD,
+                        retries={'max_attempts': MAX_ATTEMPTS, 'mode': 'adaptive'})
+        dynamodb = boto3.session.Session().resource('dynamodb', config=config)
+        _local.dynamodb = dynamodb
+    return dynamodb
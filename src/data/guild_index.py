@@ -0,0 +1,72 @@
+import threading
+from bisect import insort, bisect_left
+from collections import defaultdict
+from typing import List
+
+from src.character.player import Player
+
+
+class GuildIndex:
+    """
+    The registered players of each Discord server (guild) who are ready to battle, ordered by their team's average
+    level, so that listing opponents doesn't mean loading every member of the server.
+    Players join a guild's index when they're seen using the bot there. Their position must be refreshed with update()
+    whenever their team or combat status changes.
+    """
+
+    def __init__(self):
+        self._rankings = defaultdict(list)  # {guild id: [(average level, player id)]}, sorted.
+        self._levels = defaultdict(dict)  # {guild id: {player id: average level}} The players ranked in each guild.
+        self._guilds = defaultdict(set)  # {player id: {guild id}} Every guild a player was seen in.
+        self._lock = threading.Lock()
+
+    def add(self, guild_id: str, player: Player) -> None:
+        """
+        Record that a player belongs to a guild.
+        """
+        with self._lock:
+            if guild_id in self._guilds[player.id]:
+                return
+            self._guilds[player.id].add(guild_id)
+            self._rank(guild_id, player)
+
+    def update(self, player: Player) -> None:
+        """
+        Reposition a player in every guild they belong to, or take them out of the rankings while they can't battle.
+        """
+        with self._lock:
+            for guild_id in self._guilds.get(player.id, ()):
+                self._unrank(guild_id, player.id)
+                self._rank(guild_id, player)
+
+    def remove(self, guild_id: str, player_id: str) -> None:
+        """
+        Forget that a player belongs to a guild, eg. because they left it.
+        """
+        with self._lock:
+            self._unrank(guild_id, player_id)
+            self._guilds[player_id].discard(guild_id)
+
+    def top(self, guild_id: str, k: int, offset=0) -> List[str]:
+        """
+        :return: The ids of k battle-ready players of a guild, from the lowest average level, skipping offset players.
+        """
+        with self._lock:
+            return [player_id for level, player_id in self._rankings[guild_id][offset:offset + k]]
+
+    def num_ranked(self, guild_id: str) -> int:
+        return len(self._levels[guild_id])
+
+    def _rank(self, guild_id: str, player: Player) -> None:
+        if not player.has_elemental or not player.can_battle:
+            return
+        level = player.team.average_elemental_level
+        insort(self._rankings[guild_id], (level, player.id))
+        self._levels[guild_id][player.id] = level
+
+    def _unrank(self, guild_id: str, player_id: str) -> None:
+        level = self._levels[guild_id].pop(player_id, None)
+        if level is None:
+            return
+        ranking = self._rankings[guild_id]
+        del ranking[bisect_left(ranking, (level, player_id))]
@@ -0,0 +1,64 @@
+import copy
+import threading
+import time
+from collections import Counter
+from typing import List
+
+from src.data.storage_backend import StorageBackend
+
+
+class MemoryBackend(StorageBackend):
+    """
+    Keeps data in memory, for tests, simulations and benchmarks. Every request can be made to block for a while
+    and can be throttled, to imitate a remote database, and requests are counted.
+    """
+
+    def __init__(self, latency: float = 0, requests_per_second: float = None):
+        """
+        :param latency: Seconds that every request blocks for.
+        :param requests_per_second: The most requests served per second, across all threads. Requests beyond that
+        wait their turn, like a table with too little provisioned capacity. Unlimited if None.
+        """
+        self.latency = latency
+        self.requests_per_second = requests_per_second
+        self.tables = {table: {} for table in StorageBackend.TABLES}  # {table: {id: item}}
+        self.calls = Counter()  # {method name: number of requests}
+        self._lock = threading.Lock()
+        self._next_slot = 0  # time.monotonic() at which the next throttled request may start.
+
+    @property
+    def num_calls(self) -> int:
+        return sum(self.calls.values())
+
+    def get(self, table: str, id: str) -> dict or None:
+        self._request('get')
+        item = self.tables[table].get(id)
+        return copy.deepcopy(item) if item else None
+
+    def batch_get(self, table: str, ids: List[str]) -> List[dict]:
+        self._request('batch_get')
+        return [copy.deepcopy(self.tables[table][id]) for id in ids if id in self.tables[table]]
+
+    def put(self, table: str, item: dict) -> None:
+        self._request('put')
+        self.tables[table][item['id']] = copy.deepcopy(item)
+
+    def batch_put(self, table: str, items: List[dict]) -> None:
+        self._request('batch_put')
+        for item in items:
+            self.tables[table][item['id']] = copy.deepcopy(item)
+
+    def update(self, table: str, id: str, changes: dict) -> None:
+        self._request('update')
+        self.tables[table].setdefault(id, {'id': id}).update(copy.deepcopy(changes))
+
+    def _request(self, name: str) -> None:
+        with self._lock:
+            self.calls[name] += 1
+            wait = 0
+            if self.requests_per_second:
+                now = time.monotonic()
+                start = max(now, self._next_slot)
+                self._next_slot = start + 1 / self.requests_per_second
+                wait = start - now
+        time.sleep(wait + self.latency)
@@ -0,0 +1,48 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class NegativeCache:
+    """
+    The ids of Discord users that were recently found to have no profile, so that looking them up again,
+    eg. on every message they send, doesn't go to the server.
+    Entries expire after ttl seconds in case a profile is created elsewhere, eg. by another instance of the bot.
+    """
+    TTL_SECONDS = 10 * 60
+    MAX_SIZE = 100000  # Beyond this, the oldest entries are dropped.
+
+    def __init__(self, ttl=TTL_SECONDS, max_size=MAX_SIZE):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._expiries = OrderedDict()  # {user id: time.monotonic() at which the entry expires}, oldest first.
+        self._lock = threading.Lock()
+        self.num_hits = 0  # Lookups that were answered without going to the server.
+
+    def __len__(self) -> int:
+        return len(self._expiries)
+
+    def __contains__(self, id: str) -> bool:
+        with self._lock:
+            expiry = self._expiries.get(id)
+            if expiry is None:
+                return False
+            if expiry <= time.monotonic():
+                del self._expiries[id]
+                return False
+            self.num_hits += 1
+            return True
+
+    def add(self, id: str) -> None:
+        with self._lock:
+            self._expiries.pop(id, None)
+            self._expiries[id] = time.monotonic() + self.ttl
+            while len(self._expiries) > self.max_size:
+                self._expiries.popitem(last=False)
+
+    def discard(self, id: str) -> None:
+        """
+        Forget that a user has no profile, eg. because they just made one.
+        """
+        with self._lock:
+            self._expiries.pop(id, None)
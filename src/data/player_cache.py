@@ -0,0 +1,133 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
+
+from src.character.player import Player
+
+
+class PlayerCache:
+    """
+    The players that are loaded in memory, keyed by id. Least recently used players are evicted when there are more
+    than max_size, and any player that hasn't been used for idle_seconds is evicted as well.
+
+    A player is never evicted while they're in use: in combat, holding challenges, with a form awaiting typed input,
+    or with changes that aren't on the server yet. Those are skipped, so the cache can briefly hold more than max_size.
+
+    Eviction reads and saves players, so it must run on the event loop that owns them: from get(), put() and
+    evict_expired(). Loads on worker threads cache players with put_if_absent(), which doesn't evict.
+    """
+    MAX_SIZE = 1000
+    IDLE_SECONDS = 30 * 60
+
+    def __init__(self,
+                 max_size=MAX_SIZE,
+                 idle_seconds=IDLE_SECONDS,
+                 save: Callable[[Player], None] = None,
+                 is_saving: Callable[[Player], bool] = None):
+        """
+        :param save: Called with a player that would be evicted but has unsaved changes. It should start writing
+        them without waiting; the player stays cached until a later eviction finds them clean.
+        :param is_saving: Returns True if a player has a save that hasn't been written yet.
+        """
+        self.max_size = max_size
+        self.idle_seconds = idle_seconds
+        self._save = save or (lambda player: None)
+        self._is_saving = is_saving or (lambda player: False)
+        self._players = OrderedDict()  # {player id: Player}, least recently used first.
+        self._last_used = {}  # {player id: time.monotonic()}
+        self._lock = threading.RLock()  # Players are loaded on worker threads as well as the event loop.
+        self.num_hits = 0
+        self.num_misses = 0
+        self.num_evictions = 0
+
+    @property
+    def size(self) -> int:
+        return len(self._players)
+
+    def __len__(self) -> int:
+        return len(self._players)
+
+    def __contains__(self, id: str) -> bool:
+        return id in self._players
+
+    def get(self, id: str) -> Player or None:
+        """
+        :return: The cached Player, or None if they aren't loaded. Counts as a use of the player.
+        """
+        with self._lock:
+            player = self._players.get(id)
+            if player is None:
+                self.num_misses += 1
+            else:
+                self.num_hits += 1
+                self._touch(id)
+            self._evict()
+            return player
+
+    def put(self, player: Player) -> None:
+        with self._lock:
+            self._players[player.id] = player
+            self._touch(player.id)
+            self._evict()
+
+    def put_if_absent(self, player: Player) -> Player:
+        """
+        Cache a player unless a Player with the same id was cached first, eg. by a load that ran at the same time.
+        Safe to call from worker threads, since it doesn't evict.
+        :return: The cached Player, which should be used instead of the given one.
+        """
+        with self._lock:
+            if player.id not in self._players:
+                self._players[player.id] = player
+            self._touch(player.id)
+            return self._players[player.id]
+
+    def remove(self, id: str) -> None:
+        with self._lock:
+            self._players.pop(id, None)
+            self._last_used.pop(id, None)
+
+    def evict_expired(self) -> None:
+        """
+        Evict players that are idle or over capacity. This also happens on every get and put.
+        """
+        with self._lock:
+            self._evict()
+
+    def _touch(self, id: str) -> None:
+        self._players.move_to_end(id)
+        self._last_used[id] = time.monotonic()
+
+    def _evict(self) -> None:
+        """
+        Check players from the least recently used, stopping at the first one that is within capacity and not idle.
+        Players that can't be evicted yet go to the back, so they aren't checked again on every call, but keep the time
+        they were last used: they're evicted as soon as they're no longer in use if they're still idle by then.
+        """
+        now = time.monotonic()
+        num_checked = 0
+        while self._players and num_checked < len(self._players):
+            id, player = next(iter(self._players.items()))
+            is_over_capacity = len(self._players) > self.max_size
+            is_idle = now - self._last_used[id] >= self.idle_seconds
+            if not is_over_capacity and not is_idle:
+                return
+            num_checked += 1
+            if self._can_evict(player):
+                del self._players[id]
+                del self._last_used[id]
+                self.num_evictions += 1
+            else:
+                self._players.move_to_end(id)
+
+    def _can_evict(self, player: Player) -> bool:
+        view = player.primary_view
+        if player.is_busy or player.has_challenges or (view is not None and view.is_awaiting_input):
+            return False
+        if self._is_saving(player):
+            return False
+        if player.has_unsaved_changes:
+            self._save(player)
+            return False
+        return True
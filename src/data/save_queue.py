@@ -0,0 +1,231 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor
+from typing import List, Callable, Tuple
+
+
+class PendingSave:
+    """
+    Everything about one player that is waiting to be written to the server.
+    Server structures are snapshotted when a save is queued, on the event loop, so that writes never read entities
+    that handlers may be changing. Queueing the same parts again replaces their snapshots with newer ones.
+    """
+
+    def __init__(self, player, due: float):
+        """
+        :param player: Player
+        :param due: time.monotonic() at which this save should be written.
+        """
+        self.player = player
+        self.due = due
+        self.player_item = None  # Player.to_server() if the player should be written.
+        self.inventory_item = None  # Player.inventory_to_server() if the inventory should be written.
+        self._elementals = OrderedDict()  # {elemental id: (Elemental, Elemental.to_server())}
+        self.num_attempts = 0  # Failed writes so far.
+
+    @property
+    def save_player(self) -> bool:
+        return self.player_item is not None
+
+    @property
+    def save_inventory(self) -> bool:
+        return self.inventory_item is not None
+
+    @property
+    def elementals(self) -> List:
+        """
+        :return: List[Elemental]: Every Elemental to write, including the team if it was requested.
+        """
+        return [elemental for elemental, item in self._elementals.values()]
+
+    @property
+    def elemental_items(self) -> List[Tuple]:
+        """
+        :return: List[Tuple[Elemental, dict]]: Every Elemental to write, with its snapshot.
+        """
+        return list(self._elementals.values())
+
+    def merge(self,
+              save_player=False,
+              save_inventory=False,
+              save_team=False,
+              elementals=()) -> None:
+        """
+        Snapshot the requested parts of the player. Must be called from the event loop.
+        """
+        if save_player:
+            self.player_item = self.player.to_server()
+        if save_inventory:
+            self.inventory_item = self.player.inventory_to_server()
+        if save_team:
+            elementals = list(elementals) + self.player.team.elementals
+        for elemental in elementals:
+            self._elementals[elemental.id] = (elemental, elemental.to_server())
+
+    def merge_from(self, newer: 'PendingSave') -> None:
+        """
+        Add the snapshots of a save that was queued after this one, which replace any of the same parts.
+        """
+        self.player_item = newer.player_item or self.player_item
+        self.inventory_item = newer.inventory_item or self.inventory_item
+        self._elementals.update(newer._elementals)
+
+
+class SaveQueue:
+    """
+    Write-behind persistence. Saves are collected per player, and a background thread writes them once their
+    window has passed. Repeated saves of the same player inside a window collapse into one write.
+    """
+    WINDOW_SECONDS = 15  # The longest a save waits before it is written.
+    MAX_CONCURRENT_WRITES = 4
+    RETRY_SECONDS = 5  # How long to wait before retrying a failed write.
+    MAX_ATTEMPTS = 5  # Failed writes of a save before it is given up on.
+
+    def __init__(self,
+                 write: Callable[[PendingSave], None],
+                 executor: Executor,
+                 window=WINDOW_SECONDS,
+                 max_concurrent_writes=MAX_CONCURRENT_WRITES):
+        """
+        :param write: Writes a PendingSave to the server. Runs on the executor.
+        :param executor: Where writes are run.
+        :param window: Seconds to collect saves of a player before writing them.
+        :param max_concurrent_writes: How many writes may be running on the executor at once.
+        """
+        self._write = write
+        self._executor = executor
+        self.window = window
+        self._pending = OrderedDict()  # {player id: PendingSave}, in the order they were first queued.
+        self._writing = set()  # The ids of players with a write in progress.
+        self._slots = threading.Semaphore(max_concurrent_writes)
+        self._condition = threading.Condition()
+        self._flusher = None  # The background thread. It stops while the queue is empty.
+        self.num_requested = 0  # Saves added to the queue.
+        self.num_written = 0  # Writes actually sent to the server.
+        self.num_failed = 0  # Writes that failed, including ones that were retried.
+        self.num_abandoned = 0  # Saves given up on after MAX_ATTEMPTS.
+
+    @property
+    def num_pending(self) -> int:
+        return len(self._pending)
+
+    def add(self,
+            player,
+            save_player=False,
+            save_inventory=False,
+            save_team=False,
+            elementals=()) -> None:
+        """
+        Queue parts of a player to be saved. Merges with any save of the player that is already waiting.
+        Must be called from the event loop, since it snapshots the parts to save.
+        :param player: Player
+        :param elementals: List[Elemental] to save, besides the team.
+        """
+        with self._condition:
+            self.num_requested += 1
+            pending = self._pending.get(player.id)
+            if pending is None:
+                pending = PendingSave(player, time.monotonic() + self.window)
+                self._pending[player.id] = pending
+            pending.merge(save_player, save_inventory, save_team, elementals)
+            self._start_flusher()
+            self._condition.notify_all()
+
+    def is_pending(self, player) -> bool:
+        """
+        :return: True if the player has a save that hasn't been written yet.
+        """
+        with self._condition:
+            return player.id in self._pending or player.id in self._writing
+
+    def flush(self, player=None, timeout: float = None) -> bool:
+        """
+        Write pending saves now and wait for them to finish.
+        :param player: Only flush this Player's saves. Flushes everyone if None.
+        :param timeout: The most seconds to wait, or None to wait until done.
+        :return: True if everything requested was written; False if it timed out, or a save was given up on.
+        """
+        num_abandoned = self.num_abandoned
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        with self._condition:
+            ids = [player.id] if player else list(self._pending.keys()) + list(self._writing)
+            for id in ids:
+                if id in self._pending:
+                    self._pending[id].due = 0
+            self._start_flusher()
+            self._condition.notify_all()
+            while any(id in self._pending or id in self._writing for id in ids):
+                remaining = deadline - time.monotonic() if deadline is not None else None
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            return self.num_abandoned == num_abandoned
+
+    def _start_flusher(self) -> None:
+        # Must be called while holding the condition.
+        if self._flusher is None and self._pending:
+            self._flusher = threading.Thread(target=self._run, name='save-queue', daemon=True)
+            self._flusher.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                due = self._take_due()
+                while not due:
+                    if not self._pending:
+                        self._flusher = None
+                        return
+                    self._condition.wait(self._seconds_until_next())
+                    due = self._take_due()
+            for pending in due:
+                self._slots.acquire()
+                self._executor.submit(self._write_pending, pending)
+
+    def _take_due(self) -> List[PendingSave]:
+        """
+        Remove and return the saves whose window has passed. A player's save waits while a previous write
+        of theirs is still running, so that writes of the same player never overtake each other.
+        """
+        now = time.monotonic()
+        due = [pending for id, pending in self._pending.items()
+               if pending.due <= now and id not in self._writing]
+        for pending in due:
+            del self._pending[pending.player.id]
+            self._writing.add(pending.player.id)
+        return due
+
+    def _seconds_until_next(self) -> float or None:
+        waiting = [pending.due for id, pending in self._pending.items() if id not in self._writing]
+        if not waiting:
+            return None  # Wait for a write to finish.
+        return max(0, min(waiting) - time.monotonic())
+
+    def _write_pending(self, pending: PendingSave) -> None:
+        id = pending.player.id
+        try:
+            self._write(pending)
+            with self._condition:
+                self.num_written += 1
+        except Exception as e:
+            with self._condition:
+                self.num_failed += 1
+                pending.num_attempts += 1
+                if pending.num_attempts >= SaveQueue.MAX_ATTEMPTS:
+                    # A newer save of the player, if any, is still queued.
+                    print(f"Couldn't save {pending.player.nickname} after {pending.num_attempts} attempts, "
+                          f"giving up: {e}")
+                    self.num_abandoned += 1
+                    return
+                print(f"Couldn't save {pending.player.nickname}, retrying: {e}")
+                pending.due = time.monotonic() + SaveQueue.RETRY_SECONDS
+                newer = self._pending.pop(id, None)
+                if newer:
+                    pending.merge_from(newer)
+                self._pending[id] = pending
+        finally:
+            self._slots.release()
+            with self._condition:
+                self._writing.discard(id)
+                self._start_flusher()
+                self._condition.notify_all()
@@ -0,0 +1,93 @@
+import json
+import sqlite3
+import threading
+from typing import List
+
+from src.data.storage_backend import StorageBackend
+
+
+class SQLiteBackend(StorageBackend):
+    """
+    Keeps data in a local SQLite database, for running the bot on a single machine or offline.
+    Each table stores items as JSON keyed by id. The database runs in WAL mode so that reads don't wait on writes,
+    and each thread gets its own connection, since a connection can only be used by one thread at a time.
+    """
+    MAX_VARIABLES = 500  # The most ids bound in one SELECT; old SQLite builds allow at most 999.
+    BUSY_TIMEOUT_MS = 5000  # How long a write waits for another connection's write to finish.
+
+    def __init__(self, path: str):
+        """
+        :param path: The database file. Created if it doesn't exist.
+        """
+        self.path = path
+        self._local = threading.local()
+        self._connections = []  # Every thread's connection, to close them all on shutdown.
+        self._lock = threading.Lock()
+        # Statements are fixed per table, so sqlite3's statement cache prepares each of them only once per connection.
+        self._sql = {table: SQLiteBackend._statements(table) for table in StorageBackend.TABLES}
+        connection = self._connection()
+        with connection:
+            for table in StorageBackend.TABLES:
+                connection.execute(f'CREATE TABLE IF NOT EXISTS "{table}" (id TEXT PRIMARY KEY, data TEXT NOT NULL)')
+
+    @staticmethod
+    def _statements(table: str) -> dict:
+        return {
+            'get': f'SELECT data FROM "{table}" WHERE id = ?',
+            'put': (f'INSERT INTO "{table}" (id, data) VALUES (?, ?) '
+                    f'ON CONFLICT (id) DO UPDATE SET data = excluded.data'),
+            # json_patch merges the changed attributes into the stored item.
+            'update': (f'INSERT INTO "{table}" (id, data) VALUES (?, ?) '
+                       f'ON CONFLICT (id) DO UPDATE SET data = json_patch(data, excluded.data)'),
+        }
+
+    def get(self, table: str, id: str) -> dict or None:
+        row = self._connection().execute(self._sql[table]['get'], (id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def batch_get(self, table: str, ids: List[str]) -> List[dict]:
+        connection = self._connection()
+        items = []
+        for i in range(0, len(ids), SQLiteBackend.MAX_VARIABLES):
+            batch = ids[i:i + SQLiteBackend.MAX_VARIABLES]
+            placeholders = ', '.join('?' * len(batch))
+            rows = connection.execute(f'SELECT data FROM "{table}" WHERE id IN ({placeholders})', batch)
+            items += [json.loads(row[0]) for row in rows]
+        return items
+
+    def put(self, table: str, item: dict) -> None:
+        self.batch_put(table, [item])
+
+    def batch_put(self, table: str, items: List[dict]) -> None:
+        """
+        Upsert every item in one transaction.
+        """
+        connection = self._connection()
+        with connection:
+            connection.executemany(self._sql[table]['put'], [(item['id'], json.dumps(item)) for item in items])
+
+    def update(self, table: str, id: str, changes: dict) -> None:
+        item = dict(changes, id=id)
+        connection = self._connection()
+        with connection:
+            connection.execute(self._sql[table]['update'], (id, json.dumps(item)))
+
+    def close(self) -> None:
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections = []
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            # check_same_thread is off only so that close() can close every thread's connection.
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')  # Safe in WAL mode; skips an fsync per commit.
+            connection.execute(f'PRAGMA busy_timeout={SQLiteBackend.BUSY_TIMEOUT_MS}')
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
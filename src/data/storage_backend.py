@@ -0,0 +1,48 @@
+from typing import List
+
+
+class StorageBackend:
+    """
+    Where DataManager keeps players, their inventories and their elementals.
+    Every table is keyed by an 'id' attribute, and items are the dicts produced by the to_server() methods.
+    Methods block, and may be called from several threads at once.
+    """
+    PLAYERS = 'Players'
+    ELEMENTALS = 'Elementals'
+    INVENTORIES = 'Inventories'
+    TABLES = [PLAYERS, ELEMENTALS, INVENTORIES]
+
+    def get(self, table: str, id: str) -> dict or None:
+        """
+        :return: The item with the id, or None if it doesn't exist.
+        """
+        raise NotImplementedError
+
+    def batch_get(self, table: str, ids: List[str]) -> List[dict]:
+        """
+        :param ids: Any number of unique ids.
+        :return: The items that exist, in no particular order.
+        """
+        raise NotImplementedError
+
+    def put(self, table: str, item: dict) -> None:
+        """
+        Create or replace a whole item.
+        """
+        raise NotImplementedError
+
+    def batch_put(self, table: str, items: List[dict]) -> None:
+        raise NotImplementedError
+
+    def update(self, table: str, id: str, changes: dict) -> None:
+        """
+        Set some attributes of an item, leaving the rest as they are.
+        :param changes: {attribute name: new value}
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """
+        Release connections. Called once no more requests will be made.
+        """
+        pass
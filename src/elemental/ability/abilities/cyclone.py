@@ -17,9 +17,4 @@ class Cyclone(Ability):
 
     @staticmethod
     def get_bonus_multiplier(target, actor) -> float:
-        multiplier = 1
-        for action in reversed(actor.actions):
-            if hasattr(action, 'ability') and not isinstance(action.ability, Cyclone):
-                break
-            multiplier += 0.25
-        return multiplier
+        return 1 + 0.25 * actor.consecutive_uses(Cyclone)
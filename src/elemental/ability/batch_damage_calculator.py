@@ -0,0 +1,110 @@
+from typing import List, Tuple
+
+import numpy as np
+
+from src.core.elements import Category, Effectiveness
+from src.core.targetable_interface import Targetable
+
+
+class BatchDamageCalculator:
+    """
+    DamageCalculator over arrays: row i is one (target, actor, damage source) calculation.
+    Gives exactly the results of DamageCalculator.calculate(), for balance sweeps and AI evaluation that need a lot
+    of them. Elements and categories are given by their enum values.
+    Bonus multipliers depend on the state of the battle, so they are evaluated beforehand and passed in.
+    Requires numpy, unlike the rest of the game.
+    """
+
+    EFFECTIVENESS = np.array(Effectiveness.MULTIPLIERS, dtype=np.float64)
+
+    def __init__(self,
+                 actor_base_damage,
+                 actor_physical_att,
+                 actor_magic_att,
+                 actor_element,
+                 target_physical_def,
+                 target_magic_def,
+                 target_damage_reduction,
+                 target_element,
+                 attack_power,
+                 category,
+                 element,
+                 bonus_multiplier=1):
+        """
+        Each argument is an array with one value per calculation, or a scalar shared by all of them.
+        """
+        self.actor_base_damage = np.asarray(actor_base_damage, dtype=np.float64)
+        self.actor_physical_att = np.asarray(actor_physical_att, dtype=np.float64)
+        self.actor_magic_att = np.asarray(actor_magic_att, dtype=np.float64)
+        self.actor_element = np.asarray(actor_element, dtype=np.intp)
+        self.target_physical_def = np.asarray(target_physical_def, dtype=np.float64)
+        self.target_magic_def = np.asarray(target_magic_def, dtype=np.float64)
+        self.target_damage_reduction = np.asarray(target_damage_reduction, dtype=np.float64)
+        self.target_element = np.asarray(target_element, dtype=np.intp)
+        self.attack_power = np.asarray(attack_power, dtype=np.float64)
+        self.category = np.asarray(category, dtype=np.intp)
+        self.element = np.asarray(element, dtype=np.intp)
+        self.bonus_multiplier = np.asarray(bonus_multiplier, dtype=np.float64)
+        self.raw_damage = None
+        self.damage_blocked = None
+        self.stat_multiplier = None
+        self.final_damage = None
+        self.effectiveness_multiplier = None
+        self.same_element_multiplier = None
+
+    @staticmethod
+    def from_calculations(calculations: List[Tuple[Targetable, object, object]]) -> 'BatchDamageCalculator':
+        """
+        :param calculations: [(target, actor, damage_source)], as would be given to DamageCalculator.
+        """
+        columns = [(actor.base_damage,
+                    actor.physical_att,
+                    actor.magic_att,
+                    actor.element.value,
+                    target.physical_def,
+                    target.magic_def,
+                    target.damage_reduction,
+                    target.element.value,
+                    damage_source.attack_power,
+                    damage_source.category.value,
+                    damage_source.element.value,
+                    damage_source.get_bonus_multiplier(target, actor))
+                   for target, actor, damage_source in calculations]
+        return BatchDamageCalculator(*zip(*columns))
+
+    @property
+    def is_effective(self) -> np.ndarray:
+        return self.effectiveness_multiplier > 1
+
+    @property
+    def is_resisted(self) -> np.ndarray:
+        return self.effectiveness_multiplier < 1
+
+    def calculate(self) -> np.ndarray:
+        """
+        :return: The final damage of each calculation, as ints.
+        """
+        attacks = self.attack_power != 0
+        # Like DamageCalculator, a source without attack power doesn't get the multipliers evaluated.
+        self.effectiveness_multiplier = np.where(attacks, self.EFFECTIVENESS[self.element, self.target_element], 1)
+        self.same_element_multiplier = np.where(self.element == self.actor_element, 1.25, 1)
+        # Multiply in the same order as DamageCalculator, so that floats round the same way.
+        raw_damage = self.actor_base_damage * (self.attack_power / 10)
+        raw_damage = raw_damage * self.effectiveness_multiplier
+        raw_damage = raw_damage * self.same_element_multiplier
+        self.raw_damage = raw_damage * self.bonus_multiplier
+        self.damage_blocked = np.where(attacks, np.trunc(self.raw_damage * self.target_damage_reduction), 0)
+        self.stat_multiplier = self.__get_stat_comparison_multiplier()
+        final_difference = self.raw_damage * self.stat_multiplier - self.damage_blocked
+        final_damage = np.where(final_difference < 1, 1, np.trunc(final_difference))
+        self.final_damage = np.where(attacks, final_damage, 0).astype(np.int64)
+        self.damage_blocked = self.damage_blocked.astype(np.int64)
+        return self.final_damage
+
+    def __get_stat_comparison_multiplier(self) -> np.ndarray:
+        physical = self.category == Category.PHYSICAL.value
+        magic = self.category == Category.MAGIC.value
+        # Defense of rows that don't use it is replaced by 1, to avoid dividing by 0.
+        physical_multiplier = self.actor_physical_att / np.where(physical, self.target_physical_def, 1)
+        magic_multiplier = self.actor_magic_att / np.where(magic, self.target_magic_def, 1)
+        return np.where(physical, physical_multiplier, np.where(magic, magic_multiplier, 0))
@@ -82,8 +82,7 @@ class DamageCalculator:
         Eg. the lightning target is weak to earth, so an earth ability does 1.5x damage and is marked as effective.
         Eg. the wind target is strong to fire, so a fire ability does 0.5x damage and is marked as resisted.
         """
-        effectiveness = Effectiveness(self.damage_source.element, self.target.element)
-        return effectiveness.calculate_multiplier()
+        return Effectiveness.multiplier(self.damage_source.element, self.target.element)
 
     def __get_bonus_multiplier(self) -> float:
         """
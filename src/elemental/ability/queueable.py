@@ -1,7 +1,12 @@
+from src.core.cloning import shallow_clone
 from src.elemental.ability.ability import Ability
 
 
 class Queueable:
+    def clone(self, clones: dict) -> 'Queueable':
+        # The Ability is shared: Abilities don't change during battle.
+        return shallow_clone(self, clones)
+
     def decrement_time(self) -> None:
         raise NotImplementedError
 
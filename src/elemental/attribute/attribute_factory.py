@@ -1,4 +1,4 @@
-from random import randint
+import random
 from typing import List, Type
 
 from src.data.resources import AttributeResource
@@ -30,14 +30,15 @@ class AttributeFactory:
         return list(AttributeFactory.POTENTIAL_ATTRIBUTES)
 
     @staticmethod
-    def create_random() -> AttributeManager:
+    def create_random(rng=random) -> AttributeManager:
         """
+        :param rng: The random.Random to pick with. The random module's by default.
         :return: An AttributeManager with three random Attributes.
         """
         manager = AttributeManager()
         attribute_pool = AttributeFactory.get_potential_attributes()
         for i in range(AttributeManager.MAX_NUM_ATTRIBUTES):
-            pick = randint(0, len(attribute_pool) - 1)
+            pick = rng.randint(0, len(attribute_pool) - 1)
             attribute = attribute_pool.pop(pick)
             manager.add_attribute(attribute)
         return manager
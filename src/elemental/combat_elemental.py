@@ -1,5 +1,7 @@
-from typing import List
+from collections import deque
+from typing import List, NamedTuple, Tuple
 
+from src.core.cloning import get_clone, shallow_clone
 from src.core.elements import Elements
 from src.core.targetable_interface import Targetable
 from src.elemental.ability.abilities.defend import Defend
@@ -12,6 +14,8 @@ from src.elemental.status_effect.status_manager import StatusManager
 
 
 class CombatElemental(Targetable):
+    MAX_ACTIONS_KEPT = 20
+
     def __init__(self, elemental: Elemental,
                  team):
         """
@@ -31,15 +35,35 @@ class CombatElemental(Targetable):
         self._mana_per_turn = elemental.mana_per_turn
         self._bench_mana_per_turn = elemental.bench_mana_per_turn
         self._status_manager = StatusManager(self)
-        self._actions = []  # List[ElementalAction]  A record of the actions taken by this CombatElemental.
+        # A record of the most recent ElementalActions taken by this CombatElemental.
+        self._actions = deque(maxlen=CombatElemental.MAX_ACTIONS_KEPT)
+        # Counted as actions are added, since streaks can outlast the actions kept. See consecutive_uses().
+        self._streak_ability = None  # The Ability of the last action that had one.
+        self._streak_length = 0  # Actions since the last action whose Ability was different from _streak_ability.
+        self._num_actions_without_ability = 0  # Actions in a row, most recent, that had no Ability, eg. switches.
         self._abilities = elemental.active_abilities
         self._abilities.append(Defend())  # All elementals know Defend.
         # Queueable; wrapper for an Ability that takes time to activate or executes over multiple turns:
         self.action_queued = None
+        self._last_snapshot = None  # CombatElementalLog
 
     def __repr__(self) -> str:
         return self.nickname
 
+    def clone(self, clones: dict) -> 'CombatElemental':
+        """
+        See Combat.clone(). The action history is copied, but the Actions in it are shared with the original:
+        they are only read, eg. by abilities that scale with consecutive uses.
+        """
+        elemental = shallow_clone(self, clones)
+        elemental._elemental = get_clone(self._elemental, clones)
+        elemental.team = get_clone(self.team, clones)
+        elemental._status_manager = self._status_manager.clone(elemental, clones)
+        elemental._actions = deque(self._actions, maxlen=CombatElemental.MAX_ACTIONS_KEPT)
+        elemental.action_queued = get_clone(self.action_queued, clones)
+        elemental._last_snapshot = None
+        return elemental
+
     @property
     def nickname(self) -> str:
         return self._elemental.nickname
@@ -238,6 +262,25 @@ class CombatElemental(Targetable):
         :param action: ElementalAction
         """
         self._actions.append(action)
+        if not hasattr(action, 'ability'):
+            self._streak_length += 1
+            self._num_actions_without_ability += 1
+            return
+        if self._streak_ability is not None and type(action.ability) is type(self._streak_ability):
+            self._streak_length += 1
+        else:
+            self._streak_length = self._num_actions_without_ability + 1
+        self._streak_ability = action.ability
+        self._num_actions_without_ability = 0
+
+    def consecutive_uses(self, ability_type: type) -> int:
+        """
+        :return: How many of the most recent actions were uses of an ability type, or had no ability at all,
+        eg. switches. Unlike actions, this isn't limited to the last MAX_ACTIONS_KEPT.
+        """
+        if self._streak_ability is None or type(self._streak_ability) is ability_type:
+            return self._streak_length
+        return self._num_actions_without_ability
 
     def dispel_all(self, dispeller: 'CombatElemental'):
         self._status_manager.dispel_all(dispeller)
@@ -339,8 +382,30 @@ class CombatElemental(Targetable):
     def snapshot(self) -> 'CombatElementalLog':
         """
         Create a limited log about itself for rendering.
+        Most events change little, so parts that didn't change since the last snapshot are shared with it, and if
+        nothing changed, the last snapshot is returned.
         """
-        return CombatElementalLog(self)
+        last = self._last_snapshot
+        team_status = self.team.elemental_status
+        if last and last.team_status == team_status:
+            team_status = last.team_status
+        snapshot = CombatElementalLog(level=self.level,
+                                      current_hp=self.current_hp,
+                                      max_hp=self.max_hp,
+                                      current_mana=self.current_mana,
+                                      max_mana=self.max_mana,
+                                      status_effects=self._status_manager.status_effects_snapshot,
+                                      nickname=self.nickname,
+                                      defend_charges=self.defend_charges,
+                                      icon=self.icon,
+                                      health_percent=self.health_percent,
+                                      team_status_effects=self.team.status_effects_snapshot,
+                                      is_knocked_out=self.is_knocked_out,
+                                      action_queued=self.action_queued,
+                                      team_status=team_status)
+        if snapshot != last:
+            self._last_snapshot = snapshot
+        return self._last_snapshot
 
     @property
     def team_status(self) -> List[bool]:
@@ -350,22 +415,22 @@ class CombatElemental(Targetable):
         return [not elemental.is_knocked_out for elemental in self.team.elementals]
 
 
-class CombatElementalLog:
+class CombatElementalLog(NamedTuple):
     """
     Containing visible details about a CombatElemental for rendering.
+    Immutable, so that snapshots can share it and its tuples.
     """
-    def __init__(self, combat_elemental: CombatElemental):
-        self.level = combat_elemental.level
-        self.current_hp = combat_elemental.current_hp
-        self.max_hp = combat_elemental.max_hp
-        self.current_mana = combat_elemental.current_mana
-        self.max_mana = combat_elemental.max_mana
-        self.status_effects = combat_elemental.status_effects
-        self.nickname = combat_elemental.nickname
-        self.defend_charges = combat_elemental.defend_charges
-        self.icon = combat_elemental.icon
-        self.health_percent = combat_elemental.health_percent
-        self.team_status_effects = combat_elemental.team_status_effects
-        self.is_knocked_out = combat_elemental.is_knocked_out
-        self.action_queued = combat_elemental.action_queued
-        self.team_status = combat_elemental.team_status
+    level: int
+    current_hp: int
+    max_hp: int
+    current_mana: int
+    max_mana: int
+    status_effects: Tuple[StatusEffect, ...]
+    nickname: str
+    defend_charges: int
+    icon: str
+    health_percent: float
+    team_status_effects: Tuple[StatusEffect, ...]
+    is_knocked_out: bool
+    action_queued: Queueable or None
+    team_status: Tuple[bool, ...]  # Which elementals on the team have not been knocked out.
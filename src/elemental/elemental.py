@@ -2,7 +2,9 @@ import math
 import uuid
 from typing import List
 
+from src.core.cloning import shallow_clone
 from src.core.elements import Elements
+from src.data.dirty_tracker import DirtyTracker
 from src.data.resources import ElementalResource
 from src.elemental.ability.ability import Ability
 from src.elemental.ability.ability_manager import AbilityManager
@@ -17,11 +19,14 @@ class Elemental:
     def __init__(self,
                  species: Species,
                  attribute_manager: AttributeManager,
-                 id=uuid.uuid4()):
+                 id=None):
+        """
+        :param id: A new id is generated if None.
+        """
         super().__init__()
         self._species = species  # TBD by descendants
         self._level = 1
-        self._id = str(id)
+        self._id = str(id or uuid.uuid4())
         self._max_hp = species.max_hp
         self._current_hp = species.max_hp
         self._starting_mana = species.starting_mana
@@ -43,6 +48,16 @@ class Elemental:
         self._note = None
         self._attribute_manager = attribute_manager
         self._ability_manager = AbilityManager(self)
+        self.server_state = DirtyTracker()  # What this Elemental looks like on the server.
+
+    def clone(self, clones: dict) -> 'Elemental':
+        """
+        A copy for a cloned battle, with its own HP and exp but no owner. Attributes, abilities and server state are
+        shared with the original, which is fine as long as the copy doesn't level up.
+        """
+        elemental = shallow_clone(self, clones)
+        elemental._owner = None
+        return elemental
 
     @property
     def left_icon(self) -> str:
@@ -159,6 +174,13 @@ class Elemental:
     def is_knocked_out(self) -> bool:
         return self.current_hp == 0
 
+    @property
+    def is_dirty(self) -> bool:
+        """
+        :return: True if this Elemental has changed since it was last saved or loaded.
+        """
+        return self.server_state.is_dirty(self.to_server())
+
     def load_from_resource(self, resource: ElementalResource) -> 'Elemental':
         self.level_to(resource.level)
         self._current_exp = int(resource.current_exp)
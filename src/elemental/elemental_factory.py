@@ -43,13 +43,14 @@ class ElementalInitializer:
         NAME_MAP[species.name] = species
 
     @staticmethod
-    def make(species, level=1) -> Elemental:
+    def make(species, level=1, rng=random) -> Elemental:
         """
         :param species: Which subclass of Species
         :param level: How much to level up the Elemental
+        :param rng: The random.Random that Attributes are picked with. The random module's by default.
         """
         elemental = Elemental(species,
-                              AttributeFactory.create_random())
+                              AttributeFactory.create_random(rng))
         elemental.level_to(level)
         return elemental
 
@@ -65,11 +66,12 @@ class ElementalInitializer:
         return elemental
 
     @staticmethod
-    def make_random(level=1, excluding: List[Elemental] = None, element: Elements = None) -> Elemental:
+    def make_random(level=1, excluding: List[Elemental] = None, element: Elements = None, rng=random) -> Elemental:
         """
         :param level: The desired level of the Elemental.
         :param excluding: A List[Species] of elementals to exclude.
         :param element: Filter elementals by a specific element.
+        :param rng: The random.Random to pick with. The random module's by default.
         :return: The summoned elemental.
         """
         summonable_species = list(ElementalInitializer.SUMMONABLE_SPECIES)
@@ -82,8 +84,8 @@ class ElementalInitializer:
                                  if species.name not in excluded_species]
         if not potential_species or not excluding:
             potential_species = summonable_species
-        pick = random.randint(0, len(potential_species) - 1)
-        return ElementalInitializer.make(potential_species[pick], level)
+        pick = rng.randint(0, len(potential_species) - 1)
+        return ElementalInitializer.make(potential_species[pick], level, rng)
 
 
 def print_abilities():
@@ -1,5 +1,6 @@
 from enum import Enum
 
+from src.core.cloning import get_clone, shallow_clone
 from src.core.elements import Category
 from src.core.targetable_interface import Targetable
 from src.elemental.ability.technique import Technique
@@ -49,6 +50,15 @@ class StatusEffect(Technique):
         self.refresh_duration()
         self.active = True  # Effect may be disabled for a reason besides duration ending.
 
+    def clone(self, clones: dict) -> 'StatusEffect':
+        """
+        :param clones: {id(original): clone} of the battle being cloned. See src.core.cloning.
+        """
+        effect = shallow_clone(self, clones)
+        effect.__target = get_clone(self.__target, clones)
+        effect.__applier = get_clone(self.__applier, clones)
+        return effect
+
     @property
     def p_att_stages(self) -> int:
         return 0
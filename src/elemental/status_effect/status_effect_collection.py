@@ -0,0 +1,98 @@
+from collections import Counter, defaultdict
+from typing import Iterator, List, Tuple, Type
+
+from src.core.cloning import get_clone
+from src.elemental.status_effect.status_effect import StatusEffect, EffectType
+
+
+class StatusEffectCollection:
+    """
+    The StatusEffects on a CombatElemental or CombatTeam, in the order they were applied, indexed by EffectType and by
+    class so that checks like "is this elemental stunned?" don't scan every effect.
+    Effects can be added and removed while the collection is being iterated. Removed effects are skipped straight away;
+    their slots are compacted once no iteration is in progress. Effects added during iteration are iterated too.
+    """
+
+    def __init__(self):
+        self._effects = []  # [StatusEffect or None] None where an effect was removed during iteration.
+        self._members = set()  # {StatusEffect}
+        self._num_types = Counter()  # {EffectType: number of effects of that type}
+        self._by_class = defaultdict(list)  # {StatusEffect subclass: [StatusEffect]}
+        self._num_iterating = 0
+        self._has_removed_slots = False
+        self._as_tuple = ()  # Kept until the effects change, so that battle log snapshots can share it.
+
+    def __iter__(self) -> Iterator[StatusEffect]:
+        self._num_iterating += 1
+        try:
+            i = 0
+            while i < len(self._effects):
+                effect = self._effects[i]
+                if effect is not None:
+                    yield effect
+                i += 1
+        finally:
+            self._num_iterating -= 1
+            self._compact()
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __contains__(self, effect: StatusEffect) -> bool:
+        return effect in self._members
+
+    def as_list(self) -> List[StatusEffect]:
+        return [effect for effect in self._effects if effect is not None]
+
+    def as_tuple(self) -> Tuple[StatusEffect, ...]:
+        if self._as_tuple is None:
+            self._as_tuple = tuple(self.as_list())
+        return self._as_tuple
+
+    def has_type(self, effect_type: EffectType) -> bool:
+        return self._num_types[effect_type] > 0
+
+    def find(self, effect_class: Type[StatusEffect]) -> StatusEffect or None:
+        """
+        :return: The earliest applied effect of exactly this class, or None.
+        """
+        effects = self._by_class.get(effect_class)
+        return effects[0] if effects else None
+
+    def add(self, effect: StatusEffect) -> None:
+        if effect in self._members:
+            return
+        self._effects.append(effect)
+        self._as_tuple = None
+        self._members.add(effect)
+        self._num_types[effect.effect_type] += 1
+        self._by_class[type(effect)].append(effect)
+
+    def remove(self, effect: StatusEffect) -> None:
+        if effect not in self._members:
+            return
+        self._members.discard(effect)
+        self._num_types[effect.effect_type] -= 1
+        effects = self._by_class[type(effect)]
+        effects.remove(effect)
+        if not effects:
+            del self._by_class[type(effect)]
+        self._effects[self._effects.index(effect)] = None
+        self._as_tuple = None
+        self._has_removed_slots = True
+        self._compact()
+
+    def clone(self, clones: dict) -> 'StatusEffectCollection':
+        collection = StatusEffectCollection()
+        for effect in self.as_list():
+            collection.add(get_clone(effect, clones))
+        return collection
+
+    def clear(self) -> None:
+        for effect in self.as_list():
+            self.remove(effect)
+
+    def _compact(self) -> None:
+        if self._num_iterating == 0 and self._has_removed_slots:
+            self._effects = [effect for effect in self._effects if effect is not None]
+            self._has_removed_slots = False
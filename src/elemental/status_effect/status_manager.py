@@ -1,7 +1,22 @@
-from typing import List
+from typing import List, NamedTuple, Tuple
 
+from src.core.cloning import shallow_clone
 from src.elemental.ability.ability import Ability
 from src.elemental.status_effect.status_effect import StatusEffect, EffectType
+from src.elemental.status_effect.status_effect_collection import StatusEffectCollection
+
+
+class StageTotals(NamedTuple):
+    """
+    The stat modifiers of a CombatElemental's status effects, summed.
+    """
+    p_att_stages: int
+    m_att_stages: int
+    p_def_stages: int
+    m_def_stages: int
+    speed_stages: int
+    mana_per_turn: int
+    damage_reduction: float
 
 
 class StatusManager:
@@ -11,7 +26,19 @@ class StatusManager:
         """
         self.combat_elemental = combat_elemental
         self._max_stages = 6
-        self._status_effects = []  # List[StatusEffect]
+        self._status_effects = StatusEffectCollection()
+        # Stats are read far more often than effects change, so the sums are kept until something
+        # that can change an effect's modifiers happens. None if they must be summed again.
+        self._stage_totals = None
+
+    def clone(self, combat_elemental, clones: dict) -> 'StatusManager':
+        """
+        :param combat_elemental: The clone of the CombatElemental this manages.
+        """
+        manager = shallow_clone(self, clones)
+        manager.combat_elemental = combat_elemental
+        manager._status_effects = self._status_effects.clone(clones)
+        return manager
 
     @property
     def is_stunned(self) -> bool:
@@ -43,11 +70,18 @@ class StatusManager:
 
     @property
     def status_effects(self) -> List[StatusEffect]:
-        return list(self._status_effects)
+        return self._status_effects.as_list()
+
+    @property
+    def status_effects_snapshot(self) -> Tuple[StatusEffect, ...]:
+        """
+        :return: The same tuple for as long as no effect is added or removed.
+        """
+        return self._status_effects.as_tuple()
 
     @property
     def num_debuffs(self) -> int:
-        return len([effect for effect in self.status_effects if effect.is_debuff])
+        return len([effect for effect in self._status_effects if effect.is_debuff])
 
     @property
     def num_status_effects(self) -> int:
@@ -58,45 +92,67 @@ class StatusManager:
 
     @property
     def bonus_physical_att(self) -> int:
-        stages = sum([effect.p_att_stages for effect in self.status_effects])
+        stages = self.stage_totals.p_att_stages
         return self.__calculate_stats_from_stages(self.__validate_stages(stages),
                                                   self.combat_elemental.base_physical_att)
 
     @property
     def bonus_magic_att(self) -> int:
-        stages = sum([effect.m_att_stages for effect in self.status_effects])
+        stages = self.stage_totals.m_att_stages
         return self.__calculate_stats_from_stages(self.__validate_stages(stages),
                                                   self.combat_elemental.base_magic_att)
 
     @property
     def bonus_physical_def(self) -> int:
-        stages = sum([effect.p_def_stages for effect in self.status_effects])
+        stages = self.stage_totals.p_def_stages
         return self.__calculate_stats_from_stages(self.__validate_stages(stages),
                                                   self.combat_elemental.base_physical_def)
 
     @property
     def bonus_magic_def(self) -> int:
-        stages = sum([effect.m_def_stages for effect in self.status_effects])
+        stages = self.stage_totals.m_def_stages
         return self.__calculate_stats_from_stages(self.__validate_stages(stages),
                                                   self.combat_elemental.base_magic_def)
 
     @property
     def bonus_speed(self) -> int:
-        stages = sum([effect.speed_stages for effect in self.status_effects])
+        stages = self.stage_totals.speed_stages
         return self.__calculate_stats_from_stages(self.__validate_stages(stages),
                                                   self.combat_elemental.base_speed)
 
     @property
     def bonus_mana_per_turn(self) -> int:
-        return sum([effect.mana_per_turn for effect in self.status_effects])
+        return self.stage_totals.mana_per_turn
 
     @property
     def damage_reduction(self) -> float:
-        return sum([effect.damage_reduction for effect in self.status_effects])
+        return self.stage_totals.damage_reduction
+
+    @property
+    def stage_totals(self) -> StageTotals:
+        if self._stage_totals is None:
+            effects = self._status_effects
+            self._stage_totals = StageTotals(sum([effect.p_att_stages for effect in effects]),
+                                             sum([effect.m_att_stages for effect in effects]),
+                                             sum([effect.p_def_stages for effect in effects]),
+                                             sum([effect.m_def_stages for effect in effects]),
+                                             sum([effect.speed_stages for effect in effects]),
+                                             sum([effect.mana_per_turn for effect in effects]),
+                                             sum([effect.damage_reduction for effect in effects]))
+        return self._stage_totals
+
+    def invalidate_stage_totals(self) -> None:
+        """
+        Call after anything that may have changed the modifiers of an effect: adding, removing, stacking or
+        triggering it. Effects read stats while they trigger (eg. a bleed calculating its damage), so this is done
+        between effects, not once after all of them.
+        """
+        self._stage_totals = None
 
     def clear_status_effects(self) -> None:
         # TODO some effects may ought to linger after knockout
-        self._status_effects = []
+        self._status_effects.clear()
+        self.invalidate_stage_totals()
 
     def __validate_stages(self, stages: int) -> int:
         """
@@ -114,11 +170,13 @@ class StatusManager:
         if equivalent_effect and not effect.can_add_instances:
             equivalent_effect.reapply()
         else:
-            self._status_effects.append(effect)
+            self._status_effects.add(effect)
+        self.invalidate_stage_totals()
         effect.target = self.combat_elemental
         if effect.applier == self.combat_elemental:
             effect.boost_turn_duration()
         effect.on_effect_start()
+        self.invalidate_stage_totals()
 
     def dispel_all(self, dispeller) -> None:
         """
@@ -127,6 +185,7 @@ class StatusManager:
         for effect in self._status_effects:
             if effect.is_dispellable:
                 self._status_effects.remove(effect)
+                self.invalidate_stage_totals()
                 effect.on_dispel(dispeller)
 
     def on_receive_ability(self, ability: Ability, actor) -> None:
@@ -135,7 +194,9 @@ class StatusManager:
         :param actor: The CombatElemental performing the ability.
         """
         for effect in self._status_effects:
-            if effect.on_receive_ability(ability, actor):
+            triggered = effect.on_receive_ability(ability, actor)
+            self.invalidate_stage_totals()
+            if triggered:
                 self.combat_elemental.append_recent_log(effect.trigger_recap)
                 self.__check_effect_end(effect)
 
@@ -145,31 +206,41 @@ class StatusManager:
         :param actor: The CombatElemental dealing damage.
         """
         for effect in self._status_effects:
-            if effect.on_receive_damage(amount, actor):
+            triggered = effect.on_receive_damage(amount, actor)
+            self.invalidate_stage_totals()
+            if triggered:
                 self.combat_elemental.append_recent_log(effect.trigger_recap)
                 self.__check_effect_end(effect)
 
     def on_turn_start(self) -> None:
         for effect in self._status_effects:
-            if effect.on_turn_start():
+            triggered = effect.on_turn_start()
+            self.invalidate_stage_totals()
+            if triggered:
                 self.combat_elemental.log(effect.trigger_recap)
 
     def on_turn_end(self) -> None:
         for effect in self._status_effects:
-            if effect.on_turn_end():
+            triggered = effect.on_turn_end()
+            self.invalidate_stage_totals()
+            if triggered:
                 self.combat_elemental.append_recent_log(effect.trigger_recap)
         # Only decrement and check duration end after all effects have been resolved.
         for effect in self._status_effects:
             effect.reduce_turn_duration()
+            self.invalidate_stage_totals()
             self.__check_effect_end(effect)
 
     def on_round_end(self) -> None:
         for effect in self._status_effects:
-            if effect.on_round_end():
+            triggered = effect.on_round_end()
+            self.invalidate_stage_totals()
+            if triggered:
                 self.combat_elemental.append_recent_log(effect.trigger_recap)
         # Only decrement and check duration end after all effects have been resolved.
         for effect in self._status_effects:
             effect.reduce_round_duration()
+            self.invalidate_stage_totals()
             self.__check_effect_end(effect)
 
     def on_opponent_changed(self, old_opponent) -> None:
@@ -179,6 +250,7 @@ class StatusManager:
         for effect in self._status_effects:
             if effect.ends_on_applier_changed and effect.applier == old_opponent:
                 self._status_effects.remove(effect)
+        self.invalidate_stage_totals()
 
     def on_switch_out(self) -> None:
         """
@@ -187,10 +259,13 @@ class StatusManager:
         for effect in self._status_effects:
             if effect.ends_on_switch:
                 self._status_effects.remove(effect)
+        self.invalidate_stage_totals()
 
     def on_switch_in(self) -> None:
         for effect in self._status_effects:
-            if effect.on_switch_in():
+            triggered = effect.on_switch_in()
+            self.invalidate_stage_totals()
+            if triggered:
                 self.combat_elemental.log(effect.trigger_recap)
 
     def __effect_exists(self, to_check: StatusEffect) -> StatusEffect or None:
@@ -198,7 +273,7 @@ class StatusManager:
         Check if an equivalent StatusEffect is already on this CombatElemental by type.
         :return The StatusEffect if it exists, None if not.
         """
-        return next((effect for effect in self._status_effects if type(effect) is type(to_check)), None)
+        return self._status_effects.find(type(to_check))
 
     @staticmethod
     def __calculate_stats_from_stages(stages: int, stats: int) -> int:
@@ -221,11 +296,11 @@ class StatusManager:
             return
         if effect.duration_ended or not effect.active:
             self._status_effects.remove(effect)
+            self.invalidate_stage_totals()
             self.combat_elemental.log(effect.fade_recap)
 
     def __has_effect(self, effect_type: EffectType) -> bool:
         """
         Helper function to check, eg., if the elemental is stunned.
         """
-        matching = next((effect for effect in self._status_effects if effect.is_type(effect_type)), None)
-        return matching is not None
+        return self._status_effects.has_type(effect_type)
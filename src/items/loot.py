@@ -1,4 +1,4 @@
-from random import random
+import random
 from typing import List
 
 from src.elemental.combat_elemental import CombatElemental
@@ -87,23 +87,29 @@ loot_table = {
 }
 
 
-def roll_elemental_shard(elemental_type: Elements) -> Shard or None:
-    if random() > 0.75:
+def roll_elemental_shard(elemental_type: Elements, rng=random) -> Shard or None:
+    """
+    :param rng: The random.Random to roll with, eg. a Combat's. The random module's by default.
+    """
+    if rng.random() > 0.75:
         return
     for shard in [EarthShard, LightningShard, FireShard, WaterShard, WindShard, ShadowShard, LightShard, ChaosShard]:
         if shard.element == elemental_type:
             return shard
 
 
-def roll_loot(elemental: CombatElemental) -> List[Item]:
+def roll_loot(elemental: CombatElemental, rng=random) -> List[Item]:
+    """
+    :param rng: The random.Random to roll with, eg. a Combat's. The random module's by default.
+    """
     items: List[Item] = []
     if elemental.name in loot_table:
         for loot in loot_table[elemental.name]:
-            if random() <= loot.drop_rate:
+            if rng.random() <= loot.drop_rate:
                 items.append(loot.item)
     else:
         print(f"{elemental.name} doesn't have a specific loot table.")
-    shard = roll_elemental_shard(elemental.element)
+    shard = roll_elemental_shard(elemental.element, rng)
     if shard:
         items.append(shard)
     return items
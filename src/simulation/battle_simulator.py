@@ -0,0 +1,270 @@
+"""
+Runs NPC vs NPC battles end to end without Discord or a database, and reports how fast the engine is.
+Run from the repository root, eg.
+    python -m src.simulation.battle_simulator --battles 500 --generator collectors --min-level 10 --max-level 30
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import traceback
+from collections import defaultdict
+from contextlib import redirect_stdout
+from typing import Callable, Tuple
+
+from src.character.npc.npc_initializer import NPCInitializer
+from src.combat.actions.action import ActionLogger
+from src.combat.combat import Combat
+from src.combat.combat_ai import CombatAI
+from src.combat.event import EventLogger
+from src.elemental.elemental_factory import ElementalInitializer
+from src.team.combat_team import CombatTeam
+
+
+class NullDataManager:
+    """
+    Stands in for DataManager where nothing should be persisted.
+    """
+
+    class NullGuildIndex:
+        def update(self, player) -> None:
+            pass
+
+    def __init__(self):
+        self.guilds = NullDataManager.NullGuildIndex()
+
+    def queue_save(self, player) -> None:
+        pass
+
+
+class PhaseTimer:
+    """
+    Measures the self time of phases of the engine, by wrapping the methods that make them up.
+    The engine is recursive (an AI's move resolves the round, which asks the next AI for a move), so time spent in a
+    nested phase is only counted towards the innermost phase.
+    """
+
+    def __init__(self):
+        self.seconds = defaultdict(float)  # {phase: self time in seconds}
+        self._stack = []  # [[phase, time.perf_counter() since which the phase's self time is unaccounted for]]
+        self._originals = []  # [(class, method name, original function)]
+
+    def wrap(self, cls, method_name: str, phase: str) -> None:
+        original = getattr(cls, method_name)
+        timer = self
+
+        def timed(*args, **kwargs):
+            timer.enter(phase)
+            try:
+                return original(*args, **kwargs)
+            finally:
+                timer.exit()
+
+        self._originals.append((cls, method_name, original))
+        setattr(cls, method_name, timed)
+
+    def restore(self) -> None:
+        for cls, method_name, original in reversed(self._originals):
+            setattr(cls, method_name, original)
+        self._originals = []
+
+    def enter(self, phase: str) -> None:
+        now = time.perf_counter()
+        if self._stack:
+            parent = self._stack[-1]
+            self.seconds[parent[0]] += now - parent[1]
+        self._stack.append([phase, now])
+
+    def exit(self) -> None:
+        now = time.perf_counter()
+        phase, start = self._stack.pop()
+        self.seconds[phase] += now - start
+        if self._stack:
+            self._stack[-1][1] = now
+
+
+def instrument(timer: PhaseTimer) -> None:
+    """
+    Group the engine's methods into the phases that are reported.
+    """
+    timer.wrap(CombatAI, 'pick_move', 'ai')
+    timer.wrap(Combat, '_resolve_request', 'actions')
+    timer.wrap(Combat, '_check_kos', 'round bookkeeping')
+    timer.wrap(Combat, '_check_combat_end', 'round bookkeeping')
+    timer.wrap(Combat, '_get_priority_order_requests', 'round bookkeeping')
+    timer.wrap(CombatTeam, 'turn_start', 'turn start/end effects')
+    timer.wrap(CombatTeam, 'end_round', 'turn start/end effects')
+    timer.wrap(EventLogger, 'prepare_new_round', 'logging')
+    timer.wrap(ActionLogger, 'add_log', 'logging')
+    timer.wrap(Combat, '_generate_loot', 'loot')
+
+
+# Team generators: each returns the two CombatTeams of one battle, generated with the battle's random.Random.
+
+def collectors(args, rng: random.Random) -> Tuple[CombatTeam, CombatTeam]:
+    """
+    A collector with a random team against a collector with a team of the same size.
+    """
+    npc_one = NPCInitializer.collector(rng)
+    npc_one.generate_random_team(min_level=args.min_level,
+                                 max_level=args.max_level,
+                                 min_team_size=args.min_team_size,
+                                 max_team_size=args.max_team_size)
+    npc_two = NPCInitializer.collector(rng)
+    npc_two.generate_equal_team(npc_one)
+    return CombatTeam.from_team(npc_one.team), CombatTeam.from_team(npc_two.team)
+
+
+def adventurers(args, rng: random.Random) -> Tuple[CombatTeam, CombatTeam]:
+    """
+    A collector against an adventurer generated for them, the way a PvE opponent is.
+    """
+    npc_one = NPCInitializer.collector(rng)
+    npc_one.generate_random_team(min_level=args.min_level,
+                                 max_level=args.max_level,
+                                 min_team_size=args.min_team_size,
+                                 max_team_size=args.max_team_size)
+    npc_two = NPCInitializer.adventurer(rng)
+    npc_two.generate_team(npc_one)
+    return CombatTeam.from_team(npc_one.team), CombatTeam.from_team(npc_two.team)
+
+
+def wild(args, rng: random.Random) -> Tuple[CombatTeam, CombatTeam]:
+    """
+    A collector against a single wild elemental of about their level.
+    """
+    npc = NPCInitializer.collector(rng)
+    npc.generate_random_team(min_level=args.min_level,
+                             max_level=args.max_level,
+                             min_team_size=args.min_team_size,
+                             max_team_size=args.max_team_size)
+    level = rng.randint(npc.team.average_elemental_level - 1, npc.team.average_elemental_level + 1)
+    return CombatTeam.from_team(npc.team), CombatTeam([ElementalInitializer.make_random(max(1, level), rng=rng)])
+
+
+GENERATORS = {
+    'collectors': collectors,
+    'adventurers': adventurers,
+    'wild': wild,
+}
+
+
+class SimulationResult:
+    def __init__(self):
+        self.num_battles = 0
+        self.num_rounds = 0
+        self.num_unfinished = 0  # Battles that stopped while waiting for a move.
+        self.num_errors = 0
+        self.error_seeds = []  # The seeds of the battles that raised an error, to replay them.
+        self.side_a_wins = 0
+        self.side_b_wins = 0
+        self.seconds = 0  # Time spent in battles, excluding team generation.
+        self.setup_seconds = 0
+        self.phase_seconds = {}  # {phase: seconds}, only if phases were timed.
+
+    def report(self) -> str:
+        lines = [f"{self.num_battles} battles in {self.seconds + self.setup_seconds:.2f} s"]
+        if self.num_battles == 0:
+            return lines[0]
+        finished = self.num_battles - self.num_unfinished - self.num_errors
+        lines += [f"battles/sec:    {self.num_battles / self.seconds:.1f} (excluding team generation)",
+                  f"rounds/battle:  {self.num_rounds / self.num_battles:.1f}",
+                  f"rounds/sec:     {self.num_rounds / self.seconds:.1f}",
+                  f"side A wins:    {self.side_a_wins / max(1, finished):.1%}",
+                  f"side B wins:    {self.side_b_wins / max(1, finished):.1%}",
+                  f"unfinished:     {self.num_unfinished}",
+                  f"errors:         {self.num_errors}"]
+        if self.error_seeds:
+            lines.append(f"error seeds:    {' '.join(str(seed) for seed in self.error_seeds[:5])}")
+        lines.append(f"phase           total s    ms/battle   share")
+        phases = dict(self.phase_seconds)
+        if phases:
+            phases['other'] = max(0.0, self.seconds - sum(phases.values()))
+        phases['team generation'] = self.setup_seconds
+        total = self.seconds + self.setup_seconds
+        for phase, seconds in sorted(phases.items(), key=lambda item: -item[1]):
+            lines.append(f"{phase:<24} {seconds:>8.3f} {seconds / self.num_battles * 1000:>10.3f} "
+                         f"{seconds / total:>7.1%}")
+        return '\n'.join(lines)
+
+
+class BattleSimulator:
+    def __init__(self,
+                 generate: Callable[[random.Random], Tuple[CombatTeam, CombatTeam]],
+                 time_phases=False,
+                 seed: int = None,
+                 make_ai: Callable[[CombatTeam, Combat], CombatAI] = None):
+        """
+        :param generate: Makes the two CombatTeams of a battle with the given random.Random.
+        :param time_phases: Measure time per engine phase. Wrapping the engine's methods slows it down.
+        :param seed: Picks the seed of each battle, which both its teams and the battle itself are generated from.
+        :param make_ai: Makes the AI of each team. See Combat.
+        """
+        self.generate = generate
+        self.time_phases = time_phases
+        self.make_ai = make_ai
+        self.data_manager = NullDataManager()
+        self.rng = random.Random(seed)
+
+    def run(self, num_battles: int) -> SimulationResult:
+        result = SimulationResult()
+        timer = PhaseTimer()
+        if self.time_phases:
+            instrument(timer)
+        try:
+            # Combat prints a line for every battle.
+            with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+                for i in range(num_battles):
+                    self._run_battle(result)
+        finally:
+            timer.restore()
+        result.phase_seconds = dict(timer.seconds)
+        return result
+
+    def _run_battle(self, result: SimulationResult) -> None:
+        seed = self.rng.getrandbits(32)
+        start = time.perf_counter()
+        team_a, team_b = self.generate(random.Random(seed))
+        result.setup_seconds += time.perf_counter() - start
+        result.num_battles += 1
+        start = time.perf_counter()
+        try:
+            # NPC battles play out entirely inside the constructor.
+            combat = Combat([team_a], [team_b], data_manager=self.data_manager, seed=seed, make_ai=self.make_ai)
+        except Exception:
+            result.num_errors += 1
+            result.error_seeds.append(seed)
+            if result.num_errors == 1:
+                traceback.print_exc(file=sys.stderr)
+            return
+        finally:
+            result.seconds += time.perf_counter() - start
+        result.num_rounds += combat.num_rounds
+        if combat.in_progress:
+            result.num_unfinished += 1
+        elif team_a in combat.winning_side:
+            result.side_a_wins += 1
+        elif team_b in combat.winning_side:
+            result.side_b_wins += 1
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run NPC vs NPC battles headlessly and report engine throughput.")
+    parser.add_argument('--battles', type=int, default=200)
+    parser.add_argument('--generator', choices=sorted(GENERATORS), default='collectors',
+                        help="How the two teams of each battle are made.")
+    parser.add_argument('--min-level', type=int, default=5)
+    parser.add_argument('--max-level', type=int, default=30)
+    parser.add_argument('--min-team-size', type=int, default=1)
+    parser.add_argument('--max-team-size', type=int, default=4)
+    parser.add_argument('--phases', action='store_true', help="Report time per engine phase.")
+    parser.add_argument('--seed', type=int, default=None)
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    generator = GENERATORS[args.generator]
+    simulator = BattleSimulator(lambda rng: generator(args, rng), time_phases=args.phases, seed=args.seed)
+    print(simulator.run(args.battles).report())
@@ -0,0 +1,155 @@
+"""
+Plays full AI vs AI battles between every pair of species, at several levels, across a pool of processes,
+and writes each pair's win rate and battle length to a CSV.
+Run from the repository root, eg.
+    python -m src.simulation.matchup_matrix --battles 1000 --levels 10 30 50 --output matchups.csv
+Results depend only on --seed, not on the number of processes.
+"""
+import argparse
+import csv
+import time
+from itertools import product
+from multiprocessing import Pool
+from typing import List, NamedTuple
+
+from src.elemental.elemental_factory import ElementalInitializer
+from src.simulation.battle_simulator import BattleSimulator
+from src.team.combat_team import CombatTeam
+
+
+class Matchup(NamedTuple):
+    level: int
+    species_a: str
+    species_b: str
+    num_battles: int
+    seed: int
+
+
+class MatchupResult(NamedTuple):
+    level: int
+    species_a: str
+    species_b: str
+    num_battles: int
+    a_wins: int
+    b_wins: int
+    draws: int
+    unfinished: int  # Battles that stopped without a winner, eg. waiting for a move.
+    errors: int
+    total_rounds: int
+
+    @property
+    def a_win_rate(self) -> float:
+        return self.a_wins / self.num_battles
+
+    @property
+    def average_rounds(self) -> float:
+        return self.total_rounds / self.num_battles
+
+
+CSV_HEADER = ['level', 'species_a', 'species_b', 'battles', 'a_win_rate', 'b_win_rate', 'draw_rate',
+              'unfinished', 'errors', 'average_rounds']
+
+
+def make_matchups(species: List[str], levels: List[int], num_battles: int, seed: int) -> List[Matchup]:
+    """
+    One task per pair of species and level. Each gets its own seed, derived from its position,
+    so that a task plays the same battles no matter which process runs it.
+    """
+    matchups = []
+    for i, (level, species_a, species_b) in enumerate(product(levels, species, species)):
+        matchups.append(Matchup(level, species_a, species_b, num_battles, seed * 1000003 + i))
+    return matchups
+
+
+def play(matchup: Matchup) -> MatchupResult:
+    """
+    Play every battle of a matchup. Runs in a worker process.
+    """
+    species_a = ElementalInitializer.NAME_MAP[matchup.species_a]
+    species_b = ElementalInitializer.NAME_MAP[matchup.species_b]
+
+    def generate(rng):
+        return (CombatTeam([ElementalInitializer.make(species_a, matchup.level, rng)]),
+                CombatTeam([ElementalInitializer.make(species_b, matchup.level, rng)]))
+
+    result = BattleSimulator(generate, seed=matchup.seed).run(matchup.num_battles)
+    draws = (result.num_battles - result.side_a_wins - result.side_b_wins
+             - result.num_unfinished - result.num_errors)
+    return MatchupResult(matchup.level,
+                         matchup.species_a,
+                         matchup.species_b,
+                         result.num_battles,
+                         result.side_a_wins,
+                         result.side_b_wins,
+                         draws,
+                         result.num_unfinished,
+                         result.num_errors,
+                         result.num_rounds)
+
+
+def run_matchups(matchups: List[Matchup], processes: int = None) -> List[MatchupResult]:
+    """
+    :param processes: The size of the process pool. All cores if None; 1 plays everything in this process.
+    :return: The results in the same order as matchups.
+    """
+    if processes == 1:
+        return [play(matchup) for matchup in matchups]
+    with Pool(processes) as pool:
+        return pool.map(play, matchups, chunksize=1)
+
+
+def write_csv(results: List[MatchupResult], path: str) -> None:
+    with open(path, 'w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(CSV_HEADER)
+        for result in results:
+            writer.writerow([result.level,
+                             result.species_a,
+                             result.species_b,
+                             result.num_battles,
+                             f'{result.a_win_rate:.4f}',
+                             f'{result.b_wins / result.num_battles:.4f}',
+                             f'{result.draws / result.num_battles:.4f}',
+                             result.unfinished,
+                             result.errors,
+                             f'{result.average_rounds:.2f}'])
+
+
+def format_matrix(results: List[MatchupResult], level: int) -> str:
+    """
+    :return: A table of species A's win rate (rows) against species B (columns) at one level.
+    """
+    results = [result for result in results if result.level == level]
+    species = list(dict.fromkeys(result.species_a for result in results))
+    win_rates = {(result.species_a, result.species_b): result.a_win_rate for result in results}
+    lines = [f"Level {level} win rate of row vs column",
+             ' ' * 10 + ''.join(f'{name[:8]:>9}' for name in species)]
+    for species_a in species:
+        lines.append(f'{species_a[:10]:<10}' + ''.join(f'{win_rates[(species_a, species_b)]:>9.0%}'
+                                                       for species_b in species))
+    return '\n'.join(lines)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Play every species against every other and export win rates.")
+    parser.add_argument('--battles', type=int, default=200, help="Battles per pair of species and level.")
+    parser.add_argument('--levels', type=int, nargs='+', default=[10, 30, 50])
+    parser.add_argument('--species', nargs='+', default=[species.name for species in ElementalInitializer.ALL_SPECIES],
+                        choices=sorted(ElementalInitializer.NAME_MAP))
+    parser.add_argument('--processes', type=int, default=None, help="Worker processes. All cores by default.")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='matchups.csv')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    matchups = make_matchups(args.species, args.levels, args.battles, args.seed)
+    start = time.perf_counter()
+    results = run_matchups(matchups, args.processes)
+    seconds = time.perf_counter() - start
+    write_csv(results, args.output)
+    num_battles = sum(result.num_battles for result in results)
+    print(f"{num_battles} battles in {seconds:.1f} s ({num_battles / seconds:.0f}/s). Wrote {args.output}.")
+    for level in args.levels:
+        print(format_matrix(results, level))
@@ -0,0 +1,262 @@
+"""
+Plays AI controllers against each other across a pool of processes, and reports how often each wins and how much
+CPU its decisions cost.
+Every pair of controllers plays the same seeded battles twice, swapping sides, and both sides of a battle get the same
+team, so that neither the teams nor the side decide the result.
+Run from the repository root, eg.
+    python -m src.simulation.tournament --battles 2000 --controllers random normal hard
+    python -m src.simulation.tournament --battles 2000 --controllers random policy --policy policy.bin
+Results of random and policy depend only on --seed, not on the number of processes. Controllers that search on a
+time budget, eg. normal and hard, choose by how much they search in that time, so their results also depend on how
+fast and busy the machine is, as decision times do.
+"""
+import argparse
+import math
+import random
+import statistics
+import sys
+import time
+from itertools import combinations
+from multiprocessing import Pool
+from typing import Dict, List, NamedTuple, Tuple
+
+from src.character.npc.npc_initializer import NPCInitializer
+from src.combat.combat_ai import CombatAI
+from src.combat.difficulty import Difficulty
+from src.combat.policy import PolicyTable
+from src.combat.search_ai import make_ai
+from src.simulation.battle_simulator import BattleSimulator
+from src.team.combat_team import CombatTeam
+
+
+class Controller(NamedTuple):
+    """
+    How make_ai is told which AI plays a team. A new AI is compared by adding it to make_ai and here.
+    """
+    difficulty: Difficulty
+    use_policy: bool = False
+
+
+CONTROLLERS = {
+    'random': Controller(Difficulty.EASY),
+    'policy': Controller(Difficulty.EASY, use_policy=True),
+    'normal': Controller(Difficulty.NORMAL),
+    'hard': Controller(Difficulty.HARD),
+}
+
+
+class Match(NamedTuple):
+    args: argparse.Namespace  # Team generation options, and the policy file.
+    controller_a: str
+    controller_b: str
+    num_battles: int  # Per side, so twice as many battles are played.
+    seed: int
+
+
+class MatchResult(NamedTuple):
+    controller_a: str
+    controller_b: str
+    num_battles: int
+    a_wins: int
+    b_wins: int
+    draws: int
+    unfinished: int  # Battles that stopped without a winner, eg. waiting for a move.
+    errors: int
+    total_rounds: int
+    decision_seconds: Dict[str, List[float]]  # {controller: [seconds per decision]}
+
+    @property
+    def num_decided(self) -> int:
+        return self.a_wins + self.b_wins
+
+
+class DecisionTimer:
+    """
+    Times the decisions of the AIs it makes. Pass make_ai to the battles. Decisions made on copies of the battle,
+    eg. during a search, count towards the decision that made the copies.
+    """
+
+    def __init__(self):
+        self.controllers = {}  # {id(CombatTeam): controller}. Only the decisions of these teams are timed.
+        self.seconds = {}  # {controller: [seconds per decision]}
+
+    def make_ai(self, combat_team, combat) -> CombatAI:
+        ai = make_ai(combat_team, combat)
+        controller = self.controllers.get(id(combat_team))
+        if controller is not None:
+            decide = ai.decide
+
+            def timed_decide():
+                start = time.perf_counter()
+                move = decide()
+                self.seconds.setdefault(controller, []).append(time.perf_counter() - start)
+                return move
+
+            ai.decide = timed_decide
+        return ai
+
+
+def make_team(args, controller: Controller, policy: PolicyTable, rng: random.Random) -> CombatTeam:
+    npc = NPCInitializer.collector(rng)
+    npc.generate_random_team(min_level=args.min_level,
+                             max_level=args.max_level,
+                             min_team_size=args.min_team_size,
+                             max_team_size=args.max_team_size)
+    team = CombatTeam.from_team(npc.team)
+    team.difficulty = controller.difficulty
+    if controller.use_policy:
+        team.policy = policy
+    return team
+
+
+def play(match: Match) -> MatchResult:
+    """
+    Play a match's battles from both sides. Runs in a worker process.
+    :raises ValueError: If a controller follows the policy, but args.policy doesn't name its file.
+    """
+    args = match.args
+    uses_policy = any(CONTROLLERS[controller].use_policy for controller in [match.controller_a, match.controller_b])
+    if uses_policy and not args.policy:
+        raise ValueError("The policy controller needs the PolicyTable file it follows.")
+    policy = PolicyTable.load(args.policy) if uses_policy else None
+    a_wins = b_wins = draws = unfinished = errors = total_rounds = 0
+    timer = DecisionTimer()
+    for a_on_side_a in [True, False]:
+        side_a, side_b = ((match.controller_a, match.controller_b) if a_on_side_a
+                          else (match.controller_b, match.controller_a))
+
+        def generate(rng):
+            # Both teams are generated from the same seed, so they're the same.
+            team_seed = rng.getrandbits(32)
+            team_a = make_team(args, CONTROLLERS[side_a], policy, random.Random(team_seed))
+            team_b = make_team(args, CONTROLLERS[side_b], policy, random.Random(team_seed))
+            timer.controllers = {id(team_a): side_a, id(team_b): side_b}
+            return team_a, team_b
+
+        # The same seed from each side, so that the same battles are played.
+        result = BattleSimulator(generate, seed=match.seed, make_ai=timer.make_ai).run(match.num_battles)
+        a_wins += result.side_a_wins if a_on_side_a else result.side_b_wins
+        b_wins += result.side_b_wins if a_on_side_a else result.side_a_wins
+        draws += (result.num_battles - result.side_a_wins - result.side_b_wins
+                  - result.num_unfinished - result.num_errors)
+        unfinished += result.num_unfinished
+        errors += result.num_errors
+        total_rounds += result.num_rounds
+    return MatchResult(match.controller_a,
+                       match.controller_b,
+                       match.num_battles * 2,
+                       a_wins,
+                       b_wins,
+                       draws,
+                       unfinished,
+                       errors,
+                       total_rounds,
+                       timer.seconds)
+
+
+def make_matches(args, controllers: List[str], num_battles: int, battles_per_task: int, seed: int) -> List[Match]:
+    """
+    Every pair of controllers, split into tasks. Each task gets its own seed, derived from its position within the
+    pair, so that it plays the same battles no matter which process runs it, and each pair plays the same battles.
+    """
+    matches = []
+    for controller_a, controller_b in dict.fromkeys(combinations(controllers, 2)):
+        for i, start in enumerate(range(0, num_battles, battles_per_task)):
+            matches.append(Match(args,
+                                 controller_a,
+                                 controller_b,
+                                 min(battles_per_task, num_battles - start),
+                                 seed * 1000003 + i))
+    return matches
+
+
+def run_matches(matches: List[Match], processes: int = None) -> List[MatchResult]:
+    """
+    :param processes: The size of the process pool. All cores if None; 1 plays everything in this process.
+    :return: One result per pair of controllers, with the results of its tasks added up.
+    """
+    if processes == 1:
+        results = [play(match) for match in matches]
+    else:
+        with Pool(processes) as pool:
+            results = pool.map(play, matches, chunksize=1)
+    merged = {}  # {(controller A, controller B): MatchResult}
+    for result in results:
+        pair = (result.controller_a, result.controller_b)
+        if pair not in merged:
+            merged[pair] = result._replace(decision_seconds={})
+        else:
+            total = merged[pair]
+            merged[pair] = total._replace(**{field: getattr(total, field) + getattr(result, field)
+                                             for field in ['num_battles', 'a_wins', 'b_wins', 'draws', 'unfinished',
+                                                           'errors', 'total_rounds']})
+        for controller, seconds in result.decision_seconds.items():
+            merged[pair].decision_seconds.setdefault(controller, []).extend(seconds)
+    return list(merged.values())
+
+
+def wilson_interval(successes: int, trials: int, z=1.96) -> Tuple[float, float]:
+    """
+    :return: The confidence interval of a rate, 95% by default. Unlike the normal approximation, it stays within
+    [0, 1] and holds up for rates near 0 or 1.
+    """
+    if trials == 0:
+        return 0.0, 1.0
+    rate = successes / trials
+    denominator = 1 + z * z / trials
+    centre = (rate + z * z / (2 * trials)) / denominator
+    margin = z * math.sqrt(rate * (1 - rate) / trials + z * z / (4 * trials * trials)) / denominator
+    return max(0.0, centre - margin), min(1.0, centre + margin)
+
+
+def format_results(results: List[MatchResult]) -> str:
+    lines = ["Win rate of A over the battles either side won, with its 95% confidence interval",
+             f"{'A':<8} {'B':<8} {'battles':>8} {'A wins':>7} {'95% CI':>15} {'draws':>6} {'unfinished':>10} "
+             f"{'errors':>6} {'rounds':>7}"]
+    for result in results:
+        low, high = wilson_interval(result.a_wins, result.num_decided)
+        lines.append(f"{result.controller_a:<8} {result.controller_b:<8} {result.num_battles:>8} "
+                     f"{result.a_wins / max(1, result.num_decided):>7.1%} {f'{low:.1%} - {high:.1%}':>15} "
+                     f"{result.draws:>6} {result.unfinished:>10} {result.errors:>6} "
+                     f"{result.total_rounds / max(1, result.num_battles):>7.1f}")
+    seconds = {}  # {controller: [seconds per decision]}
+    for result in results:
+        for controller, decisions in result.decision_seconds.items():
+            seconds.setdefault(controller, []).extend(decisions)
+    lines += ["", f"{'controller':<10} {'decisions':>10} {'decisions/s':>12} {'p50 ms':>8} {'p99 ms':>8}"]
+    for controller, decisions in seconds.items():
+        decisions = sorted(decisions)
+        lines.append(f"{controller:<10} {len(decisions):>10} {len(decisions) / max(sum(decisions), 1e-9):>12.0f} "
+                     f"{statistics.median(decisions) * 1000:>8.3f} "
+                     f"{decisions[int(len(decisions) * 0.99)] * 1000:>8.3f}")
+    return '\n'.join(lines)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Play AI controllers against each other and compare them.")
+    parser.add_argument('--battles', type=int, default=1000, help="Battles per pair of controllers and side.")
+    parser.add_argument('--controllers', nargs='+', default=['random', 'normal'], choices=sorted(CONTROLLERS))
+    parser.add_argument('--policy', default=None, help="The PolicyTable file of the policy controller.")
+    parser.add_argument('--min-level', type=int, default=5)
+    parser.add_argument('--max-level', type=int, default=30)
+    parser.add_argument('--min-team-size', type=int, default=1)
+    parser.add_argument('--max-team-size', type=int, default=4)
+    parser.add_argument('--battles-per-task', type=int, default=50)
+    parser.add_argument('--processes', type=int, default=None, help="Worker processes. All cores by default.")
+    parser.add_argument('--seed', type=int, default=0)
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    if len(args.controllers) < 2:
+        sys.exit("Name at least two controllers; a controller can be named twice to play itself.")
+    if 'policy' in args.controllers and not args.policy:
+        sys.exit("The policy controller needs --policy, the PolicyTable file it follows.")
+    matches = make_matches(args, args.controllers, args.battles, args.battles_per_task, args.seed)
+    start = time.perf_counter()
+    results = run_matches(matches, args.processes)
+    seconds = time.perf_counter() - start
+    num_battles = sum(result.num_battles for result in results)
+    print(f"{num_battles} battles in {seconds:.1f} s ({num_battles / seconds:.0f}/s).")
+    print(format_results(results))
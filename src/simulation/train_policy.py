@@ -0,0 +1,162 @@
+"""
+Trains the PolicyTable that PvE opponents follow, by playing the engine against itself across a pool of processes.
+Every move of a self-play battle is a sample: each choice the team had is played out on copies of the battle, the
+way SearchAI does, and the choices of each state are ranked by their average score.
+Run from the repository root, eg.
+    python -m src.simulation.train_policy --battles 2000 --generator wild --output policy.bin
+Results depend only on --seed, not on the number of processes.
+"""
+import argparse
+import math
+import os
+import random
+import time
+from multiprocessing import Pool
+from typing import Dict, List, NamedTuple
+
+from src.combat.combat_ai import CombatAI, Move
+from src.combat.policy import PolicyKey, PolicyTable, rank_choices
+from src.combat.search_ai import SearchAI
+from src.simulation.battle_simulator import BattleSimulator, GENERATORS
+
+
+class TrainingTask(NamedTuple):
+    args: argparse.Namespace  # Passed to the team generator.
+    num_battles: int
+    seed: int
+
+
+class PolicyTrainer:
+    """
+    Samples every move NPC teams make while battles are played. Pass make_ai to the battles, so that their teams get
+    SamplingAIs.
+    """
+
+    def __init__(self, rollouts_per_choice: int, seed: int = None):
+        self.rollouts_per_choice = rollouts_per_choice
+        self.rng = random.Random(seed)  # Seeds the rollouts.
+        self.totals = {}  # {PolicyKey: {choice: [total score, number of rollouts]}}
+        self.num_samples = 0
+        self.num_failed_rollouts = 0
+
+    def make_ai(self, combat_team, combat) -> 'SamplingAI':
+        """
+        Replaces search_ai.make_ai in the battles being sampled. Rollouts play copies of a battle with plain CombatAIs,
+        so their moves aren't sampled.
+        """
+        return SamplingAI(combat_team, combat, self)
+
+    def sample(self, combat_team, combat) -> None:
+        """
+        Play out each choice the team has on copies of the battle, and add up their scores.
+        """
+        if combat_team.active_elemental.is_knocked_out or combat.is_awaiting_knockout_replacements():
+            return
+        moves = {ability.name: Move(ability=ability) for ability in combat_team.active_elemental.available_abilities}
+        if combat_team.can_switch and combat_team.eligible_bench:
+            # Decided on a copy, so that the real battle's rolls aren't used up.
+            clone = combat.clone()
+            moves[PolicyTable.SWITCH] = CombatAI(clone.teams[combat.teams.index(combat_team)], clone).decide_switch()
+        if len(moves) <= 1:
+            return
+        search = SearchAI(combat_team, combat, budget=math.inf)
+        team_index = combat.teams.index(combat_team)
+        choices = self.totals.setdefault(PolicyTable.key(combat_team, combat), {})
+        self.num_samples += 1
+        for choice, move in moves.items():
+            for i in range(self.rollouts_per_choice):
+                try:
+                    score = search.rollout(move, team_index, self.rng.getrandbits(32), deadline=math.inf)
+                except Exception:
+                    self.num_failed_rollouts += 1
+                    continue
+                total = choices.setdefault(choice, [0.0, 0])
+                total[0] += score
+                total[1] += 1
+
+
+class SamplingAI(CombatAI):
+    """
+    Makes CombatAI's moves, after having a PolicyTrainer sample the choices the team has.
+    """
+
+    def __init__(self, combat_team, combat, trainer: PolicyTrainer):
+        super().__init__(combat_team, combat)
+        self.trainer = trainer
+
+    def pick_move(self) -> None:
+        self.trainer.sample(self.team, self.combat)
+        super().pick_move()
+
+
+def train(task: TrainingTask) -> Dict[PolicyKey, Dict[str, List[float]]]:
+    """
+    Play a task's battles and sample their moves. Runs in a worker process.
+    :return: PolicyTrainer.totals
+    """
+    generator = GENERATORS[task.args.generator]
+    trainer = PolicyTrainer(task.args.rollouts, seed=task.seed)
+    simulator = BattleSimulator(lambda rng: generator(task.args, rng), seed=task.seed, make_ai=trainer.make_ai)
+    simulator.run(task.num_battles)
+    return trainer.totals
+
+
+def make_tasks(args, num_battles: int, battles_per_task: int, seed: int) -> List[TrainingTask]:
+    """
+    Each task gets its own seed, derived from its position, so that it plays the same battles no matter which process
+    runs it.
+    """
+    tasks = []
+    for i, start in enumerate(range(0, num_battles, battles_per_task)):
+        tasks.append(TrainingTask(args, min(battles_per_task, num_battles - start), seed * 1000003 + i))
+    return tasks
+
+
+def run_tasks(tasks: List[TrainingTask], processes: int = None) -> Dict[PolicyKey, Dict[str, List[float]]]:
+    """
+    :param processes: The size of the process pool. All cores if None; 1 plays everything in this process.
+    :return: The totals of every task, added up.
+    """
+    if processes == 1:
+        results = [train(task) for task in tasks]
+    else:
+        with Pool(processes) as pool:
+            results = pool.map(train, tasks, chunksize=1)
+    totals = {}
+    for result in results:
+        for key, choices in result.items():
+            merged = totals.setdefault(key, {})
+            for choice, (score, count) in choices.items():
+                total = merged.setdefault(choice, [0.0, 0])
+                total[0] += score
+                total[1] += count
+    return totals
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Train the NPC policy table by self-play.")
+    parser.add_argument('--battles', type=int, default=1000)
+    parser.add_argument('--generator', choices=sorted(GENERATORS), default='wild',
+                        help="How the two teams of each battle are made.")
+    parser.add_argument('--min-level', type=int, default=3)
+    parser.add_argument('--max-level', type=int, default=30)
+    parser.add_argument('--min-team-size', type=int, default=1)
+    parser.add_argument('--max-team-size', type=int, default=4)
+    parser.add_argument('--rollouts', type=int, default=8, help="Rollouts per choice of each sampled move.")
+    parser.add_argument('--min-samples', type=int, default=4, help="Rollouts a choice needs to be ranked.")
+    parser.add_argument('--battles-per-task', type=int, default=20)
+    parser.add_argument('--processes', type=int, default=None, help="All cores by default.")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='policy.bin')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    start = time.perf_counter()
+    totals = run_tasks(make_tasks(args, args.battles, args.battles_per_task, args.seed), args.processes)
+    policy = rank_choices(totals, min_samples=args.min_samples)
+    policy.save(args.output)
+    print(f"Ranked the choices of {len(policy)} states from {args.battles} battles in "
+          f"{time.perf_counter() - start:.1f} s, and saved them to {args.output} "
+          f"({os.path.getsize(args.output) / 1024:.1f} KiB).")
@@ -1,9 +1,12 @@
-from typing import List
+from collections import deque
+from typing import List, Tuple
 
 from src.character.inventory import ItemSlot
 from src.combat.actions.casting import Casting
 from src.combat.actions.combat_actions import Switch, Action, UseItem
 from src.combat.actions.elemental_action import ElementalAction
+from src.combat.difficulty import Difficulty
+from src.core.cloning import get_clone, shallow_clone
 from src.core.elements import Elements
 from src.core.targetable_interface import Targetable
 from src.elemental.ability.ability import Ability
@@ -11,6 +14,7 @@ from src.elemental.ability.queueable import Castable
 from src.elemental.combat_elemental import CombatElemental
 from src.elemental.elemental import Elemental
 from src.elemental.status_effect.status_effect import StatusEffect
+from src.elemental.status_effect.status_effect_collection import StatusEffectCollection
 from src.team.team import Team
 
 
@@ -21,6 +25,8 @@ class CombatTeam(Targetable):
     TODO entering combat should fail if all Elementals have been knocked out.
     """
 
+    MAX_ACTIONS_KEPT = 20
+
     def __init__(self,
                  elementals: List[Elemental],
                  owner=None):
@@ -31,14 +37,31 @@ class CombatTeam(Targetable):
         self.__elementals = [CombatElemental(elemental, self) for elemental in elementals]
         self.owner = owner
         self.__active_elemental = None
-        self._status_effects = []  # Team-wide status effects, eg. weather.
-        self._actions = []  # list[Action] taken by this team.
+        self._status_effects = StatusEffectCollection()  # Team-wide status effects, eg. weather.
+        self._actions = deque(maxlen=CombatTeam.MAX_ACTIONS_KEPT)  # The most recent Actions taken by this team.
         self.side = None  # Str. The side of the battlefield this CombatTeam is on.
+        self.difficulty = Difficulty.EASY  # How well the AI plays this team, if it's an NPC team.
+        self.policy = None  # PolicyTable. Followed instead of random moves if the difficulty doesn't search.
         self.logger = None  # Later set by Combat.
         self.exp_earned = 0  # Counts how much experience was earned this battle.
         self.gold_earned = 0
         self._items_earned = {}  # {item_name: ItemSlot}
 
+    def clone(self, clones: dict) -> 'CombatTeam':
+        """
+        See Combat.clone(). The copy has no owner, so it plays like a wild team.
+        """
+        team = shallow_clone(self, clones)
+        team.owner = None
+        team.combat = get_clone(self.combat, clones)
+        team.logger = team.combat.turn_logger if team.combat else None
+        team.__elementals = [get_clone(elemental, clones) for elemental in self.__elementals]
+        team.__active_elemental = get_clone(self.__active_elemental, clones)
+        team._status_effects = self._status_effects.clone(clones)
+        team._actions = deque(self._actions, maxlen=CombatTeam.MAX_ACTIONS_KEPT)
+        team._items_earned = {}
+        return team
+
     @staticmethod
     def from_team(team: Team) -> 'CombatTeam':
         """
@@ -76,6 +99,13 @@ class CombatTeam(Targetable):
         """
         return self.__elementals.copy()
 
+    @property
+    def elemental_status(self) -> Tuple[bool, ...]:
+        """
+        :return: Which elementals on the team have not been knocked out.
+        """
+        return tuple([not elemental.is_knocked_out for elemental in self.__elementals])
+
     @property
     def active_elemental(self) -> CombatElemental:
         return self.__active_elemental
@@ -106,7 +136,14 @@ class CombatTeam(Targetable):
         """
         :return: A list of team-targeting status effects (as opposed to forwarding the active elemental's).
         """
-        return list(self._status_effects)
+        return self._status_effects.as_list()
+
+    @property
+    def status_effects_snapshot(self) -> Tuple[StatusEffect, ...]:
+        """
+        :return: The same tuple for as long as no team effect is added or removed.
+        """
+        return self._status_effects.as_tuple()
 
     @property
     def is_npc(self) -> bool:
@@ -286,7 +323,7 @@ class CombatTeam(Targetable):
         effect.target = self
         if effect.applier == self.active_elemental:
             effect.boost_turn_duration()
-        self._status_effects.append(effect)
+        self._status_effects.add(effect)
         effect.on_effect_start()
         self.append_recent_log(effect.application_recap)
 
@@ -345,4 +382,4 @@ class CombatTeam(Targetable):
         Check if an equivalent StatusEffect is already on this CombatTeam, by type.
         :return The StatusEffect if it exists, None if not.
         """
-        return next((effect for effect in self._status_effects if type(effect) is type(to_check)), None)
+        return self._status_effects.find(type(to_check))
@@ -6,7 +6,6 @@ from discord.ext.commands import Bot
 
 from src.character.inventory import ItemSlot, Item
 from src.character.player import Player
-from src.combat.battle_manager import BattleManager
 from src.combat.combat import Combat
 from src.combat.event import EventLog
 from src.core.constants import *
@@ -47,6 +46,7 @@ class BattleView(Form):
         self.combat = options.combat_team.combat
         self.logger = self.combat.turn_logger
         self.log_index = self.logger.most_recent_index
+        self.logger.mark_rendered(self.combat_team, self.log_index)
 
     async def render(self) -> None:
         await self._clear_reactions()
@@ -67,6 +67,7 @@ class BattleView(Form):
         await self._render_main()
 
     async def _check_waiting(self) -> None:
+        await self.combat.wait_for_npcs()
         previous_names = None
         while self.combat.is_awaiting_request(self.player):
             player_names = ', '.join([player.nickname for player in self.combat.awaiting_team_owners()])
@@ -96,6 +97,7 @@ class BattleView(Form):
         for turn_log in turn_logs:
             await self._render_events(turn_log)
         self.log_index = self.logger.most_recent_index
+        self.logger.mark_rendered(self.combat_team, self.log_index)
 
     async def _render_current(self) -> None:
         """
@@ -125,7 +127,8 @@ class BattleView(Form):
             is_enemy_action = log.acting_team.side != self.combat_team.side
             recap = f"{'<Enemy> ' if is_enemy_action else ''}{log.recap}"
             message = ''.join([battlefield, f'```{recap}```'])
-            await self._display(message)
+            # Not waited for: if the message falls behind, the recaps it missed are skipped.
+            await self._display(message, wait=False)
             await asyncio.sleep(1.5)
 
     async def check_add_options(self) -> None:
@@ -477,7 +480,7 @@ class BattleResults(Form):
 
     async def pick_option(self, reaction: str) -> None:
         if self.player.can_battle and reaction == FIGHT:
-            combat_team = BattleManager().create_pve_combat(self.player)
+            combat_team = self.bot.battle_manager.create_pve_combat(self.player)
             view_options = BattleViewOptions(
                 self.bot,
                 self.player,
@@ -61,22 +61,24 @@ class Form:
         """
         raise NotImplementedError
 
-    async def _display(self, message: str) -> None:
+    async def _display(self, message: str, wait=True) -> None:
         """
         Helper method to edit the discord message if one exists, or set a message if not.
+        Edits go through the bot's RenderQueue, which skips the ones superseded while held back by rate limits.
         :param message: The message body.
+        :param wait: Wait until the message shows this body, or until a newer body replaces it.
         """
         if self.discord_message:
-            try:
-                await self.bot.edit_message(self.discord_message, message)
-            except discord.errors.NotFound:
-                self.discord_message = await self.bot.send_message(
-                    self.discord_message.channel,
-                    message
-                )
+            shown = self.bot.render_queue.submit(self.discord_message, message, on_resend=self._on_resend)
+            if wait:
+                await shown
         else:
             self.discord_message = await self.bot.say(message)
 
+    def _on_resend(self, discord_message: discord.Message) -> None:
+        # The message was deleted, so the body was sent as a new one.
+        self.discord_message = discord_message
+
     async def _add_reactions(self, reactions: List[str]) -> None:
         for reaction in reactions:
             if not await self._add_reaction(reaction):
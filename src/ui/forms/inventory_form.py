@@ -7,7 +7,6 @@ from discord.ext.commands import Bot
 from src.character.inventory import Item, ItemSlot
 from src.character.player import Player
 from src.core.constants import BACK
-from src.data.data_manager import DataManager
 from src.elemental.elemental import Elemental
 from src.items.consumables import Consumable
 from src.items.item import ItemTypes
@@ -158,6 +157,6 @@ class UseItemView(ValueForm):
                 await self.render()
 
     def _save(self) -> None:
-        data_manager = DataManager()
-        data_manager.update_inventory(self.player)
-        data_manager.update_elemental(self.recently_affected_elemental)
+        data_manager = self.bot.data_manager
+        data_manager.queue_inventory(self.player)
+        data_manager.queue_elemental(self.recently_affected_elemental)
@@ -1,9 +1,7 @@
 import discord
 from discord.ext.commands import Bot
 
-from src.combat.battle_manager import BattleManager
 from src.core.constants import *
-from src.data.data_manager import DataManager
 from src.shop.general_shop import GeneralShop
 from src.ui.forms.battle import BattleViewOptions, BattleView
 from src.ui.forms.form import FormOptions, Form
@@ -67,7 +65,7 @@ class MainMenu(Form):
         await StatusView(options).show()
 
     async def _show_fight(self) -> None:
-        combat_team = BattleManager().create_pve_combat(self.player)
+        combat_team = self.bot.battle_manager.create_pve_combat(self.player)
         options = BattleViewOptions(self.bot,
                                     self.player,
                                     combat_team,
@@ -77,7 +75,7 @@ class MainMenu(Form):
     async def _show_summon(self) -> None:
         options = SummonMenuOptions(self.bot,
                                     self.player,
-                                    DataManager(),
+                                    self.bot.data_manager,
                                     self.discord_message,
                                     self)
         await SummonMenu(options).show()
@@ -93,7 +91,7 @@ class MainMenu(Form):
     async def _show_versus(self) -> None:
         options = VersusFormOptions(self.bot,
                                     self.player,
-                                    DataManager(),
+                                    self.bot.data_manager,
                                     self.discord_message.server,
                                     self.discord_message,
                                     self)
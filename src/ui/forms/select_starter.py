@@ -2,7 +2,6 @@ from typing import List
 
 from src.core.constants import OK
 from src.core.elements import Elements
-from src.data.data_manager import DataManager
 from src.elemental.elemental_factory import ElementalInitializer
 from src.elemental.species.mithus import Mithus
 from src.elemental.species.rainatu import Rainatu
@@ -85,7 +84,7 @@ class SelectStarterView(ValueForm):
         starter = self._selected_value
         elemental = ElementalInitializer.make(starter, level=self.player.level)
         self.player.add_elemental(elemental)
-        data_manager = DataManager()
-        data_manager.update_player(self.player)
-        data_manager.update_elemental(elemental)
+        data_manager = self.bot.data_manager
+        data_manager.queue_player(self.player)
+        data_manager.queue_elemental(elemental)
         await Form.from_form(self, StatusView)
@@ -4,7 +4,6 @@ import discord
 from discord.ext.commands import Bot
 
 from src.core.constants import BUY
-from src.data.data_manager import DataManager
 from src.shop.shop import Shop, ShopItemSlot
 from src.ui.forms.form import ValueForm, FormOptions, Form
 
@@ -82,9 +81,9 @@ class ShopView(ValueForm):
         for selected_item in self._selected_values:
             self.shop.buy(selected_item, self.player)
         self.toggled = []
-        data_manager = DataManager()
-        data_manager.update_player(self.player)
-        data_manager.update_inventory(self.player)
+        data_manager = self.bot.data_manager
+        data_manager.queue_player(self.player)
+        data_manager.queue_inventory(self.player)
         await self.render()
 
     async def pick_option(self, reaction: str):
@@ -5,7 +5,6 @@ from discord.ext.commands import Bot
 
 from src.core.constants import *
 from src.core.elements import Elements
-from src.data.data_manager import DataManager
 from src.elemental.ability.abilities.defend import Defend
 from src.elemental.ability.ability import Ability
 from src.elemental.attribute.attribute import Attribute
@@ -87,7 +86,7 @@ class StatusView(ValueForm):
     async def _select_leader(self) -> None:
         elemental = self._selected_value
         self.player.team.set_leader(elemental)
-        DataManager().update_player(self.player)  # TODO patch
+        self.bot.data_manager.queue_player(self.player)
         self._selecting_leader_mode = False
         await self.render()
 
@@ -173,8 +172,7 @@ class StatusDetailView(Form):
         await self.render()
 
     def _save(self) -> None:
-        # TODO patch
-        DataManager().update_elemental(self.elemental)
+        self.bot.data_manager.queue_elemental(self.elemental)
 
     @property
     def _view(self) -> str:
@@ -396,8 +394,7 @@ class SwitchAbilityView(ValueForm):
         return self._num_selections == self._elemental.max_active_abilities
 
     def _save(self) -> None:
-        data_manager = DataManager()
-        data_manager.update_elemental(self._elemental)
+        self.bot.data_manager.queue_elemental(self._elemental)
 
 
 class AttributesView(ValueForm):
@@ -451,8 +448,7 @@ class AttributesView(ValueForm):
         await self.render()
 
     def _save(self) -> None:
-        data_manager = DataManager()
-        data_manager.update_elemental(self.elemental)
+        self.bot.data_manager.queue_elemental(self.elemental)
 
     @property
     def _view(self) -> str:
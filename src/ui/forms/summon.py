@@ -95,8 +95,8 @@ class SummonMenu(ValueForm):
         player.inventory.remove_item(ManaShard(), SHARDS_TO_SUMMON)
         elemental = ElementalInitializer.make_random(player.level, player.elementals, self._selected_element)
         player.add_elemental(elemental)
-        self.data_manager.update_player(self.player)
-        self.data_manager.update_elemental(elemental)
+        self.data_manager.queue_player(self.player)
+        self.data_manager.queue_elemental(elemental)
 
     @property
     def _selected_element(self) -> Elements:
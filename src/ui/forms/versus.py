@@ -5,7 +5,6 @@ import discord
 from discord.ext.commands import Bot
 
 from src.character.player import Player
-from src.combat.battle_manager import BattleManager
 from src.core.constants import FIGHT, CANCEL
 from src.data.data_manager import DataManager
 from src.team.team import Team
@@ -35,22 +34,42 @@ class VersusForm(ValueForm):
         super().__init__(options)
         self.server = options.server
         self.data_manager = options.data_manager
-        self.other_players = self._init_other_players()
+        self.other_players = []  # Loaded when rendered, since players who were evicted are loaded from storage.
 
-    def _init_other_players(self) -> List[Player]:
+    async def _get_other_players(self) -> List[Player]:
+        """
+        Take opponents from the server's ranking in order of level, rather than looking up every member.
+        """
+        max_options = len(ValueForm.ENUMERATED_REACTIONS)
         players = []
-        for user in self.server.members:
-            other_player = self.data_manager.get_player(user)
-            if self._is_valid_opponent(other_player):
-                players.append(other_player)
-        return sorted(players)
+        offset = 0
+        while len(players) < max_options:
+            ids = self.data_manager.guilds.top(self.server.id, max_options, offset)
+            if not ids:
+                break
+            offset += len(ids)
+            # Players evicted from the cache are loaded at the same time.
+            for other_player in await asyncio.gather(*[self._get_ranked_player(id) for id in ids]):
+                if self._is_valid_opponent(other_player) and len(players) < max_options:
+                    players.append(other_player)
+        return players
+
+    async def _get_ranked_player(self, id: str) -> Player or None:
+        player = self.data_manager.players.get(id)
+        if player:
+            return player
+        member = self.server.get_member(id)
+        if member is None:
+            self.data_manager.guilds.remove(self.server.id, id)  # They left the server.
+            return None
+        return await self.data_manager.aget_player(member)  # They were evicted from the cache.
 
     @property
     def values(self) -> List[Player]:
-        max_options = len(ValueForm.ENUMERATED_REACTIONS)
-        return self.other_players[:max_options]
+        return self.other_players
 
     async def render(self) -> None:
+        self.other_players = await self._get_other_players()
         await self._display(self._view)
         await self._clear_reactions()
         for button in self.buttons:
@@ -161,7 +180,7 @@ class ChallengeForm(Form):
         if not self.is_waiting_to_start:
             return
         self.is_waiting_to_start = False
-        BattleManager.create_duel(self.player, self.opponent)
+        self.bot.battle_manager.create_duel(self.player, self.opponent)
         await self._show_fight_start(self.player)
         await self._show_fight_start(self.opponent)
 
@@ -0,0 +1,175 @@
+import asyncio
+import time
+from typing import Callable
+
+import discord
+from discord.ext.commands import Bot
+
+
+class RateLimitBucket:
+    """
+    A token bucket for the requests to one channel: up to capacity requests at once, refilled at capacity requests
+    per period.
+    """
+
+    def __init__(self, capacity: int, period: float):
+        self.capacity = capacity
+        self.period = period
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    @property
+    def is_full(self) -> bool:
+        """
+        :return: True if the bucket has refilled since it was last used, so it's the same as a new one.
+        """
+        self._refill()
+        return self._tokens >= self.capacity
+
+    def delay(self) -> float:
+        """
+        :return: Seconds until a request can be made; 0 if one can be made now.
+        """
+        self._refill()
+        if self._tokens >= 1:
+            return 0
+        return (1 - self._tokens) * self.period / self.capacity
+
+    async def acquire(self) -> None:
+        """
+        Wait until a request can be made, and count it.
+        """
+        delay = self.delay()
+        while delay > 0:
+            await asyncio.sleep(delay)
+            delay = self.delay()
+        self._tokens -= 1
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.capacity / self.period)
+        self._updated = now
+
+
+class Frame:
+    """
+    A message body waiting to be shown.
+    """
+
+    def __init__(self,
+                 discord_message: discord.Message,
+                 content: str,
+                 on_resend: Callable[[discord.Message], None] = None):
+        """
+        :param on_resend: Called with the new message if the old one was deleted, and the frame was sent as a new one.
+        """
+        self.discord_message = discord_message
+        self.content = content
+        self.on_resend = on_resend
+        # True once shown, or False if it was superseded or couldn't be sent.
+        self.shown = asyncio.get_running_loop().create_future()
+
+    def set_shown(self, shown: bool) -> None:
+        if not self.shown.done():  # Whoever was waiting may have stopped.
+            self.shown.set_result(shown)
+
+
+class RenderQueue:
+    """
+    Edits Discord messages within each channel's rate limit, instead of leaving edits to queue up behind it.
+    Only the latest frame of a message is kept while waiting to edit it: frames superseded in the meantime are
+    dropped, so a message that falls behind jumps to the current state instead of replaying old ones.
+    """
+    EDITS_PER_PERIOD = 5
+    PERIOD_SECONDS = 5.0
+
+    def __init__(self,
+                 bot: Bot,
+                 edits_per_period=EDITS_PER_PERIOD,
+                 period=PERIOD_SECONDS):
+        """
+        :param edits_per_period: Edits allowed per channel in each period, before edits are held back.
+        :param period: Seconds.
+        """
+        self.bot = bot
+        self.edits_per_period = edits_per_period
+        self.period = period
+        self._pending = {}  # {message id: Frame} The latest frame of each message waiting to be shown.
+        self._senders = {}  # {message id: asyncio.Task} Sending the frames of a message, one at a time.
+        self._buckets = {}  # {channel id: RateLimitBucket} Dropped once full again, every period at most.
+        self._last_bucket_sweep = time.monotonic()
+        self.num_sent = 0
+        self.num_dropped = 0  # Frames superseded before they were sent.
+        self.num_failed = 0
+
+    def submit(self,
+               discord_message: discord.Message,
+               content: str,
+               on_resend: Callable[[discord.Message], None] = None) -> asyncio.Future:
+        """
+        Show a new body in a message as soon as its channel's rate limit allows, replacing any frame still waiting.
+        Must be called from the event loop.
+        :param on_resend: See Frame.
+        :return: Frame.shown. Awaiting it waits for the rate limit, but not for the frames of other messages.
+        """
+        frame = Frame(discord_message, content, on_resend)
+        superseded = self._pending.get(discord_message.id)
+        if superseded:
+            self.num_dropped += 1
+            superseded.set_shown(False)
+        self._pending[discord_message.id] = frame
+        if discord_message.id not in self._senders:
+            self._senders[discord_message.id] = asyncio.ensure_future(self._send(discord_message.id))
+        if time.monotonic() - self._last_bucket_sweep >= self.period:
+            self._drop_idle_buckets()
+        return frame.shown
+
+    @property
+    def num_pending(self) -> int:
+        return len(self._pending)
+
+    @property
+    def num_buckets(self) -> int:
+        return len(self._buckets)
+
+    async def _send(self, message_id: str) -> None:
+        try:
+            while message_id in self._pending:
+                bucket = self._get_bucket(self._pending[message_id].discord_message)
+                await bucket.acquire()
+                # The frame may have been superseded while waiting.
+                await self._edit(self._pending.pop(message_id))
+        finally:
+            self._senders.pop(message_id, None)
+
+    async def _edit(self, frame: Frame) -> None:
+        shown = False
+        try:
+            try:
+                await self.bot.edit_message(frame.discord_message, frame.content)
+            except discord.errors.NotFound:
+                discord_message = await self.bot.send_message(frame.discord_message.channel, frame.content)
+                if frame.on_resend:
+                    frame.on_resend(discord_message)
+            self.num_sent += 1
+            shown = True
+        except Exception as e:
+            # Eg. an HTTPException, or a connection error or timeout from aiohttp. The next frame may still get through.
+            print(f"Couldn't update a message: {e!r}")
+            self.num_failed += 1
+        finally:
+            frame.set_shown(shown)
+
+    def _drop_idle_buckets(self) -> None:
+        """
+        Forget channels whose bucket has refilled, which a new bucket would be the same as, so that channels that
+        were edited once don't stay in memory.
+        """
+        self._buckets = {channel_id: bucket for channel_id, bucket in self._buckets.items() if not bucket.is_full}
+        self._last_bucket_sweep = time.monotonic()
+
+    def _get_bucket(self, discord_message: discord.Message) -> RateLimitBucket:
+        channel_id = discord_message.channel.id
+        if channel_id not in self._buckets:
+            self._buckets[channel_id] = RateLimitBucket(self.edits_per_period, self.period)
+        return self._buckets[channel_id]
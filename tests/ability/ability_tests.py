@@ -11,6 +11,7 @@ from src.elemental.ability.abilities.fireball import Fireball
 from src.elemental.ability.abilities.razor_fangs import RazorFangs
 from src.elemental.ability.abilities.reap import Reap
 from src.elemental.ability.damage_calculator import DamageCalculator
+from src.elemental.combat_elemental import CombatElemental
 from src.elemental.status_effect.status_effects.bleeds import RendEffect
 from src.elemental.status_effect.status_effects.burns import Burn
 from tests.elemental.elemental_builder import CombatElementalBuilder
@@ -115,6 +116,24 @@ class AbilityTests(unittest.TestCase):
         bonus = Cyclone().get_bonus_multiplier(Mock(), elemental)
         self.assertGreater(bonus, 1, error)
 
+    def test_cyclone_bonus_uncapped(self):
+        error = "Cyclone's bonus stopped growing once its uses outnumbered the actions kept"
+        elemental = CombatElementalBuilder().build()
+        elemental.add_action(ElementalAction(actor=elemental, ability=Defend(), combat=self.get_mocked_combat()))
+        num_uses = CombatElemental.MAX_ACTIONS_KEPT + 5
+        for i in range(num_uses):
+            elemental.add_action(ElementalAction(actor=elemental, ability=Cyclone(), combat=self.get_mocked_combat()))
+        bonus = Cyclone().get_bonus_multiplier(Mock(), elemental)
+        self.assertEqual(bonus, 1 + 0.25 * num_uses, error)
+
+    def test_cyclone_streak_broken(self):
+        error = "Cyclone's bonus counted uses from before another ability"
+        elemental = CombatElementalBuilder().build()
+        for ability in [Cyclone(), Cyclone(), Defend(), Cyclone()]:
+            elemental.add_action(ElementalAction(actor=elemental, ability=ability, combat=self.get_mocked_combat()))
+        elemental.add_action(Mock(spec=[]))  # An action without an ability, eg. a switch, doesn't break the streak.
+        self.assertEqual(Cyclone().get_bonus_multiplier(Mock(), elemental), 1.5, error)
+
     @staticmethod
     def get_mocked_combat() -> Combat:
         combat = Combat([], [], data_manager=Mock())
@@ -0,0 +1,79 @@
+import unittest
+
+from src.core.elements import Elements, Category
+from src.elemental.ability.damage_calculator import DamageCalculator
+from src.elemental.elemental_factory import ElementalInitializer
+from src.elemental.status_effect.status_effects.defend import DefendEffect
+from tests.ability.ability_builder import AbilityBuilder
+from tests.elemental.elemental_builder import CombatElementalBuilder
+
+try:
+    import numpy
+    from src.elemental.ability.batch_damage_calculator import BatchDamageCalculator
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class BatchDamageCalculatorTests(unittest.TestCase):
+
+    def _calculations(self, level: int) -> list:
+        """
+        :return: [(target, actor, damage_source)] for every species' damaging abilities and status effects
+        against every species, half of them defending.
+        """
+        calculations = []
+        for i, species in enumerate(ElementalInitializer.ALL_SPECIES):
+            actor = CombatElementalBuilder().with_elemental(ElementalInitializer.make(species, level)).build()
+            sources = [ability for ability in actor.abilities]
+            sources += [ability.status_effect for ability in actor.abilities if ability.status_effect]
+            for opponent in ElementalInitializer.ALL_SPECIES:
+                target = CombatElementalBuilder().with_elemental(ElementalInitializer.make(opponent, level)).build()
+                if i % 2:
+                    target.add_status_effect(DefendEffect())
+                calculations += [(target, actor, source) for source in sources]
+        return calculations
+
+    def test_matches_calculator(self):
+        error = "Batch damage didn't match DamageCalculator"
+        for level in [1, 20, 60]:
+            calculations = self._calculations(level)
+            batch = BatchDamageCalculator.from_calculations(calculations)
+            final_damage = batch.calculate()
+            for i, calculation in enumerate(calculations):
+                calculator = DamageCalculator(*calculation)
+                self.assertEqual(final_damage[i], calculator.calculate(), error)
+                self.assertEqual(batch.damage_blocked[i], calculator.damage_blocked, error)
+                self.assertEqual(batch.is_effective[i], calculator.is_effective, error)
+                self.assertEqual(batch.is_resisted[i], calculator.is_resisted, error)
+
+    def test_minimum_damage(self):
+        error = "Batch damage below 1 wasn't raised to 1"
+        ability = AbilityBuilder().with_attack_power(1).with_category(Category.PHYSICAL).build()
+        target = CombatElementalBuilder().build()
+        target.add_status_effect(DefendEffect())
+        batch = BatchDamageCalculator.from_calculations([(target, CombatElementalBuilder().build(), ability)])
+        self.assertEqual(batch.calculate()[0], 1, error)
+
+    def test_no_damage(self):
+        error = "A batch row with no attack power did damage"
+        ability = AbilityBuilder().with_attack_power(0).with_element(Elements.EARTH).build()
+        target = CombatElementalBuilder().with_element(Elements.WIND).build()
+        batch = BatchDamageCalculator.from_calculations([(target, CombatElementalBuilder().build(), ability)])
+        self.assertEqual(batch.calculate()[0], 0, error)
+        self.assertFalse(batch.is_effective[0], error)
+
+    def test_scalar_arguments(self):
+        error = "Scalar arguments weren't shared by every row"
+        batch = BatchDamageCalculator(actor_base_damage=[10, 20],
+                                      actor_physical_att=10,
+                                      actor_magic_att=10,
+                                      actor_element=Elements.FIRE.value,
+                                      target_physical_def=10,
+                                      target_magic_def=10,
+                                      target_damage_reduction=0,
+                                      target_element=Elements.EARTH.value,
+                                      attack_power=10,
+                                      category=Category.PHYSICAL.value,
+                                      element=Elements.NONE.value)
+        self.assertEqual(list(batch.calculate()), [10, 20], error)
@@ -0,0 +1,205 @@
+"""
+Measures DataManager under concurrent load against an in-memory backend with simulated latency and throttling.
+Run from the repository root, eg.
+    python -m tests.benchmark_data_manager --latency 0.01 --concurrency 32
+Judge persistence changes by comparing the numbers before and after.
+"""
+import argparse
+import asyncio
+import random
+import time
+from typing import List
+
+from src.data.data_manager import DataManager
+from src.data.memory_backend import MemoryBackend
+from src.elemental.attribute.attribute_factory import AttributeFactory
+from src.elemental.elemental import Elemental
+from src.elemental.elemental_factory import ElementalInitializer
+
+
+class BenchmarkUser:
+    """
+    Stands in for a discord.User.
+    """
+
+    def __init__(self, id: int):
+        self.id = f'user-{id}'
+        self.name = f'User {id}'
+
+
+def make_elemental(level: int) -> Elemental:
+    """
+    Like ElementalInitializer.make, but of a random species.
+    """
+    species = random.choice(ElementalInitializer.SUMMONABLE_SPECIES)
+    elemental = Elemental(species, AttributeFactory.create_random())
+    elemental.level_to(level)
+    return elemental
+
+
+class Result:
+    def __init__(self, name: str):
+        self.name = name
+        self.latencies = []  # Seconds per operation.
+        self.seconds = 0  # Wall time of the whole run.
+        self.num_calls = 0  # Storage requests made during the run.
+
+    def __str__(self) -> str:
+        num_ops = len(self.latencies)
+        latencies = sorted(self.latencies)
+        p50 = latencies[int(num_ops * 0.5)] * 1000
+        p99 = latencies[min(num_ops - 1, int(num_ops * 0.99))] * 1000
+        return (f"{self.name:<14} {num_ops:>6} ops {num_ops / self.seconds:>9.1f} ops/s "
+                f"p50 {p50:>8.2f} ms  p99 {p99:>8.2f} ms  {self.num_calls / num_ops:>6.2f} calls/op")
+
+
+class DataManagerBenchmark:
+    def __init__(self, args):
+        self.args = args
+        self.backend = MemoryBackend()
+        self.users = [BenchmarkUser(i) for i in range(args.players)]
+        self.non_players = [BenchmarkUser(-i - 1) for i in range(args.guild_size // 2)]
+        self._seed()
+
+    def _seed(self) -> None:
+        """
+        Create every player at full speed; latency and throttling only apply to the measured runs.
+        """
+        data_manager = DataManager(self.backend)
+        for user in self.users:
+            player = data_manager.get_created_player(user)
+            for i in range(self.args.roster):
+                player.add_elemental(make_elemental(random.randint(1, 30)))
+            data_manager.update_player(player)
+            for elemental in player.elementals:
+                data_manager.update_elemental(elemental)
+        data_manager.close()
+        self.backend.latency = self.args.latency
+        self.backend.requests_per_second = self.args.throttle
+
+    def _data_manager(self) -> DataManager:
+        return DataManager(self.backend, max_workers=self.args.workers)
+
+    async def _run(self, name: str, data_manager: DataManager, operations: List) -> Result:
+        """
+        :param operations: Coroutine functions, run with at most args.concurrency in flight.
+        """
+        result = Result(name)
+        semaphore = asyncio.Semaphore(self.args.concurrency)
+
+        async def timed(operation):
+            async with semaphore:
+                start = time.perf_counter()
+                await operation()
+                result.latencies.append(time.perf_counter() - start)
+
+        calls_before = self.backend.num_calls
+        start = time.perf_counter()
+        await asyncio.gather(*[timed(operation) for operation in operations])
+        result.seconds = time.perf_counter() - start
+        result.num_calls = self.backend.num_calls - calls_before
+        data_manager.close()
+        return result
+
+    async def _warm(self, data_manager: DataManager) -> None:
+        for user in self.users:
+            await data_manager.aget_created_player(user)
+
+    async def cold_login(self) -> Result:
+        data_manager = self._data_manager()
+        operations = [lambda user=user: data_manager.aget_created_player(user) for user in self.users]
+        return await self._run('cold login', data_manager, operations)
+
+    async def warm_lookup(self) -> Result:
+        data_manager = self._data_manager()
+        await self._warm(data_manager)
+        operations = [lambda: data_manager.aget_created_player(random.choice(self.users))
+                      for i in range(self.args.operations)]
+        return await self._run('warm lookup', data_manager, operations)
+
+    async def battle_save(self) -> Result:
+        data_manager = self._data_manager()
+        await self._warm(data_manager)
+
+        async def save():
+            player = await data_manager.aget_created_player(random.choice(self.users))
+            player.update_gold(random.randint(1, 10))
+            player.add_exp(random.randint(1, 10))
+            player.team.elementals[0].add_exp(random.randint(1, 10))
+            await data_manager.asave_all(player)
+
+        return await self._run('battle save', data_manager, [save] * self.args.operations)
+
+    async def versus_list(self) -> Result:
+        """
+        Look up every member of a guild, where half of the members never registered.
+        """
+        data_manager = self._data_manager()
+        members = self.users[:self.args.guild_size // 2] + self.non_players
+        random.shuffle(members)
+
+        async def build_list():
+            for member in members:
+                await data_manager.aget_player(member)
+
+        operations = [build_list] * max(1, self.args.operations // len(members))
+        return await self._run('versus list', data_manager, operations)
+
+    async def mix(self) -> Result:
+        """
+        Mostly lookups, with saves, logins and versus lists mixed in, all at once.
+        """
+        data_manager = self._data_manager()
+        logged_in = self.users[:len(self.users) // 2]
+        logging_in = self.users[len(self.users) // 2:]
+        for user in logged_in:
+            await data_manager.aget_created_player(user)
+        members = logged_in[:self.args.guild_size // 2] + self.non_players
+
+        async def login():
+            await data_manager.aget_created_player(logging_in.pop() if logging_in else random.choice(logged_in))
+
+        async def lookup():
+            await data_manager.aget_created_player(random.choice(logged_in))
+
+        async def save():
+            player = await data_manager.aget_created_player(random.choice(logged_in))
+            player.update_gold(1)
+            await data_manager.asave_all(player)
+
+        async def versus():
+            for member in members:
+                await data_manager.aget_player(member)
+
+        weighted = [(login, 5), (lookup, 70), (save, 20), (versus, 5)]
+        operations = random.choices([operation for operation, weight in weighted],
+                                    weights=[weight for operation, weight in weighted],
+                                    k=self.args.operations)
+        return await self._run('mix', data_manager, operations)
+
+    async def run(self) -> None:
+        print(f"{self.args.players} players, {self.args.latency * 1000:.1f} ms latency, "
+              f"throttle {self.args.throttle or 'none'} req/s, concurrency {self.args.concurrency}, "
+              f"{self.args.workers} workers")
+        for scenario in [self.cold_login, self.warm_lookup, self.battle_save, self.versus_list, self.mix]:
+            print(await scenario())
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark DataManager against a simulated database.")
+    parser.add_argument('--players', type=int, default=200, help="Registered players to create.")
+    parser.add_argument('--roster', type=int, default=6, help="Elementals owned by each player.")
+    parser.add_argument('--guild-size', type=int, default=100, help="Members in the guild of the versus list.")
+    parser.add_argument('--operations', type=int, default=1000, help="Operations per scenario.")
+    parser.add_argument('--latency', type=float, default=0.005, help="Seconds per storage request.")
+    parser.add_argument('--throttle', type=float, default=None, help="Most storage requests per second.")
+    parser.add_argument('--concurrency', type=int, default=32, help="Operations in flight at once.")
+    parser.add_argument('--workers', type=int, default=DataManager.MAX_WORKERS, help="DataManager threads.")
+    parser.add_argument('--seed', type=int, default=0)
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    random.seed(args.seed)
+    asyncio.run(DataManagerBenchmark(args).run())
@@ -0,0 +1,85 @@
+"""
+Measures the battle log snapshots that EventLogger keeps for rendering: memory held per battle and time spent
+taking snapshots. Run from the repository root, eg.
+    python -m tests.benchmark_event_logger --battles 200 --seed 0
+"""
+import argparse
+import os
+import random
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+
+from src.combat.combat import Combat
+from src.combat.event import EventLogger
+from src.simulation.battle_simulator import GENERATORS, NullDataManager
+
+LOG_SOURCES = ['*/src/combat/event.py', '*/src/elemental/combat_elemental.py']
+
+
+def play(args, battles: int) -> list:
+    generator = GENERATORS['collectors']
+    combats = []
+    for i in range(battles):
+        team_a, team_b = generator(args)
+        combats.append(Combat([team_a], [team_b], data_manager=NullDataManager()))
+    return combats
+
+
+def measure_memory(args) -> float:
+    """
+    :return: Bytes allocated by logging and still held after each battle, on average.
+    """
+    random.seed(args.seed)
+    tracemalloc.start()
+    combats = play(args, args.battles)
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    filters = [tracemalloc.Filter(True, source) for source in LOG_SOURCES]
+    held = sum(stat.size for stat in snapshot.filter_traces(filters).statistics('filename'))
+    return held / len(combats)
+
+
+def measure_time(args) -> tuple:
+    """
+    :return: Seconds spent making logs per battle, and logs made per battle.
+    """
+    make_log = EventLogger._make_log
+    totals = {'seconds': 0, 'logs': 0}
+
+    def timed(logger, recap, acting_team):
+        start = time.perf_counter()
+        log = make_log(logger, recap, acting_team)
+        totals['seconds'] += time.perf_counter() - start
+        totals['logs'] += 1
+        return log
+
+    random.seed(args.seed)
+    EventLogger._make_log = timed
+    try:
+        play(args, args.battles)
+    finally:
+        EventLogger._make_log = make_log
+    return totals['seconds'] / args.battles, totals['logs'] / args.battles
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the memory and time of battle log snapshots.")
+    parser.add_argument('--battles', type=int, default=200)
+    parser.add_argument('--min-level', type=int, default=5)
+    parser.add_argument('--max-level', type=int, default=30)
+    parser.add_argument('--min-team-size', type=int, default=1)
+    parser.add_argument('--max-team-size', type=int, default=6)
+    parser.add_argument('--seed', type=int, default=0)
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        seconds, num_logs = measure_time(args)
+        held = measure_memory(args)
+    print(f"logs/battle:         {num_logs:.1f}")
+    print(f"snapshot ms/battle:  {seconds * 1000:.3f}")
+    print(f"snapshot us/log:     {seconds / num_logs * 1e6:.2f}")
+    print(f"log KiB/battle:      {held / 1024:.1f}")
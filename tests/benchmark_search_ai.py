@@ -0,0 +1,80 @@
+"""
+Measures how fast SearchAI decides at each difficulty, and how often it beats the EASY AI.
+Run from the repository root, eg.
+    python -m tests.benchmark_search_ai --battles 50 --seed 1
+Side A plays at the difficulty being measured and side B at EASY, with teams made by the collectors generator.
+"""
+import argparse
+import statistics
+import time
+
+from src.combat.difficulty import Difficulty
+from src.combat.search_ai import SearchAI, SEARCH_BUDGETS
+from src.simulation.battle_simulator import BattleSimulator, collectors
+
+
+class DecisionStats:
+    """
+    Times every SearchAI decision, by wrapping SearchAI.decide.
+    """
+
+    def __init__(self):
+        self.seconds = []
+        self.num_rollouts = 0
+        self.num_fallbacks = 0
+        self._original = SearchAI.decide
+
+    def __enter__(self) -> 'DecisionStats':
+        stats = self
+
+        def timed_decide(ai):
+            start = time.perf_counter()
+            move = stats._original(ai)
+            stats.seconds.append(time.perf_counter() - start)
+            stats.num_rollouts += ai.num_rollouts
+            stats.num_fallbacks += ai.fell_back
+            return move
+
+        SearchAI.decide = timed_decide
+        return self
+
+    def __exit__(self, *exc) -> None:
+        SearchAI.decide = self._original
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark SearchAI decisions per difficulty.")
+    parser.add_argument('--battles', type=int, default=30)
+    parser.add_argument('--min-level', type=int, default=10)
+    parser.add_argument('--max-level', type=int, default=30)
+    parser.add_argument('--min-team-size', type=int, default=1)
+    parser.add_argument('--max-team-size', type=int, default=4)
+    parser.add_argument('--seed', type=int, default=0)
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+
+    def generate(rng):
+        team_a, team_b = collectors(args, rng)
+        team_a.difficulty = difficulty
+        return team_a, team_b
+
+    print(f"{'difficulty':<11} {'budget ms':>9} {'decisions/s':>12} {'p50 ms':>8} {'p99 ms':>8} "
+          f"{'rollouts':>9} {'fallbacks':>10} {'A wins':>7}")
+    for difficulty in Difficulty:
+        with DecisionStats() as stats:
+            # The same seed for every difficulty, so that each plays the same teams.
+            result = BattleSimulator(generate, seed=args.seed).run(args.battles)
+        finished = max(1, result.num_battles - result.num_unfinished - result.num_errors)
+        budget = SEARCH_BUDGETS.get(difficulty, 0)
+        if stats.seconds:
+            seconds = sorted(stats.seconds)
+            print(f"{difficulty.name:<11} {budget * 1000:>9.0f} {len(seconds) / sum(seconds):>12.1f} "
+                  f"{statistics.median(seconds) * 1000:>8.2f} {seconds[int(len(seconds) * 0.99)] * 1000:>8.2f} "
+                  f"{stats.num_rollouts / len(seconds):>9.1f} {stats.num_fallbacks / len(seconds):>10.1%} "
+                  f"{result.side_a_wins / finished:>7.1%}")
+        else:
+            print(f"{difficulty.name:<11} {budget * 1000:>9.0f} {'-':>12} {'-':>8} {'-':>8} {'-':>9} {'-':>10} "
+                  f"{result.side_a_wins / finished:>7.1%}")
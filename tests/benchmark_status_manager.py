@@ -0,0 +1,65 @@
+"""
+Measures the cost of reading a CombatElemental's stats as status effects pile up.
+Run from the repository root, eg.
+    python -m tests.benchmark_status_manager --reads 100000
+"Cached" reads are the normal case, between changes to the effects; "summed" reads are the first after a change.
+"""
+import argparse
+import time
+
+from src.elemental.combat_elemental import CombatElemental
+from src.elemental.status_effect.status_effect import StatusEffect
+from tests.elemental.elemental_builder import CombatElementalBuilder
+
+
+class StackingBuff(StatusEffect):
+    def __init__(self):
+        super().__init__()
+        self.can_add_instances = True
+
+    @property
+    def turn_duration(self) -> int:
+        return -1
+
+    @property
+    def speed_stages(self) -> int:
+        return 1
+
+    @property
+    def p_def_stages(self) -> int:
+        return 1
+
+
+def read_stats(elemental: CombatElemental, num_reads: int, invalidate: bool) -> float:
+    """
+    :return: Seconds per read of speed, physical and magic defence and damage reduction.
+    """
+    status_manager = elemental._status_manager
+    start = time.perf_counter()
+    for i in range(num_reads):
+        if invalidate:
+            status_manager.invalidate_stage_totals()
+        elemental.speed
+        elemental.physical_def
+        elemental.magic_def
+        elemental.damage_reduction
+    return (time.perf_counter() - start) / num_reads
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark stat reads against the number of status effects.")
+    parser.add_argument('--reads', type=int, default=20000)
+    parser.add_argument('--effects', type=int, nargs='+', default=[0, 1, 4, 16, 64])
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    print(f"{'effects':>8} {'cached us/read':>15} {'summed us/read':>15}")
+    for num_effects in args.effects:
+        elemental = CombatElementalBuilder().build()
+        for i in range(num_effects):
+            elemental.add_status_effect(StackingBuff())
+        cached = read_stats(elemental, args.reads, invalidate=False)
+        summed = read_stats(elemental, args.reads, invalidate=True)
+        print(f"{num_effects:>8} {cached * 1e6:>15.3f} {summed * 1e6:>15.3f}")
@@ -0,0 +1,125 @@
+import asyncio
+import time
+import unittest
+from contextlib import nullcontext
+from unittest.mock import Mock, patch
+
+from src.combat.ai_scheduler import AIScheduler
+from src.combat.combat import Combat
+from src.combat.combat_ai import Move
+from src.elemental.ability.abilities.claw import Claw
+from src.team.combat_team import CombatTeam
+from tests.character.character_builder import PlayerBuilder
+from tests.elemental.elemental_builder import ElementalBuilder
+
+
+class SlowAI:
+    """
+    Stands in for an AI that takes a while to decide.
+    """
+
+    def __init__(self, seconds: float, error: Exception = None):
+        self.seconds = seconds
+        self.error = error
+
+    def decide(self) -> Move:
+        time.sleep(self.seconds)
+        if self.error:
+            raise self.error
+        return Move(ability=Claw())
+
+
+class AISchedulerTests(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduler = AIScheduler(timeout=1)
+        self.player_team = CombatTeam([ElementalBuilder().build()], PlayerBuilder().build())
+        self.npc_team = CombatTeam([ElementalBuilder().build()])
+
+    def tearDown(self):
+        self.scheduler.close()
+
+    def start_combat(self) -> Combat:
+        # Must be called on the event loop, like BattleManager does.
+        return Combat([self.player_team], [self.npc_team], data_manager=Mock(), ai_scheduler=self.scheduler)
+
+    def play_round(self, ai: SlowAI = None) -> None:
+        """
+        Move for the player, then wait for the NPC's move of the same round.
+        """
+        async def play():
+            combat = self.start_combat()
+            num_rounds = combat.num_rounds
+            with patch.object(combat, 'make_ai', return_value=ai) if ai else nullcontext():
+                self.player_team.make_move(Claw())
+                self.assertEqual(combat.num_rounds, num_rounds, "The NPC moved inline")
+                await combat.wait_for_npcs()
+            self.num_rounds_played = combat.num_rounds - num_rounds
+
+        asyncio.run(play())
+
+    def test_npc_moves(self):
+        error = "The round didn't resolve once the NPC's move was decided off the event loop"
+        self.play_round()
+        self.assertEqual(self.num_rounds_played, 1, error)
+        # The NPC's next move may have been decided too.
+        self.assertGreaterEqual(self.scheduler.num_decisions, 1, error)
+
+    def test_doesnt_block(self):
+        error = "A slow NPC decision blocked the event loop"
+
+        async def longest_stall():
+            combat = self.start_combat()
+            longest = 0
+            with patch.object(combat, 'make_ai', return_value=SlowAI(0.2)):
+                while not all(decision.done() for decision in combat.npc_decisions):
+                    before = time.perf_counter()
+                    await asyncio.sleep(0.01)
+                    longest = max(longest, time.perf_counter() - before - 0.01)
+            return longest
+
+        self.assertLess(asyncio.run(longest_stall()), 0.05, error)
+
+    def test_timeout(self):
+        error = "The NPC didn't fall back on CombatAI when its AI took too long"
+        self.scheduler.timeout = 0.05
+        self.play_round(SlowAI(0.3))
+        self.assertEqual(self.scheduler.num_timeouts, 1, error)
+        self.assertEqual(self.num_rounds_played, 1, error)
+        self.assertLess(self.scheduler.percentile(100), 0.3, error)
+
+    def test_error(self):
+        error = "The NPC didn't fall back on CombatAI when its AI failed"
+        self.play_round(SlowAI(0, error=ValueError()))
+        self.assertGreaterEqual(self.scheduler.num_errors, 1, error)
+        self.assertEqual(self.num_rounds_played, 1, error)
+
+    def test_forfeit_while_deciding(self):
+        error = "A decision was made in a battle that ended while the NPC was deciding"
+
+        async def forfeit():
+            combat = self.start_combat()
+            with patch.object(combat, 'make_ai', return_value=SlowAI(0.1)):
+                await asyncio.sleep(0.02)
+                combat.forfeit(self.player_team)
+                await combat.wait_for_npcs()
+            return combat
+
+        combat = asyncio.run(forfeit())
+        self.assertEqual(self.scheduler.num_discarded, 1, error)
+        self.assertEqual(combat.action_requests, [], error)
+
+    def test_latencies(self):
+        error = "Decision latencies weren't recorded"
+        self.assertIsNone(self.scheduler.percentile(99), error)
+        self.play_round(SlowAI(0.05))
+        self.assertGreaterEqual(len(self.scheduler.latencies), 1, error)
+        self.assertGreaterEqual(self.scheduler.percentile(99), 0.05, error)
+        self.assertLessEqual(self.scheduler.percentile(0), self.scheduler.percentile(99), error)
+
+    def test_summary(self):
+        error = "The decision metrics weren't summarized periodically"
+        with patch.object(AIScheduler, 'SUMMARY_EVERY', 1), patch('builtins.print') as log:
+            self.play_round(SlowAI(0))
+        self.assertGreaterEqual(log.call_count, 1, error)
+        self.assertIn('p99', log.call_args[0][0], error)
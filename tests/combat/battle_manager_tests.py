@@ -0,0 +1,32 @@
+import unittest
+from unittest.mock import Mock
+
+from src.combat.battle_manager import BattleManager
+from src.combat.difficulty import Difficulty
+from tests.character.character_builder import PlayerBuilder
+
+
+class BattleManagerTests(unittest.TestCase):
+
+    def test_difficulty_tiers(self):
+        error = "Random opponents didn't get harder as the player fought more battles"
+        player = PlayerBuilder().build()
+        difficulties = []
+        for battles_fought in [2, 10, 49, 50]:
+            player.battles_fought = battles_fought
+            difficulties.append(BattleManager.get_difficulty(player))
+        self.assertEqual(difficulties, [Difficulty.EASY, Difficulty.NORMAL, Difficulty.NORMAL, Difficulty.HARD], error)
+
+    def test_opponent_difficulty(self):
+        error = "A random opponent didn't get the difficulty of the player's tier"
+        player = PlayerBuilder().build()
+        player.battles_fought = 10
+        player_team = BattleManager(Mock()).create_pve_combat(player)
+        opponent = player_team.combat.get_enemy_side(player_team)[0]
+        self.assertEqual(opponent.difficulty, Difficulty.NORMAL, error)
+
+    def test_tutorial_difficulty(self):
+        error = "A tutorial opponent didn't make random moves"
+        player_team = BattleManager(Mock()).create_pve_combat(PlayerBuilder().build())
+        opponent = player_team.combat.get_enemy_side(player_team)[0]
+        self.assertEqual(opponent.difficulty, Difficulty.EASY, error)
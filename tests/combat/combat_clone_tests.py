@@ -0,0 +1,90 @@
+import unittest
+from unittest.mock import Mock
+
+from src.combat.combat import Combat
+from src.combat.event import NullEventLogger
+from src.elemental.ability.abilities.claw import Claw
+from src.elemental.status_effect.status_effects.bleeds import RendEffect
+from src.team.combat_team import CombatTeam
+from tests.character.character_builder import PlayerBuilder
+from tests.elemental.elemental_builder import ElementalBuilder
+
+
+class CombatCloneTests(unittest.TestCase):
+
+    def setUp(self):
+        self.team_a = CombatTeam([ElementalBuilder().build(), ElementalBuilder().build()], PlayerBuilder().build())
+        self.team_b = CombatTeam([ElementalBuilder().build()], PlayerBuilder().build())
+        self.combat = Combat([self.team_a], [self.team_b], data_manager=Mock())
+
+    @staticmethod
+    def play_round(combat: Combat) -> None:
+        for team in combat.teams:
+            team.make_move(Claw())
+
+    def test_original_unchanged(self):
+        error = "Playing a cloned battle changed the original"
+        hp_before = [elemental.current_hp for elemental in self.combat.side_a_active + self.combat.side_b_active]
+        num_rounds = self.combat.num_rounds
+        num_logs = len(self.combat.turn_logger.logs)
+        clone = self.combat.clone()
+        self.play_round(clone)
+        hp_after = [elemental.current_hp for elemental in self.combat.side_a_active + self.combat.side_b_active]
+        self.assertEqual(hp_before, hp_after, error)
+        self.assertEqual(self.combat.num_rounds, num_rounds, error)
+        self.assertEqual(len(self.combat.turn_logger.logs), num_logs, error)
+
+    def test_same_outcome(self):
+        error = "A cloned battle played differently from the original"
+        clone = self.combat.clone()
+        self.play_round(self.combat)
+        self.play_round(clone)
+        self.assertEqual(clone.side_b_active[0].current_hp, self.combat.side_b_active[0].current_hp, error)
+        self.assertEqual(clone.num_rounds, self.combat.num_rounds, error)
+
+    def test_references_remapped(self):
+        error = "A cloned object still referred to the original battle"
+        clone = self.combat.clone()
+        team = clone.side_a[0]
+        self.assertIsNot(team, self.team_a, error)
+        self.assertIs(team.combat, clone, error)
+        self.assertIs(team.active_elemental, team.elementals[0], error)
+        for elemental in team.elementals:
+            self.assertIs(elemental.team, team, error)
+
+    def test_status_effects_remapped(self):
+        error = "A cloned status effect didn't refer to the cloned target and applier"
+        effect = RendEffect()
+        effect.applier = self.team_b.active_elemental
+        self.team_a.active_elemental.add_status_effect(effect)
+        clone = self.combat.clone()
+        cloned_effect = clone.side_a_active[0].status_effects[0]
+        self.assertIsNot(cloned_effect, effect, error)
+        self.assertIs(cloned_effect.target, clone.side_a_active[0], error)
+        self.assertIs(cloned_effect.applier, clone.side_b_active[0], error)
+
+    def test_pending_requests(self):
+        error = "A move requested before cloning wasn't carried over to the clone"
+        num_rounds = self.combat.num_rounds
+        self.team_a.make_move(Claw())
+        clone = self.combat.clone()
+        clone.side_b[0].make_move(Claw())
+        self.assertEqual(clone.num_rounds, num_rounds + 1, error)
+        self.assertIs(clone.previous_round_actions[0].actor.team.combat, clone, error)
+        self.assertEqual(self.combat.num_rounds, num_rounds, error)
+        self.assertEqual(len(self.combat.action_requests), 1, error)
+
+    def test_detached(self):
+        error = "A cloned battle kept owners or logging"
+        clone = self.combat.clone()
+        self.assertIsInstance(clone.turn_logger, NullEventLogger, error)
+        self.assertIsNone(clone.data_manager, error)
+        for team in clone.teams:
+            self.assertIsNone(team.owner, error)
+            self.assertIs(team.logger, clone.turn_logger, error)
+
+    def test_rng_copied(self):
+        error = "A cloned battle didn't roll the same numbers as the original, or shared its RNG"
+        clone = self.combat.clone()
+        self.assertIsNot(clone.rng, self.combat.rng, error)
+        self.assertEqual(clone.rng.random(), self.combat.rng.random(), error)
@@ -1,9 +1,13 @@
+import random
+import sys
 import unittest
 from unittest.mock import Mock
 
+from src.character.npc.npc_initializer import NPCInitializer
 from src.combat.actions.combat_actions import Switch
 from src.combat.actions.elemental_action import ElementalAction
 from src.combat.combat import Combat
+from src.combat.search_ai import make_ai
 from src.elemental.ability.abilities.claw import Claw
 from src.elemental.ability.abilities.defend import Defend
 from src.elemental.ability.abilities.rampage import Rampage
@@ -257,3 +261,66 @@ class CombatTests(unittest.TestCase):
         combat = get_mocked_combat(team_a)
         combat.forfeit(team_a)
         self.assertFalse(team_a.owner.is_busy, error)
+
+    def test_round_end_knockout(self):
+        error = "Battle didn't end when a side's last elemental was knocked out at the end of a round"
+        team_a = make_combat_team()
+        team_b = make_combat_team()
+        combat = get_mocked_combat(team_a, team_b)
+        team_b.end_round = lambda: team_b.active_elemental.receive_damage(10000, team_a.active_elemental)
+        team_a.make_move(Defend())
+        team_b.make_move(Defend())
+        self.assertFalse(combat.in_progress, error)
+        self.assertIn(team_a, combat.winning_side, error)
+
+    def test_npc_rounds_flat(self):
+        error = "Each round of an NPC battle was played deeper in the stack than the one before it"
+        depths = set()
+
+        def make_counting_ai(team, combat):
+            depth = 0
+            frame = sys._getframe()
+            while frame:
+                depth += 1
+                frame = frame.f_back
+            depths.add(depth)
+            return make_ai(team, combat)
+
+        rng = random.Random(0)
+        teams = []
+        for i in range(2):
+            npc = NPCInitializer.collector(rng)
+            npc.generate_random_team(min_level=5, max_level=10)
+            teams.append(CombatTeam.from_team(npc.team))
+        combat = Combat([teams[0]], [teams[1]], data_manager=Mock(), seed=0, make_ai=make_counting_ai)
+        self.assertGreater(combat.num_rounds, 2, error)
+        self.assertEqual(len(depths), 1, error)
+
+    @staticmethod
+    def play_npc_battle(seed: int) -> Combat:
+        """
+        Generate two NPC teams from the seed and let them play out a battle with it.
+        """
+        rng = random.Random(seed)
+        teams = []
+        for i in range(2):
+            npc = NPCInitializer.collector(rng)
+            npc.generate_random_team(min_level=5, max_level=10)
+            teams.append(CombatTeam.from_team(npc.team))
+        return Combat([teams[0]], [teams[1]], data_manager=Mock(), seed=seed)
+
+    def test_seed_replay(self):
+        error = "Replaying a battle's seed didn't play it out the same way"
+        for seed in range(5):
+            combat = self.play_npc_battle(seed)
+            replay = self.play_npc_battle(seed)
+            recaps = [log.recap for turn_logs in combat.turn_logger.logs for log in turn_logs]
+            replay_recaps = [log.recap for turn_logs in replay.turn_logger.logs for log in turn_logs]
+            self.assertEqual(recaps, replay_recaps, error)
+            self.assertEqual(combat.num_rounds, replay.num_rounds, error)
+
+    def test_seed_recorded(self):
+        error = "A battle without a given seed didn't record the one it picked"
+        combat = get_mocked_combat()
+        self.assertIsNotNone(combat.seed, error)
+        self.assertEqual(combat.rng.random(), random.Random(combat.seed).random(), error)
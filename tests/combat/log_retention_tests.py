@@ -0,0 +1,77 @@
+import gc
+import tracemalloc
+import unittest
+from unittest.mock import Mock
+
+from src.combat.combat import Combat
+from src.combat.event import EventLog, EventLogger, EventRecord
+from src.elemental.ability.abilities.claw import Claw
+from src.team.combat_team import CombatTeam
+from tests.character.character_builder import PlayerBuilder
+from tests.elemental.elemental_builder import ElementalBuilder
+
+
+class LogRetentionTests(unittest.TestCase):
+
+    def setUp(self):
+        self.team_a = CombatTeam([self.get_elemental()], PlayerBuilder().build())
+        self.team_b = CombatTeam([self.get_elemental()], PlayerBuilder().build())
+        self.combat = Combat([self.team_a], [self.team_b], data_manager=Mock())
+        self.logger = self.combat.turn_logger
+
+    @staticmethod
+    def get_elemental():
+        # Enough HP to last for hundreds of rounds.
+        return ElementalBuilder().with_max_hp(10 ** 6).with_current_hp(10 ** 6).build()
+
+    def play_rounds(self, num_rounds: int, viewer=None) -> None:
+        for i in range(num_rounds):
+            self.team_a.make_move(Claw())
+            self.team_b.make_move(Claw())
+            if viewer:
+                self.logger.mark_rendered(viewer, self.logger.most_recent_index)
+
+    def test_compact_rendered(self):
+        error = "Rounds that had been rendered weren't compacted"
+        self.logger.mark_rendered(self.team_a, 0)
+        self.play_rounds(5, viewer=self.team_a)
+        self.assertIsInstance(self.logger.logs[0][0], EventRecord, error)
+        self.assertIn("sent out", self.logger.logs[0][0].recap, error)
+
+    def test_keep_unrendered(self):
+        error = "Rounds that a viewer hadn't rendered yet were compacted"
+        self.logger.mark_rendered(self.team_a, self.logger.most_recent_index)
+        index = self.logger.most_recent_index
+        self.play_rounds(5)
+        for turn_log in self.logger.get_turn_logs(index):
+            for log in turn_log:
+                self.assertIsInstance(log, EventLog, error)
+
+    def test_full_round_cap(self):
+        error = "A viewer that stopped rendering kept every round in full"
+        self.logger.mark_rendered(self.team_a, 0)
+        self.play_rounds(EventLogger.MAX_FULL_ROUNDS + 10)
+        num_full = len([turn_log for turn_log in self.logger.logs if isinstance(turn_log, list)])
+        self.assertLessEqual(num_full, EventLogger.MAX_FULL_ROUNDS + 1, error)
+
+    def test_forget_old_rounds(self):
+        error = "Round indexes changed when old rounds were forgotten"
+        self.play_rounds(EventLogger.MAX_ROUNDS + 20)
+        self.assertEqual(len(self.logger.logs), EventLogger.MAX_ROUNDS, error)
+        index = self.logger.most_recent_index
+        self.play_rounds(1)
+        turn_logs = self.logger.get_turn_logs(index)
+        self.assertEqual(len(turn_logs), 1, error)
+        self.assertIn("used Claw", turn_logs[0][0].recap, error)
+
+    def test_bounded_memory(self):
+        error = "Memory kept growing over a long battle"
+        tracemalloc.start()
+        self.play_rounds(200, viewer=self.team_a)
+        gc.collect()
+        after_200, peak = tracemalloc.get_traced_memory()
+        self.play_rounds(200, viewer=self.team_a)
+        gc.collect()
+        after_400, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        self.assertLess(after_400 - after_200, 20000, error)
@@ -0,0 +1,85 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+from src.combat.combat import Combat
+from src.combat.policy import PolicyAI, PolicyKey, PolicyTable, rank_choices
+from src.combat.search_ai import make_ai
+from src.elemental.ability.abilities.claw import Claw
+from src.elemental.ability.abilities.defend import Defend
+from src.elemental.ability.ability import LearnableAbility
+from src.team.combat_team import CombatTeam
+from tests.character.character_builder import PlayerBuilder
+from tests.elemental.elemental_builder import ElementalBuilder
+from tests.elemental.species_builder import SpeciesBuilder
+
+
+class PolicyTests(unittest.TestCase):
+
+    def setUp(self):
+        species = SpeciesBuilder().with_abilities([LearnableAbility(Claw())]).build()
+        self.team = CombatTeam([ElementalBuilder().with_species(species).build(), ElementalBuilder().build()])
+        self.enemy_team = CombatTeam([ElementalBuilder().build()], PlayerBuilder().build())
+        self.combat = Combat([self.team], [self.enemy_team], data_manager=Mock())
+        self.key = PolicyTable.key(self.team, self.combat)
+
+    def test_key(self):
+        error = "The policy key didn't describe the state of the team"
+        elemental = self.team.active_elemental
+        self.assertEqual(self.key.species, elemental.name, error)
+        self.assertEqual(self.key.abilities, ('Claw', 'Defend'), error)
+        self.assertEqual(self.key.opponent_element, self.enemy_team.active_elemental.element.value, error)
+        self.assertEqual(self.key.hp_bucket, PolicyTable.HP_BUCKETS - 1, error)
+        self.assertEqual(self.key.defend_charges, elemental.defend_charges, error)
+
+    def test_bucket(self):
+        error = "Amounts weren't bucketed evenly"
+        self.assertEqual(PolicyTable.bucket(0, 100, 4), 0, error)
+        self.assertEqual(PolicyTable.bucket(49, 100, 4), 1, error)
+        self.assertEqual(PolicyTable.bucket(100, 100, 4), 3, error)
+        self.assertEqual(PolicyTable.bucket(5, 0, 4), 0, error)
+
+    def test_save_load(self):
+        error = "A policy table didn't load the same as it was saved"
+        policy = PolicyTable({self.key: ('Defend', PolicyTable.SWITCH),
+                              PolicyKey('Tophu', ('Defend', 'Slam'), 4, 0, 3, 0): ('Slam', 'Defend', 'Wait')})
+        path = os.path.join(tempfile.mkdtemp(), 'policy.bin')
+        policy.save(path)
+        self.assertEqual(PolicyTable.load(path).entries, policy.entries, error)
+
+    def test_load_wrong_file(self):
+        error = "A file that isn't a policy table was loaded"
+        path = os.path.join(tempfile.mkdtemp(), 'policy.bin')
+        with open(path, 'wb') as file:
+            file.write(b'not a policy table')
+        with self.assertRaises(ValueError, msg=error):
+            PolicyTable.load(path)
+
+    def test_best_choice(self):
+        error = "The AI didn't make the best available choice of the policy"
+        policy = PolicyTable({self.key: ('Rend', 'Defend', 'Claw')})
+        move = PolicyAI(self.team, self.combat, policy).decide()
+        self.assertIsInstance(move.ability, Defend, error)
+
+    def test_switch_choice(self):
+        error = "The AI didn't switch when the policy said to"
+        policy = PolicyTable({self.key: (PolicyTable.SWITCH,)})
+        move = PolicyAI(self.team, self.combat, policy).decide()
+        self.assertEqual(move.switch_to, 1, error)
+
+    def test_unknown_state(self):
+        error = "The AI didn't fall back on a random ability in a state the policy doesn't know"
+        move = PolicyAI(self.team, self.combat, PolicyTable()).decide()
+        self.assertIn(move.ability, self.team.active_elemental.available_abilities, error)
+
+    def test_make_ai(self):
+        error = "An NPC team with a policy didn't get a PolicyAI"
+        self.team.policy = PolicyTable()
+        self.assertIsInstance(make_ai(self.team, self.combat), PolicyAI, error)
+
+    def test_rank_choices(self):
+        error = "Choices weren't ranked by their average score"
+        totals = {self.key: {'Claw': [3.0, 6], 'Defend': [2.0, 2], 'Wait': [-1.0, 2], 'Rend': [9.0, 1]}}
+        policy = rank_choices(totals, min_samples=2)
+        self.assertEqual(policy.choices(self.key), ('Defend', 'Claw', 'Wait'), error)
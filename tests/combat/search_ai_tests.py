@@ -0,0 +1,84 @@
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from src.combat.combat import Combat
+from src.combat.combat_ai import CombatAI, Move
+from src.combat.difficulty import Difficulty
+from src.combat.search_ai import SearchAI, make_ai
+from src.elemental.ability.abilities.claw import Claw
+from src.elemental.ability.ability import Ability, LearnableAbility
+from src.team.combat_team import CombatTeam
+from tests.character.character_builder import PlayerBuilder
+from tests.elemental.elemental_builder import ElementalBuilder
+from tests.elemental.species_builder import SpeciesBuilder
+
+
+class SearchAITests(unittest.TestCase):
+
+    def setUp(self):
+        # An ability that does nothing, and one that knocks out the enemy.
+        species = SpeciesBuilder().with_abilities([LearnableAbility(Ability()), LearnableAbility(Claw())]).build()
+        elemental = ElementalBuilder().with_species(species).build()
+        self.team = CombatTeam([elemental, ElementalBuilder().build()], PlayerBuilder().build())
+        self.enemy_team = CombatTeam([ElementalBuilder().with_current_hp(1).build()], PlayerBuilder().build())
+        self.combat = Combat([self.team], [self.enemy_team], data_manager=Mock())
+
+    def test_finishing_blow(self):
+        error = "The search didn't pick the move that wins the battle"
+        ai = SearchAI(self.team, self.combat, budget=5, max_rollouts=150)
+        move = ai.decide()
+        self.assertIsInstance(move.ability, Claw, error)
+        self.assertFalse(ai.fell_back, error)
+
+    def test_battle_unchanged(self):
+        error = "Searching for a move changed the battle"
+        hp = self.enemy_team.active_elemental.current_hp
+        num_rounds = self.combat.num_rounds
+        SearchAI(self.team, self.combat, budget=5, max_rollouts=30).decide()
+        self.assertEqual(self.enemy_team.active_elemental.current_hp, hp, error)
+        self.assertEqual(self.combat.num_rounds, num_rounds, error)
+        self.assertEqual(self.combat.action_requests, [], error)
+
+    def test_switch_considered(self):
+        error = "The search didn't consider switching"
+        ai = SearchAI(self.team, self.combat, budget=5, max_rollouts=30)
+        moves = []
+        ai.search = lambda candidates: moves.extend(candidates)
+        ai.decide()
+        self.assertIn(Move(switch_to=1), moves, error)
+
+    def test_fall_back(self):
+        error = "The AI didn't fall back on CombatAI when the budget ran out"
+        ai = SearchAI(self.team, self.combat, budget=0)
+        move = ai.decide()
+        self.assertTrue(ai.fell_back, error)
+        self.assertIn(move.ability, self.team.active_elemental.available_abilities, error)
+
+    def test_budget(self):
+        error = "The search took much longer than its budget"
+        ai = SearchAI(self.team, self.combat, budget=0.05)
+        start = time.perf_counter()
+        ai.decide()
+        self.assertLess(time.perf_counter() - start, 0.5, error)
+
+    def test_make_ai(self):
+        error = "NPC teams didn't get the AI of their difficulty"
+        self.assertIs(type(make_ai(self.team, self.combat)), CombatAI, error)
+        self.team.difficulty = Difficulty.HARD
+        self.assertIsInstance(make_ai(self.team, self.combat), SearchAI, error)
+
+    def test_failed_rollouts(self):
+        error = "Rollouts that raised an error weren't left out and reported once"
+        ai = SearchAI(self.team, self.combat, budget=5, max_rollouts=10)
+
+        def rollout(*args):
+            raise ValueError("Fake failure")
+
+        ai.rollout = rollout
+        with patch('builtins.print') as log:
+            move = ai.decide()
+        self.assertTrue(ai.fell_back, error)
+        self.assertIsNotNone(move, error)
+        self.assertEqual(ai.num_failed_rollouts, 10, error)
+        self.assertEqual(log.call_count, 1, error)
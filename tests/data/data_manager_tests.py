@@ -0,0 +1,303 @@
+import asyncio
+import json
+import threading
+import time
+import unittest
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from src.data.data_manager import DataManager
+from src.data.dynamo_backend import DynamoBackend
+from src.data.dynamo_client import POOL_CONNECTIONS_PER_THREAD
+from src.data.resources import PlayerResource
+from src.elemental.elemental_factory import ElementalInitializer
+from src.elemental.species.mithus import Mithus
+from src.items.consumables import Peach
+from tests.character.user_builder import UserBuilder
+from tests.data.fake_dynamo import FakeDynamoResource
+
+
+def add_player_with_elementals(dynamodb: FakeDynamoResource, num_elementals: int) -> PlayerResource:
+    """
+    Store a player that owns num_elementals Elementals, and return their PlayerResource.
+    """
+    user = UserBuilder().build()
+    ids = []
+    for i in range(num_elementals):
+        elemental = ElementalInitializer.make(Mithus(), level=i % 10 + 1).to_server()
+        elemental['id'] = str(uuid.uuid4())
+        dynamodb.Table('Elementals').put_item(Item=elemental)
+        ids.append(elemental['id'])
+    resource = PlayerResource(id=user.id,
+                              name=user.name,
+                              level=3,
+                              current_exp=0,
+                              gold=5,
+                              battles_fought=0,
+                              team=ids[:4],
+                              elementals=ids,
+                              location=0)
+    dynamodb.Table('Players').put_item(Item=resource._asdict())
+    return resource
+
+
+class DataManagerTests(unittest.TestCase):
+
+    def test_batch_hydration(self):
+        error = "A player's elementals weren't loaded in a single batch request"
+        dynamodb = FakeDynamoResource()
+        add_player_with_elementals(dynamodb, 30)
+        DataManager(DynamoBackend(dynamodb)).get_player(UserBuilder().build())
+        self.assertEqual(dynamodb.batch_get_calls, 1, error)
+        self.assertNotIn('get_item', dynamodb.Table('Elementals').calls, error)
+
+    def test_batch_hydration_limit(self):
+        error = "Loading elementals didn't split into batches of 100 keys"
+        dynamodb = FakeDynamoResource()
+        add_player_with_elementals(dynamodb, 250)
+        player = DataManager(DynamoBackend(dynamodb)).get_player(UserBuilder().build())
+        self.assertEqual(dynamodb.batch_get_calls, 3, error)
+        self.assertEqual(player.num_elementals, 250, error)
+
+    def test_shared_client(self):
+        error = "DynamoDB resources weren't built once per thread"
+        with patch('src.data.dynamo_client._local', threading.local()), \
+                patch('src.data.dynamo_client.boto3.session.Session') as session:
+            session.return_value.resource.side_effect = lambda *args, **kwargs: FakeDynamoResource()
+            first, second = DataManager(), DataManager()
+            self.assertIs(first.backend.dynamodb, second.backend.dynamodb, error)
+            this_thread = first.backend.dynamodb
+            other_thread = ThreadPoolExecutor(max_workers=1).submit(lambda: first.backend.dynamodb).result()
+        self.assertIsNot(other_thread, this_thread, error)
+        self.assertEqual(session.return_value.resource.call_count, 2, error)
+        config = session.return_value.resource.call_args.kwargs['config']
+        self.assertEqual(config.max_pool_connections, POOL_CONNECTIONS_PER_THREAD, error)
+
+    def test_batch_hydration_order(self):
+        error = "Loaded elementals weren't in the same order as the player's roster"
+        dynamodb = FakeDynamoResource()
+        resource = add_player_with_elementals(dynamodb, 30)
+        player = DataManager(DynamoBackend(dynamodb)).get_player(UserBuilder().build())
+        self.assertEqual([elemental.id for elemental in player.elementals], resource.elementals, error)
+        self.assertEqual([elemental.id for elemental in player.team.elementals], resource.team, error)
+
+    def test_batch_hydration_unprocessed(self):
+        error = "Unprocessed keys weren't retried when loading elementals"
+        dynamodb = FakeDynamoResource()
+        dynamodb.unprocessed_responses = 2
+        resource = add_player_with_elementals(dynamodb, 30)
+        player = DataManager(DynamoBackend(dynamodb)).get_player(UserBuilder().build())
+        self.assertEqual(dynamodb.batch_get_calls, 3, error)
+        self.assertEqual([elemental.id for elemental in player.elementals], resource.elementals, error)
+
+    def test_batch_hydration_gives_up(self):
+        error = "Loading elementals didn't fail after running out of retries"
+        dynamodb = FakeDynamoResource()
+        dynamodb.unprocessed_responses = DynamoBackend.MAX_BATCH_RETRIES + 1
+        add_player_with_elementals(dynamodb, 30)
+        data_manager = DataManager(DynamoBackend(dynamodb))
+        with patch.object(DynamoBackend, 'BATCH_BACKOFF_SECONDS', 0):
+            with self.assertRaises(RuntimeError, msg=error):
+                data_manager.get_player(UserBuilder().build())
+
+
+class DeltaSaveTests(unittest.TestCase):
+
+    def setUp(self):
+        self.dynamodb = FakeDynamoResource()
+        add_player_with_elementals(self.dynamodb, 4)
+        self.data_manager = DataManager(DynamoBackend(self.dynamodb))
+        self.player = self.data_manager.get_player(UserBuilder().build())
+        self.full_save_bytes = self._full_save_bytes()
+        for table in self.dynamodb.tables.values():
+            table.calls = []
+            table.bytes_written = 0
+
+    def _full_save_bytes(self) -> int:
+        """
+        :return: What save_all used to send: the player, the inventory and the whole team.
+        """
+        items = [self.player.to_server(), self.player.inventory_to_server()]
+        items += [elemental.to_server() for elemental in self.player.team.elementals]
+        return sum(len(json.dumps(item, default=str)) for item in items)
+
+    def _calls(self, table_name: str) -> list:
+        return self.dynamodb.Table(table_name).calls
+
+    @property
+    def _bytes_written(self) -> int:
+        return sum(table.bytes_written for table in self.dynamodb.tables.values())
+
+    def test_loaded_player_is_clean(self):
+        error = "A player was dirty right after being loaded"
+        self.assertFalse(self.player.has_unsaved_changes, error)
+
+    def test_clean_save(self):
+        error = "Saving a player without changes wrote something"
+        self.data_manager.save_all(self.player)
+        self.assertEqual(self._calls('Players') + self._calls('Inventories') + self._calls('Elementals'), [], error)
+
+    def test_pve_win(self):
+        error = "Saving a PvE win didn't write only what the battle changed"
+        self.player.update_gold(10)
+        self.player.add_exp(5)
+        self.player.team.elementals[0].add_exp(3)
+        self.data_manager.save_all(self.player)
+        self.assertEqual(self._calls('Players'), ['update_item'], error)
+        self.assertEqual(self._calls('Inventories'), [], error)
+        self.assertEqual(self._calls('Elementals'), ['update_item'], error)
+        self.assertLess(self._bytes_written, self.full_save_bytes / 2, error)
+        self.assertFalse(self.player.has_unsaved_changes, error)
+
+    def test_shop_purchase(self):
+        error = "Saving a shop purchase didn't write only the gold and inventory"
+        self.player.update_gold(-1)
+        self.player.add_item(Peach())
+        self.data_manager.save_all(self.player)
+        self.assertEqual(self._calls('Players'), ['update_item'], error)
+        self.assertEqual(self._calls('Inventories'), ['update_item'], error)
+        self.assertEqual(self._calls('Elementals'), [], error)
+        saved = self.dynamodb.Table('Inventories').items[self.player.id]
+        self.assertIn({'name': Peach().name, 'amount': 1}, saved['items'], error)
+
+    def test_rename(self):
+        error = "Renaming an elemental didn't update only its nickname"
+        elemental = self.player.team.elementals[1]
+        elemental.nickname = 'Fluffy'
+        self.data_manager.update_elemental(elemental)
+        self.assertEqual(self._calls('Elementals'), ['update_item'], error)
+        saved = self.dynamodb.Table('Elementals').items[elemental.id]
+        self.assertEqual(saved['nickname'], 'Fluffy', error)
+        self.assertLess(self._bytes_written, len(json.dumps(elemental.to_server())), error)
+
+    def test_several_elementals(self):
+        error = "Several changed elementals weren't written in one batch"
+        for elemental in self.player.team.elementals[:3]:
+            elemental.add_exp(3)
+        self.data_manager.update_team(self.player)
+        self.assertEqual(self._calls('Elementals'), ['batch_writer'], error)
+        self.assertFalse(self.player.has_unsaved_changes, error)
+
+    def test_new_player(self):
+        error = "A new player wasn't written in full"
+        user = UserBuilder().build()
+        user.id = 'new'
+        player = self.data_manager.get_created_player(user)
+        self.assertEqual(self._calls('Players')[-1], 'put_item', error)
+        self.assertEqual(self._calls('Inventories'), ['put_item'], error)
+        self.assertFalse(player.has_unsaved_changes, error)
+
+
+class NonPlayerTests(unittest.TestCase):
+
+    def setUp(self):
+        self.dynamodb = FakeDynamoResource()
+        self.data_manager = DataManager(DynamoBackend(self.dynamodb))
+        self.user = UserBuilder().build()
+
+    def _num_gets(self) -> int:
+        return self.dynamodb.Table('Players').calls.count('get_item')
+
+    def test_repeated_lookups(self):
+        error = "Looking up a user without a profile went to the server more than once"
+        for i in range(10):
+            self.assertIsNone(self.data_manager.get_player(self.user), error)
+        self.assertEqual(self._num_gets(), 1, error)
+        self.assertEqual(self.data_manager.non_players.num_hits, 9, error)
+
+    def test_register(self):
+        error = "A user who registered after being looked up wasn't found"
+        self.data_manager.get_player(self.user)
+        created = self.data_manager.get_created_player(self.user)
+        self.assertEqual(self._num_gets(), 1, error)
+        self.assertNotIn(self.user.id, self.data_manager.non_players, error)
+        self.data_manager.players.remove(self.user.id)
+        self.assertEqual(self.data_manager.get_player(self.user).id, created.id, error)
+
+    def test_expiry(self):
+        error = "A user without a profile wasn't looked up again after the entry expired"
+        self.data_manager.non_players.ttl = 0
+        self.data_manager.get_player(self.user)
+        self.data_manager.get_player(self.user)
+        self.assertEqual(self._num_gets(), 2, error)
+
+
+class AsyncDataManagerTests(unittest.TestCase):
+
+    @staticmethod
+    async def _longest_stall(coroutine) -> float:
+        """
+        Run a coroutine while a heartbeat ticks on the same event loop.
+        :return: The longest time the heartbeat was kept waiting, in seconds.
+        """
+        longest_stall = 0
+        task = asyncio.ensure_future(coroutine)
+        while not task.done():
+            before = time.perf_counter()
+            await asyncio.sleep(0.01)
+            longest_stall = max(longest_stall, time.perf_counter() - before - 0.01)
+        await task
+        return longest_stall
+
+    def test_slow_load_doesnt_block(self):
+        error = "Loading a player from slow storage blocked the event loop"
+        dynamodb = FakeDynamoResource()
+        add_player_with_elementals(dynamodb, 4)
+        dynamodb.set_latency(0.1)
+        data_manager = DataManager(DynamoBackend(dynamodb))
+        stall = asyncio.run(self._longest_stall(data_manager.aget_player(UserBuilder().build())))
+        self.assertLess(stall, 0.05, error)
+
+    def test_slow_save_doesnt_block(self):
+        error = "Saving a player to slow storage blocked the event loop"
+        dynamodb = FakeDynamoResource()
+        add_player_with_elementals(dynamodb, 4)
+        dynamodb.set_latency(0.1)
+        data_manager = DataManager(DynamoBackend(dynamodb))
+        player = data_manager.get_player(UserBuilder().build())
+        player.update_gold(10)
+        stall = asyncio.run(self._longest_stall(data_manager.asave_all(player)))
+        self.assertLess(stall, 0.05, error)
+
+    def test_concurrent_loads(self):
+        error = "Concurrent loads of the same user weren't shared"
+        dynamodb = FakeDynamoResource()
+        add_player_with_elementals(dynamodb, 4)
+        dynamodb.set_latency(0.05)
+        data_manager = DataManager(DynamoBackend(dynamodb))
+        user = UserBuilder().build()
+
+        async def load_many():
+            return await asyncio.gather(*[data_manager.aget_created_player(user) for i in range(5)])
+
+        players = asyncio.run(load_many())
+        self.assertEqual(dynamodb.Table('Players').calls.count('get_item'), 1, error)
+        self.assertTrue(all(player is players[0] for player in players), error)
+
+    def test_concurrent_get_and_create(self):
+        error = "Getting and creating the same player at the same time built two Players"
+        dynamodb = FakeDynamoResource()
+        add_player_with_elementals(dynamodb, 4)
+        dynamodb.set_latency(0.05)
+        data_manager = DataManager(DynamoBackend(dynamodb))
+        user = UserBuilder().build()
+
+        async def load_both():
+            return await asyncio.gather(data_manager.aget_player(user), data_manager.aget_created_player(user))
+
+        player, created_player = asyncio.run(load_both())
+        self.assertIs(player, created_player, error)
+        self.assertEqual(dynamodb.Table('Players').calls.count('get_item'), 1, error)
+
+    def test_close_writes_queued_saves(self):
+        error = "A queued save wasn't written before close() returned"
+        dynamodb = FakeDynamoResource()
+        add_player_with_elementals(dynamodb, 4)
+        dynamodb.set_latency(0.05)
+        data_manager = DataManager(DynamoBackend(dynamodb))
+        player = data_manager.get_player(UserBuilder().build())
+        player.update_gold(100)
+        data_manager.queue_save(player)
+        data_manager.close()
+        self.assertEqual(dynamodb.Table('Players').items[player.id]['gold'], player.gold, error)
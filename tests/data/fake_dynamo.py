@@ -0,0 +1,115 @@
+import json
+import time
+
+
+class FakeTable:
+    """
+    An in-memory stand-in for a boto3 DynamoDB Table, keyed by 'id'.
+    """
+
+    def __init__(self, name: str, latency: float = 0):
+        """
+        :param latency: Seconds that every request blocks for, to imitate a slow network.
+        """
+        self.name = name
+        self.latency = latency
+        self.items = {}  # {id: dict}
+        self.calls = []  # The names of the operations called, in order.
+        self.bytes_written = 0  # Roughly how much data the write requests carried.
+
+    def get_item(self, Key: dict) -> dict:
+        self.calls.append('get_item')
+        time.sleep(self.latency)
+        if Key['id'] in self.items:
+            return {'Item': dict(self.items[Key['id']])}
+        return {}
+
+    def put_item(self, Item: dict) -> None:
+        self.calls.append('put_item')
+        self.count_bytes(Item)
+        time.sleep(self.latency)
+        self.items[Item['id']] = dict(Item)
+
+    def update_item(self,
+                    Key: dict,
+                    UpdateExpression: str,
+                    ExpressionAttributeNames: dict,
+                    ExpressionAttributeValues: dict) -> None:
+        """
+        Supports 'SET #name = :value, ...' expressions only.
+        """
+        self.calls.append('update_item')
+        self.count_bytes([Key, UpdateExpression, ExpressionAttributeNames, ExpressionAttributeValues])
+        time.sleep(self.latency)
+        assert UpdateExpression.startswith('SET '), "Only SET expressions are supported"
+        item = self.items.setdefault(Key['id'], dict(Key))
+        for assignment in UpdateExpression[len('SET '):].split(', '):
+            name, value = assignment.split(' = ')
+            item[ExpressionAttributeNames[name]] = ExpressionAttributeValues[value]
+
+    def count_bytes(self, request) -> None:
+        self.bytes_written += len(json.dumps(request, default=str))
+
+    def batch_writer(self) -> 'FakeBatchWriter':
+        self.calls.append('batch_writer')
+        return FakeBatchWriter(self)
+
+
+class FakeBatchWriter:
+    def __init__(self, table: FakeTable):
+        self.table = table
+
+    def __enter__(self) -> 'FakeBatchWriter':
+        return self
+
+    def __exit__(self, *args) -> None:
+        time.sleep(self.table.latency)
+
+    def put_item(self, Item: dict) -> None:
+        self.table.count_bytes(Item)
+        self.table.items[Item['id']] = dict(Item)
+
+
+class FakeDynamoResource:
+    """
+    An in-memory stand-in for boto3.resource('dynamodb').
+    """
+
+    def __init__(self, latency: float = 0):
+        """
+        :param latency: Seconds that every request blocks for, to imitate a slow network.
+        """
+        self.latency = latency
+        self.tables = {}  # {name: FakeTable}
+        self.batch_get_calls = 0
+        self.unprocessed_responses = 0  # How many of the next BatchGetItem calls leave half of their keys unprocessed.
+
+    def set_latency(self, latency: float) -> None:
+        self.latency = latency
+        for table in self.tables.values():
+            table.latency = latency
+
+    def Table(self, name: str) -> FakeTable:
+        if name not in self.tables:
+            self.tables[name] = FakeTable(name, self.latency)
+        return self.tables[name]
+
+    def batch_get_item(self, RequestItems: dict) -> dict:
+        self.batch_get_calls += 1
+        time.sleep(self.latency)
+        responses = {}
+        unprocessed = {}
+        for table_name, request in RequestItems.items():
+            keys = request['Keys']
+            assert len(keys) <= 100, "BatchGetItem accepts at most 100 keys"
+            ids = [key['id'] for key in keys]
+            assert len(ids) == len(set(ids)), "BatchGetItem rejects duplicate keys"
+            if self.unprocessed_responses > 0:
+                self.unprocessed_responses -= 1
+                unprocessed[table_name] = {'Keys': keys[len(keys) // 2:]}
+                keys = keys[:len(keys) // 2]
+            table = self.Table(table_name)
+            # Like DynamoDB, return the items in an arbitrary order.
+            responses[table_name] = [dict(table.items[key['id']]) for key in reversed(keys)
+                                     if key['id'] in table.items]
+        return {'Responses': responses, 'UnprocessedKeys': unprocessed}
@@ -0,0 +1,69 @@
+import unittest
+
+from src.character.player import Player
+from src.data.guild_index import GuildIndex
+from tests.character.character_builder import PlayerBuilder
+from tests.character.user_builder import UserBuilder
+from tests.elemental.elemental_builder import ElementalBuilder
+
+
+def make_player(id: str, level: int) -> Player:
+    user = UserBuilder().build()
+    user.id = id
+    elemental = ElementalBuilder().with_level(level).build()
+    return PlayerBuilder().with_user(user).with_elementals([elemental]).build()
+
+
+class GuildIndexTests(unittest.TestCase):
+
+    def setUp(self):
+        self.index = GuildIndex()
+        self.players = [make_player(str(level), level) for level in [5, 2, 9, 7]]
+        for player in self.players:
+            self.index.add('guild', player)
+
+    def test_order(self):
+        error = "Players weren't ranked by their team's average level"
+        self.assertEqual(self.index.top('guild', 10), ['2', '5', '7', '9'], error)
+
+    def test_top(self):
+        error = "Couldn't page through a guild's ranking"
+        self.assertEqual(self.index.top('guild', 2), ['2', '5'], error)
+        self.assertEqual(self.index.top('guild', 2, offset=2), ['7', '9'], error)
+
+    def test_other_guild(self):
+        error = "A player showed up in a guild they weren't seen in"
+        self.assertEqual(self.index.top('other guild', 10), [], error)
+
+    def test_combat(self):
+        error = "A player in combat was still ranked"
+        player = self.players[0]
+        player.combat_team = object()
+        self.index.update(player)
+        self.assertNotIn(player.id, self.index.top('guild', 10), error)
+        player.clear_combat()
+        self.index.update(player)
+        self.assertIn(player.id, self.index.top('guild', 10), error)
+
+    def test_team_change(self):
+        error = "A player's ranking didn't follow their team's level"
+        player = self.players[1]
+        player.set_team([ElementalBuilder().with_level(20).build()])
+        self.index.update(player)
+        self.assertEqual(self.index.top('guild', 10)[-1], player.id, error)
+        self.assertEqual(self.index.num_ranked('guild'), 4, error)
+
+    def test_no_elementals(self):
+        error = "A player without elementals was ranked"
+        user = UserBuilder().build()
+        user.id = 'new'
+        player = PlayerBuilder().with_user(user).with_elementals([]).build()
+        self.index.add('guild', player)
+        self.assertNotIn('new', self.index.top('guild', 10), error)
+
+    def test_remove(self):
+        error = "A player who left the guild was still ranked"
+        self.index.remove('guild', '7')
+        self.assertEqual(self.index.top('guild', 10), ['2', '5', '9'], error)
+        self.index.update(self.players[3])
+        self.assertNotIn('7', self.index.top('guild', 10), error)
@@ -0,0 +1,39 @@
+import time
+import unittest
+
+from src.data.memory_backend import MemoryBackend
+from src.data.storage_backend import StorageBackend
+
+
+class MemoryBackendTests(unittest.TestCase):
+
+    def test_update(self):
+        error = "Updating an item didn't keep the attributes that weren't changed"
+        backend = MemoryBackend()
+        backend.put(StorageBackend.PLAYERS, {'id': '1', 'gold': 5, 'level': 3})
+        backend.update(StorageBackend.PLAYERS, '1', {'gold': 10})
+        self.assertEqual(backend.get(StorageBackend.PLAYERS, '1'), {'id': '1', 'gold': 10, 'level': 3}, error)
+
+    def test_count_calls(self):
+        error = "Requests weren't counted"
+        backend = MemoryBackend()
+        backend.batch_put(StorageBackend.ELEMENTALS, [{'id': '1'}, {'id': '2'}])
+        backend.batch_get(StorageBackend.ELEMENTALS, ['1', '2'])
+        backend.get(StorageBackend.ELEMENTALS, '1')
+        self.assertEqual(backend.calls['batch_put'], 1, error)
+        self.assertEqual(backend.num_calls, 3, error)
+
+    def test_latency(self):
+        error = "A request didn't take as long as the latency"
+        backend = MemoryBackend(latency=0.02)
+        start = time.perf_counter()
+        backend.get(StorageBackend.PLAYERS, '1')
+        self.assertGreaterEqual(time.perf_counter() - start, 0.02, error)
+
+    def test_throttle(self):
+        error = "Requests were served faster than the throttle allows"
+        backend = MemoryBackend(requests_per_second=100)
+        start = time.perf_counter()
+        for i in range(5):
+            backend.get(StorageBackend.PLAYERS, '1')
+        self.assertGreaterEqual(time.perf_counter() - start, 0.04, error)
@@ -0,0 +1,163 @@
+import time
+import unittest
+
+from src.character.player import Player
+from src.data.data_manager import DataManager
+from src.data.dynamo_backend import DynamoBackend
+from src.data.player_cache import PlayerCache
+from tests.character.character_builder import PlayerBuilder
+from tests.character.user_builder import UserBuilder
+from tests.data.data_manager_tests import add_player_with_elementals
+from tests.data.fake_dynamo import FakeDynamoResource
+
+
+class FakeView:
+    def __init__(self, is_awaiting_input: bool):
+        self.is_awaiting_input = is_awaiting_input
+
+
+class FakeChallenge:
+    class Message:
+        id = 'challenge'
+
+    discord_message = Message()
+
+
+def make_player(id: str) -> Player:
+    """
+    :return: A Player that is saved, and so can be evicted.
+    """
+    user = UserBuilder().build()
+    user.id = id
+    player = PlayerBuilder().with_user(user).build()
+    player.mark_saved()
+    return player
+
+
+class PlayerCacheTests(unittest.TestCase):
+
+    def test_least_recently_used(self):
+        error = "The least recently used player wasn't evicted when the cache was full"
+        cache = PlayerCache(max_size=2)
+        for id in ['1', '2']:
+            cache.put(make_player(id))
+        cache.get('1')
+        cache.put(make_player('3'))
+        self.assertEqual(cache.size, 2, error)
+        self.assertNotIn('2', cache, error)
+        self.assertIn('1', cache, error)
+        self.assertEqual(cache.num_evictions, 1, error)
+
+    def test_idle(self):
+        error = "An idle player wasn't evicted"
+        cache = PlayerCache(idle_seconds=0.05)
+        cache.put(make_player('1'))
+        time.sleep(0.06)
+        cache.evict_expired()
+        self.assertEqual(cache.size, 0, error)
+
+    def test_hits_and_misses(self):
+        error = "Cache hits and misses weren't counted"
+        cache = PlayerCache()
+        cache.put(make_player('1'))
+        cache.get('1')
+        cache.get('1')
+        cache.get('2')
+        self.assertEqual(cache.num_hits, 2, error)
+        self.assertEqual(cache.num_misses, 1, error)
+
+    def _assert_kept(self, player: Player, error: str) -> None:
+        cache = PlayerCache(max_size=1)
+        cache.put(player)
+        cache.put(make_player('2'))
+        self.assertIn(player.id, cache, error)
+
+    def test_keep_in_combat(self):
+        error = "A player in combat was evicted"
+        player = make_player('1')
+        player.combat_team = object()
+        self._assert_kept(player, error)
+
+    def test_keep_awaiting_input(self):
+        error = "A player whose form awaits input was evicted"
+        player = make_player('1')
+        player.set_primary_view(FakeView(is_awaiting_input=True))
+        self._assert_kept(player, error)
+
+    def test_evict_idle_view(self):
+        error = "A player was kept only because they had a form open"
+        cache = PlayerCache(idle_seconds=0.05)
+        player = make_player('1')
+        player.set_primary_view(FakeView(is_awaiting_input=False))
+        cache.put(player)
+        time.sleep(0.06)
+        cache.evict_expired()
+        self.assertNotIn('1', cache, error)
+
+    def test_skipped_player_stays_idle(self):
+        error = "Skipping a player that was in use reset how long they had been idle"
+        cache = PlayerCache(idle_seconds=0.05)
+        player = make_player('1')
+        player.combat_team = object()
+        cache.put(player)
+        time.sleep(0.06)
+        cache.evict_expired()
+        self.assertIn('1', cache, error)
+        player.combat_team = None
+        cache.evict_expired()
+        self.assertNotIn('1', cache, error)
+
+    def test_put_if_absent(self):
+        error = "Caching a loaded player replaced one that was cached in the meantime, or evicted off the event loop"
+        cache = PlayerCache(max_size=1)
+        cached = make_player('1')
+        cache.put(cached)
+        self.assertIs(cache.put_if_absent(make_player('1')), cached, error)
+        cache.put_if_absent(make_player('2'))
+        self.assertEqual(cache.size, 2, error)
+        cache.evict_expired()
+        self.assertEqual(cache.size, 1, error)
+
+    def test_keep_challenged(self):
+        error = "A player with a pending challenge was evicted"
+        player = make_player('1')
+        player.add_challenge(FakeChallenge())
+        self._assert_kept(player, error)
+
+    def test_save_before_eviction(self):
+        error = "A player with unsaved changes wasn't saved before being evicted"
+        saved = []
+        cache = PlayerCache(max_size=1, save=saved.append)
+        player = make_player('1')
+        player.update_gold(10)
+        cache.put(player)
+        cache.put(make_player('2'))
+        self.assertEqual(saved, [player], error)
+        self.assertIn('1', cache, error)
+        player.mark_saved()
+        cache.put(make_player('3'))
+        self.assertNotIn('1', cache, error)
+
+    def test_keep_while_saving(self):
+        error = "A player was evicted while their save was being written"
+        cache = PlayerCache(max_size=1, is_saving=lambda player: player.id == '1')
+        cache.put(make_player('1'))
+        cache.put(make_player('2'))
+        self.assertIn('1', cache, error)
+
+    def test_data_manager_eviction(self):
+        error = "A player's changes were lost when the DataManager evicted them"
+        dynamodb = FakeDynamoResource()
+        add_player_with_elementals(dynamodb, 4)
+        data_manager = DataManager(DynamoBackend(dynamodb), cache_size=1, save_window=60)
+        player = data_manager.get_player(UserBuilder().build())
+        player.update_gold(100)
+        other = UserBuilder().build()
+        other.id = 'other'
+        data_manager.get_created_player(other)
+        data_manager.save_queue.flush(timeout=5)
+        self.assertEqual(dynamodb.Table('Players').items[player.id]['gold'], player.gold, error)
+        data_manager.players.evict_expired()
+        data_manager.get_created_player(other)
+        self.assertNotIn(player.id, data_manager.players, error)
+        data_manager.close()
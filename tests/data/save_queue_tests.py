@@ -0,0 +1,163 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from src.data.save_queue import SaveQueue, PendingSave
+from tests.character.character_builder import PlayerBuilder
+from tests.character.user_builder import UserBuilder
+from tests.elemental.elemental_builder import ElementalBuilder
+
+
+class RecordingWriter:
+    """
+    Records the PendingSaves it is asked to write, optionally failing or blocking.
+    """
+
+    def __init__(self, delay: float = 0, failures: int = 0):
+        self.delay = delay
+        self.failures = failures  # The number of writes to fail before succeeding.
+        self.writes = []  # List[PendingSave]
+        self.concurrent = 0
+        self.max_concurrent = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, pending: PendingSave) -> None:
+        with self._lock:
+            self.concurrent += 1
+            self.max_concurrent = max(self.max_concurrent, self.concurrent)
+        time.sleep(self.delay)
+        with self._lock:
+            self.concurrent -= 1
+            if self.failures > 0:
+                self.failures -= 1
+                raise ConnectionError("Fake failure")
+            self.writes.append(pending)
+
+
+def make_player(id: str):
+    user = UserBuilder().build()
+    user.id = id
+    return PlayerBuilder().with_user(user).build()
+
+
+class SaveQueueTests(unittest.TestCase):
+
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(max_workers=8)
+
+    def tearDown(self):
+        self.executor.shutdown(wait=True)
+
+    def test_coalesce_saves(self):
+        error = "Repeated saves of a player inside the window weren't written once"
+        writer = RecordingWriter()
+        queue = SaveQueue(writer, self.executor, window=0.1)
+        player = make_player('1')
+        for i in range(10):
+            queue.add(player, save_player=True, save_inventory=True, save_team=True)
+        time.sleep(0.3)
+        self.assertEqual(len(writer.writes), 1, error)
+        self.assertEqual(queue.num_requested, 10, error)
+
+    def test_coalesce_parts(self):
+        error = "Saving different parts of a player weren't merged into one write"
+        writer = RecordingWriter()
+        queue = SaveQueue(writer, self.executor, window=60)
+        player = make_player('1')
+        elemental = ElementalBuilder().build()
+        queue.add(player, save_player=True)
+        queue.add(player, save_inventory=True)
+        queue.add(player, elementals=[elemental])
+        queue.flush()
+        pending = writer.writes[0]
+        self.assertTrue(pending.save_player and pending.save_inventory, error)
+        self.assertEqual(pending.elementals, [elemental], error)
+
+    def test_waits_for_window(self):
+        error = "A queued save was written before its window passed"
+        writer = RecordingWriter()
+        queue = SaveQueue(writer, self.executor, window=60)
+        queue.add(make_player('1'), save_player=True)
+        time.sleep(0.1)
+        self.assertEqual(len(writer.writes), 0, error)
+        self.assertTrue(queue.is_pending(make_player('1')), error)
+
+    def test_flush(self):
+        error = "Flushing didn't write every queued player"
+        writer = RecordingWriter()
+        queue = SaveQueue(writer, self.executor, window=60)
+        for id in ['1', '2', '3']:
+            queue.add(make_player(id), save_player=True)
+        self.assertTrue(queue.flush(timeout=5), error)
+        self.assertEqual(len(writer.writes), 3, error)
+        self.assertEqual(queue.num_pending, 0, error)
+
+    def test_flush_one_player(self):
+        error = "Flushing one player wrote somebody else"
+        writer = RecordingWriter()
+        queue = SaveQueue(writer, self.executor, window=60)
+        flushed = make_player('1')
+        queue.add(flushed, save_player=True)
+        queue.add(make_player('2'), save_player=True)
+        queue.flush(flushed)
+        self.assertEqual([pending.player.id for pending in writer.writes], ['1'], error)
+        self.assertEqual(queue.num_pending, 1, error)
+
+    def test_bounded_concurrency(self):
+        error = "More writes ran at once than the queue allows"
+        writer = RecordingWriter(delay=0.05)
+        queue = SaveQueue(writer, self.executor, window=0, max_concurrent_writes=2)
+        for i in range(8):
+            queue.add(make_player(str(i)), save_player=True)
+        queue.flush(timeout=5)
+        self.assertEqual(len(writer.writes), 8, error)
+        self.assertLessEqual(writer.max_concurrent, 2, error)
+
+    def test_retry_failed_write(self):
+        error = "A failed write wasn't retried"
+        writer = RecordingWriter(failures=1)
+        queue = SaveQueue(writer, self.executor, window=0)
+        queue.add(make_player('1'), save_player=True)
+        SaveQueue.RETRY_SECONDS, retry_seconds = 0, SaveQueue.RETRY_SECONDS
+        try:
+            self.assertTrue(queue.flush(timeout=5), error)
+        finally:
+            SaveQueue.RETRY_SECONDS = retry_seconds
+        self.assertEqual(len(writer.writes), 1, error)
+        self.assertEqual(queue.num_failed, 1, error)
+
+    def test_gives_up(self):
+        error = "A save that kept failing wasn't given up on"
+        writer = RecordingWriter(failures=10)
+        queue = SaveQueue(writer, self.executor, window=0)
+        queue.add(make_player('1'), save_player=True)
+        SaveQueue.RETRY_SECONDS, retry_seconds = 0, SaveQueue.RETRY_SECONDS
+        try:
+            self.assertFalse(queue.flush(timeout=5), error)
+        finally:
+            SaveQueue.RETRY_SECONDS = retry_seconds
+        self.assertEqual(queue.num_failed, SaveQueue.MAX_ATTEMPTS, error)
+        self.assertEqual(queue.num_abandoned, 1, error)
+        self.assertEqual(queue.num_pending, 0, error)
+
+    def test_snapshot_when_queued(self):
+        error = "A save wasn't snapshotted when it was queued"
+        writer = RecordingWriter()
+        queue = SaveQueue(writer, self.executor, window=60)
+        player = make_player('1')
+        queue.add(player, save_player=True)
+        gold = player.gold
+        player.update_gold(10)
+        queue.flush()
+        self.assertEqual(writer.writes[0].player_item['gold'], gold, error)
+        self.assertIsNone(writer.writes[0].inventory_item, error)
+
+    def test_unique_elementals(self):
+        error = "Saves of different elementals were merged into one"
+        writer = RecordingWriter()
+        queue = SaveQueue(writer, self.executor, window=60)
+        elementals = [ElementalBuilder().build(), ElementalBuilder().build()]
+        queue.add(make_player('1'), elementals=elementals)
+        queue.flush()
+        self.assertEqual(writer.writes[0].elementals, elementals, error)
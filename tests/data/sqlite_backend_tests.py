@@ -0,0 +1,77 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from src.data.data_manager import DataManager
+from src.data.sqlite_backend import SQLiteBackend
+from src.data.storage_backend import StorageBackend
+from src.elemental.elemental_factory import ElementalInitializer
+from src.elemental.species.mithus import Mithus
+from src.items.consumables import Peach
+from tests.character.user_builder import UserBuilder
+
+
+class SQLiteBackendTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'monbot.db')
+        self.backend = SQLiteBackend(self.path)
+
+    def tearDown(self):
+        self.backend.close()
+        self.directory.cleanup()
+
+    def test_wal(self):
+        error = "The database wasn't in WAL mode"
+        mode = self.backend._connection().execute('PRAGMA journal_mode').fetchone()[0]
+        self.assertEqual(mode, 'wal', error)
+
+    def test_put_and_get(self):
+        error = "A stored item didn't come back the same"
+        item = {'id': '1', 'name': 'Fluffy', 'team': ['a', 'b']}
+        self.backend.put(StorageBackend.PLAYERS, item)
+        self.assertEqual(self.backend.get(StorageBackend.PLAYERS, '1'), item, error)
+        self.assertIsNone(self.backend.get(StorageBackend.PLAYERS, '2'), error)
+
+    def test_update(self):
+        error = "Updating an item didn't keep the attributes that weren't changed"
+        self.backend.put(StorageBackend.PLAYERS, {'id': '1', 'gold': 5, 'level': 3})
+        self.backend.update(StorageBackend.PLAYERS, '1', {'gold': 10})
+        self.assertEqual(self.backend.get(StorageBackend.PLAYERS, '1'), {'id': '1', 'gold': 10, 'level': 3}, error)
+
+    def test_batch(self):
+        error = "A batch of items wasn't stored or loaded in full"
+        items = [{'id': str(i), 'level': i} for i in range(1200)]
+        self.backend.batch_put(StorageBackend.ELEMENTALS, items)
+        self.backend.batch_put(StorageBackend.ELEMENTALS, items[:10])  # Upserts over existing items.
+        loaded = self.backend.batch_get(StorageBackend.ELEMENTALS, [item['id'] for item in items])
+        self.assertEqual(sorted(loaded, key=lambda item: item['level']), items, error)
+
+    def test_connection_per_thread(self):
+        error = "Threads didn't get their own connections"
+        connections = []
+        thread = threading.Thread(target=lambda: connections.append(self.backend._connection()))
+        thread.start()
+        thread.join()
+        self.assertIsNot(connections[0], self.backend._connection(), error)
+
+    def test_data_manager(self):
+        error = "A player saved to SQLite didn't load the same"
+        user = UserBuilder().build()
+        data_manager = DataManager(self.backend)
+        player = data_manager.get_created_player(user)
+        elemental = ElementalInitializer.make(Mithus(), level=5)
+        player.add_elemental(elemental)
+        player.add_item(Peach())
+        player.update_gold(20)
+        data_manager.save_all(player)
+
+        other_backend = SQLiteBackend(self.path)
+        loaded = DataManager(other_backend).get_player(user)
+        other_backend.close()
+        self.assertEqual(loaded.to_server(), player.to_server(), error)
+        self.assertEqual(loaded.inventory_to_server(), player.inventory_to_server(), error)
+        self.assertEqual(loaded.team.elementals[0].to_server(), elemental.to_server(), error)
+        self.assertFalse(loaded.has_unsaved_changes, error)
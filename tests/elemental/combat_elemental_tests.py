@@ -1,9 +1,12 @@
 import unittest
+from unittest.mock import Mock
 
 from src.elemental.ability.abilities.wait import Wait
 from src.elemental.ability.ability import Ability
 from src.elemental.combat_elemental import CombatElemental
 from src.elemental.elemental import Elemental
+from src.elemental.status_effect.status_effects.defend import DefendEffect
+from src.team.combat_team import CombatTeam
 from tests.elemental.elemental_builder import CombatElementalBuilder, ElementalBuilder
 
 
@@ -26,6 +29,11 @@ class CombatElementalTests(unittest.TestCase):
             .with_max_hp(50) \
             .build()
 
+    def get_team_elemental(self) -> CombatElemental:
+        team = CombatTeam([self.get_elemental()])
+        team.logger = Mock()
+        return team.elementals[0]
+
     def get_combat_elemental(self) -> CombatElemental:
         return CombatElementalBuilder().with_elemental(self.get_elemental()).build()
 
@@ -124,4 +132,26 @@ class CombatElementalTests(unittest.TestCase):
         mana_after_turn = self.combat_elemental.current_mana
         self.assertGreater(mana_after_turn, mana_before_turn, error)
 
-
+    def test_snapshot_reused(self):
+        error = "A new snapshot was made though nothing had changed"
+        combat_elemental = self.get_team_elemental()
+        self.assertIs(combat_elemental.snapshot(), combat_elemental.snapshot(), error)
+
+    def test_snapshot_shares_unchanged_state(self):
+        error = "A snapshot didn't share unchanged status effects with the previous one"
+        combat_elemental = self.get_team_elemental()
+        combat_elemental.add_status_effect(DefendEffect())
+        before = combat_elemental.snapshot()
+        combat_elemental.heal(1)
+        after = combat_elemental.snapshot()
+        self.assertNotEqual(before.current_hp, after.current_hp, error)
+        self.assertIs(before.status_effects, after.status_effects, error)
+        self.assertIs(before.team_status, after.team_status, error)
+
+    def test_snapshot_static(self):
+        error = "A snapshot changed along with the elemental"
+        combat_elemental = self.get_team_elemental()
+        before = combat_elemental.snapshot()
+        combat_elemental.add_status_effect(DefendEffect())
+        self.assertEqual(len(before.status_effects), 0, error)
+        self.assertEqual(len(combat_elemental.snapshot().status_effects), 1, error)
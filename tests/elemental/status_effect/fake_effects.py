@@ -41,3 +41,21 @@ class PermaBuff(StatusEffect):
     def on_effect_start(self) -> str:
         super().on_effect_start()
         return f"{self.target.nickname}'s magic defence has increased."
+
+
+class AttackObserver(StatusEffect):
+    """
+    Records its target's physical attack at the end of each turn, like a bleed calculating its damage.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.observed = []
+
+    @property
+    def turn_duration(self) -> int:
+        return -1
+
+    def on_turn_end(self) -> bool:
+        self.observed.append(self.target.physical_att)
+        return False
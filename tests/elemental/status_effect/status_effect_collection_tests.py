@@ -0,0 +1,71 @@
+import unittest
+
+from src.elemental.status_effect.status_effect import EffectType
+from src.elemental.status_effect.status_effect_collection import StatusEffectCollection
+from src.elemental.status_effect.status_effects.defend import DefendEffect
+from src.elemental.status_effect.status_effects.stun import Stun
+from tests.elemental.status_effect.fake_effects import GenericBuff, PermaBuff
+
+
+class StatusEffectCollectionTests(unittest.TestCase):
+
+    def setUp(self):
+        self.effects = StatusEffectCollection()
+
+    def test_has_type(self):
+        error = "An effect's type wasn't indexed"
+        stun = Stun()
+        self.effects.add(stun)
+        self.assertTrue(self.effects.has_type(EffectType.STUN), error)
+        self.effects.remove(stun)
+        self.assertFalse(self.effects.has_type(EffectType.STUN), error)
+
+    def test_find(self):
+        error = "An effect couldn't be found by its class"
+        buff = GenericBuff()
+        self.effects.add(buff)
+        self.effects.add(GenericBuff())
+        self.assertIs(self.effects.find(GenericBuff), buff, error)
+        self.assertIsNone(self.effects.find(PermaBuff), error)
+
+    def test_order(self):
+        error = "Effects weren't kept in the order they were added"
+        effects = [GenericBuff(), DefendEffect(), PermaBuff()]
+        for effect in effects:
+            self.effects.add(effect)
+        self.effects.remove(effects[1])
+        self.assertEqual(self.effects.as_list(), [effects[0], effects[2]], error)
+
+    def test_remove_while_iterating(self):
+        error = "Removing effects while iterating skipped an effect"
+        effects = [GenericBuff(), GenericBuff(), GenericBuff(), PermaBuff()]
+        for effect in effects:
+            self.effects.add(effect)
+        visited = []
+        for effect in self.effects:
+            visited.append(effect)
+            self.effects.remove(effect)
+        self.assertEqual(visited, effects, error)
+        self.assertEqual(len(self.effects), 0, error)
+        self.assertEqual(self.effects._effects, [], error)
+
+    def test_add_while_iterating(self):
+        error = "An effect added while iterating wasn't iterated"
+        added = PermaBuff()
+        self.effects.add(GenericBuff())
+        visited = []
+        for effect in self.effects:
+            visited.append(effect)
+            self.effects.add(added)
+        self.assertIn(added, visited, error)
+
+    def test_removed_effect_skipped(self):
+        error = "An effect removed during iteration was still iterated"
+        effects = [GenericBuff(), GenericBuff()]
+        for effect in effects:
+            self.effects.add(effect)
+        visited = []
+        for effect in self.effects:
+            visited.append(effect)
+            self.effects.remove(effects[1])
+        self.assertEqual(visited, [effects[0]], error)
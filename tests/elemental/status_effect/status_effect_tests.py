@@ -20,7 +20,7 @@ from src.team.combat_team import CombatTeam
 from src.team.team import Team
 from tests.character.character_builder import PlayerBuilder
 from tests.elemental.elemental_builder import CombatElementalBuilder, ElementalBuilder
-from tests.elemental.status_effect.fake_effects import GenericBuff, PermaBuff
+from tests.elemental.status_effect.fake_effects import GenericBuff, PermaBuff, AttackObserver
 from tests.team.team_builder import TeamBuilder
 
 
@@ -133,6 +133,45 @@ class StatusEffectTests(unittest.TestCase):
         physical_att_after = elemental.physical_att
         self.assertEqual(physical_att_before, physical_att_after, error)
 
+    def test_effect_stats_each_turn(self):
+        error = "Stats read during a turn weren't updated when the effect changed"
+        elemental = CombatElementalBuilder().build()
+        elemental.add_status_effect(EnrageEffect())
+        physical_att = [elemental.physical_att]
+        for i in range(3):
+            elemental.end_turn()
+            physical_att.append(elemental.physical_att)
+        self.assertLess(physical_att[0], physical_att[1], error)
+        self.assertLess(physical_att[1], physical_att[2], error)
+
+    def test_effect_stats_during_trigger(self):
+        error = "An effect read stats that were out of date after an earlier effect changed them"
+        elemental = CombatElementalBuilder().build()
+        elemental.add_status_effect(EnrageEffect())
+        observer = AttackObserver()
+        elemental.add_status_effect(observer)
+        elemental.end_turn()
+        self.assertEqual(observer.observed, [elemental.physical_att], error)
+
+    def test_effect_stats_switch_out(self):
+        error = "Stats change persisted after switching out ended the effect"
+        elemental = CombatElementalBuilder().build()
+        magic_att_before = elemental.magic_att
+        elemental.add_status_effect(EnrageEffect())
+        elemental.end_turn()
+        self.assertGreater(elemental.magic_att, magic_att_before, error)
+        elemental.on_switch_out()
+        self.assertEqual(elemental.magic_att, magic_att_before, error)
+
+    def test_switch_out_ends_every_effect(self):
+        error = "Switching out skipped an effect that ends on switch"
+        elemental = CombatElementalBuilder().build()
+        elemental.add_status_effect(GenericBuff())
+        elemental.add_status_effect(EnrageEffect())
+        elemental.add_status_effect(DefendEffect())
+        elemental.on_switch_out()
+        self.assertEqual(elemental.num_status_effects, 0, error)
+
     def test_perma_buff(self):
         error = "A StatusEffect with no duration could incorrectly be decremented"
         elemental = CombatElementalBuilder().build()
@@ -152,6 +191,15 @@ class StatusEffectTests(unittest.TestCase):
         num_effects = elemental.num_status_effects
         self.assertEqual(num_effects, 0, error)
 
+    def test_dispel_every_buff(self):
+        error = "Dispel skipped a dispellable buff"
+        elemental = CombatElementalBuilder().build()
+        elemental.add_status_effect(GenericBuff())
+        elemental.add_status_effect(EnrageEffect())
+        elemental.add_status_effect(PermaBuff())
+        elemental.dispel_all(CombatElementalBuilder().build())
+        self.assertEqual(elemental.num_status_effects, 1, error)
+
     def test_undispellable_buff(self):
         error = "An undispellable effect was incorrectly able to be dispelled"
         elemental = CombatElementalBuilder().build()
@@ -92,3 +92,13 @@ class ElementalEffectivenessTests(TestCase):
         ]
         result = Effectiveness.find_effective(elementals, Elements.FIRE)
         self.assertEqual(len(result), 1, error)
+
+    def test_table_matches_rules(self):
+        error = "The precomputed effectiveness table disagrees with the rules"
+        self.assertEqual(len(Effectiveness.MULTIPLIERS), len(Elements), error)
+        for to_check in Elements:
+            for against in Elements:
+                rules = Effectiveness(to_check, against)
+                self.assertEqual(Effectiveness.multiplier(to_check, against), rules.calculate_multiplier(), error)
+                self.assertEqual(Effectiveness.effective(to_check, against), rules.is_effective(), error)
+                self.assertEqual(Effectiveness.resisted(to_check, against), rules.is_resistant(), error)
@@ -0,0 +1,55 @@
+import argparse
+import time
+import unittest
+
+from src.combat.combat_ai import CombatAI
+from src.simulation.battle_simulator import BattleSimulator, PhaseTimer, GENERATORS
+
+
+class BattleSimulatorTests(unittest.TestCase):
+
+    def setUp(self):
+        self.args = argparse.Namespace(min_level=5, max_level=10, min_team_size=1, max_team_size=4)
+
+    def test_run_battles(self):
+        error = "The simulator didn't play every battle"
+        for name, generator in GENERATORS.items():
+            result = BattleSimulator(lambda rng: generator(self.args, rng)).run(5)
+            self.assertEqual(result.num_battles, 5, error)
+            self.assertEqual(result.num_errors, 0, error)
+            self.assertGreater(result.num_rounds, 0, error)
+
+    def test_seed(self):
+        error = "Simulations with the same seed played differently"
+        results = [BattleSimulator(lambda rng: GENERATORS['collectors'](self.args, rng), seed=7).run(5)
+                   for i in range(2)]
+        self.assertEqual(results[0].num_rounds, results[1].num_rounds, error)
+        self.assertEqual(results[0].side_a_wins, results[1].side_a_wins, error)
+
+    def test_phases(self):
+        error = "Engine phases weren't timed"
+        result = BattleSimulator(lambda rng: GENERATORS['collectors'](self.args, rng), time_phases=True).run(3)
+        self.assertGreater(result.phase_seconds['ai'], 0, error)
+        self.assertGreater(result.phase_seconds['actions'], 0, error)
+        self.assertLessEqual(sum(result.phase_seconds.values()), result.seconds, error)
+
+    def test_restore(self):
+        error = "The engine was left instrumented after the simulation"
+        pick_move = CombatAI.pick_move
+        BattleSimulator(lambda rng: GENERATORS['collectors'](self.args, rng), time_phases=True).run(1)
+        self.assertIs(CombatAI.pick_move, pick_move, error)
+
+
+class PhaseTimerTests(unittest.TestCase):
+
+    def test_self_time(self):
+        error = "Time in a nested phase was counted towards its parent"
+        timer = PhaseTimer()
+        timer.enter('outer')
+        time.sleep(0.02)
+        timer.enter('inner')
+        time.sleep(0.05)
+        timer.exit()
+        timer.exit()
+        self.assertLess(timer.seconds['outer'], 0.04, error)
+        self.assertGreaterEqual(timer.seconds['inner'], 0.05, error)
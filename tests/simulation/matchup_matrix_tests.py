@@ -0,0 +1,44 @@
+import csv
+import os
+import tempfile
+import unittest
+
+from src.simulation.matchup_matrix import make_matchups, run_matchups, write_csv, CSV_HEADER
+
+
+class MatchupMatrixTests(unittest.TestCase):
+
+    def setUp(self):
+        self.matchups = make_matchups(['Tophu', 'Rainatu'], [5, 10], num_battles=3, seed=7)
+
+    def test_matchups(self):
+        error = "Every pair of species wasn't played at every level"
+        self.assertEqual(len(self.matchups), 8, error)
+        pairs = {(matchup.level, matchup.species_a, matchup.species_b) for matchup in self.matchups}
+        self.assertIn((10, 'Rainatu', 'Tophu'), pairs, error)
+        self.assertIn((5, 'Tophu', 'Tophu'), pairs, error)
+
+    def test_seeds(self):
+        error = "Matchups didn't get distinct seeds"
+        self.assertEqual(len({matchup.seed for matchup in self.matchups}), len(self.matchups), error)
+
+    def test_reproducible(self):
+        error = "The same seed gave different results with a different number of processes"
+        self.assertEqual(run_matchups(self.matchups, processes=1), run_matchups(self.matchups, processes=2), error)
+
+    def test_results(self):
+        error = "A matchup's outcomes didn't add up to its battles"
+        for result in run_matchups(self.matchups, processes=1):
+            self.assertEqual(result.a_wins + result.b_wins + result.draws + result.unfinished + result.errors,
+                             result.num_battles, error)
+
+    def test_write_csv(self):
+        error = "The CSV didn't have a row per matchup"
+        results = run_matchups(self.matchups[:2], processes=1)
+        path = os.path.join(tempfile.mkdtemp(), 'matchups.csv')
+        write_csv(results, path)
+        with open(path) as file:
+            rows = list(csv.reader(file))
+        self.assertEqual(rows[0], CSV_HEADER, error)
+        self.assertEqual(len(rows), 3, error)
+        self.assertEqual(rows[1][:4], ['5', 'Tophu', 'Tophu', '3'], error)
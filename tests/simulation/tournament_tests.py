@@ -0,0 +1,69 @@
+import argparse
+import os
+import random
+import tempfile
+import unittest
+
+from src.combat.difficulty import Difficulty
+from src.combat.policy import PolicyTable
+from src.simulation.tournament import CONTROLLERS, make_matches, make_team, play, run_matches, wilson_interval
+
+
+class TournamentTests(unittest.TestCase):
+
+    def setUp(self):
+        policy_path = os.path.join(tempfile.mkdtemp(), 'policy.bin')
+        PolicyTable().save(policy_path)
+        self.args = argparse.Namespace(min_level=5, max_level=8, min_team_size=1, max_team_size=2, policy=policy_path)
+        self.matches = make_matches(self.args, ['random', 'policy'], num_battles=3, battles_per_task=2, seed=4)
+
+    def test_matches(self):
+        error = "The battles of each pair of controllers weren't split into tasks"
+        self.assertEqual([match.num_battles for match in self.matches], [2, 1], error)
+        self.assertEqual(len({match.seed for match in self.matches}), len(self.matches), error)
+        matches = make_matches(self.args, ['random', 'random', 'normal'], 3, 3, seed=4)
+        pairs = [(match.controller_a, match.controller_b) for match in matches]
+        self.assertEqual(pairs, [('random', 'random'), ('random', 'normal')], error)
+
+    def test_mirrored_teams(self):
+        error = "Teams made from the same seed weren't the same"
+        teams = [make_team(self.args, CONTROLLERS['normal'], PolicyTable(), random.Random(3)) for i in range(2)]
+        for elemental_a, elemental_b in zip(teams[0].elementals, teams[1].elementals):
+            self.assertEqual(elemental_a.name, elemental_b.name, error)
+            self.assertEqual(elemental_a.level, elemental_b.level, error)
+            self.assertEqual(elemental_a.max_hp, elemental_b.max_hp, error)
+        self.assertEqual(teams[0].difficulty, Difficulty.NORMAL, error)
+
+    def test_results(self):
+        error = "A pair's results didn't add up to its battles"
+        results = run_matches(self.matches, processes=1)
+        self.assertEqual(len(results), 1, error)
+        result = results[0]
+        self.assertEqual(result.num_battles, 6, error)
+        self.assertEqual(result.a_wins + result.b_wins + result.draws + result.unfinished + result.errors,
+                         result.num_battles, error)
+        self.assertGreater(len(result.decision_seconds['random']), 0, error)
+        self.assertGreater(len(result.decision_seconds['policy']), 0, error)
+
+    def test_policy_required(self):
+        error = "The policy controller played without a policy file"
+        with self.assertRaises(ValueError, msg=error):
+            play(self.matches[0]._replace(args=argparse.Namespace(**{**vars(self.args), 'policy': None})))
+
+    def test_mirror_match(self):
+        error = "A controller didn't win exactly half of its battles against itself"
+        result = run_matches(make_matches(self.args, ['random', 'random'], 3, 3, seed=4), processes=1)[0]
+        self.assertEqual(result.a_wins, result.b_wins, error)
+
+    def test_reproducible(self):
+        error = "The same seed gave different results with a different number of processes"
+        results = [run_matches(self.matches, processes=processes)[0] for processes in [1, 2]]
+        self.assertEqual(results[0][:-1], results[1][:-1], error)
+
+    def test_wilson_interval(self):
+        error = "The confidence interval was wrong"
+        low, high = wilson_interval(50, 100)
+        self.assertAlmostEqual(low, 0.4038, places=3, msg=error)
+        self.assertAlmostEqual(high, 0.5962, places=3, msg=error)
+        self.assertEqual(wilson_interval(0, 0), (0.0, 1.0), error)
+        self.assertEqual(wilson_interval(10, 10)[1], 1.0, error)
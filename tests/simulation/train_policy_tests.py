@@ -0,0 +1,48 @@
+import argparse
+import random
+import unittest
+
+from src.combat.combat import Combat
+from src.combat.combat_ai import CombatAI
+from src.simulation.battle_simulator import GENERATORS, NullDataManager
+from src.simulation.train_policy import PolicyTrainer, make_tasks, run_tasks
+
+
+class TrainPolicyTests(unittest.TestCase):
+
+    def setUp(self):
+        args = argparse.Namespace(generator='wild', min_level=3, max_level=5, min_team_size=1, max_team_size=2,
+                                  rollouts=1)
+        self.tasks = make_tasks(args, num_battles=3, battles_per_task=2, seed=5)
+
+    def test_tasks(self):
+        error = "The battles weren't split into tasks with distinct seeds"
+        self.assertEqual([task.num_battles for task in self.tasks], [2, 1], error)
+        self.assertEqual(len({task.seed for task in self.tasks}), len(self.tasks), error)
+
+    def test_samples(self):
+        error = "Self-play didn't sample the choices of any state"
+        totals = run_tasks(self.tasks, processes=1)
+        self.assertGreater(len(totals), 0, error)
+        for choices in totals.values():
+            for score, count in choices.values():
+                self.assertGreater(count, 0, error)
+
+    def test_reproducible(self):
+        error = "The same seed gave different samples with a different number of processes"
+        self.assertEqual(run_tasks(self.tasks, processes=1), run_tasks(self.tasks, processes=2), error)
+
+    def test_unwrapped(self):
+        error = "Training changed CombatAI for everything else"
+        original = CombatAI.pick_move
+        run_tasks(self.tasks[1:], processes=1)
+        self.assertIs(CombatAI.pick_move, original, error)
+
+    def test_rollouts_not_sampled(self):
+        error = "Moves made by rollouts were sampled as well as the battle's"
+        trainer = PolicyTrainer(rollouts_per_choice=2, seed=1)
+        team_a, team_b = GENERATORS['wild'](self.tasks[0].args, random.Random(1))
+        combat = Combat([team_a], [team_b], data_manager=NullDataManager(), seed=1, make_ai=trainer.make_ai)
+        # At most a move per team and round, where every sample plays several rounds of rollouts.
+        self.assertGreater(trainer.num_samples, 0, error)
+        self.assertLessEqual(trainer.num_samples, 2 * (combat.num_rounds + 1), error)
@@ -44,7 +44,7 @@ class CombatTeamTests(unittest.TestCase):
         ])
         Combat([team], [], Mock())
         self.assertEqual(len(team.bench), 1, error)
-        self.assertEqual(team.bench[0].id, team.elementals[0].id, error)
+        self.assertEqual(team.bench[0].id, team.elementals[1].id, error)
 
     def test_eligible_bench(self):
         error = "CombatTeam incorrectly included knocked out CombatElementals in the eligible bench"
@@ -21,6 +21,7 @@ class TeamTests(unittest.TestCase):
 
     def test_reorder_elementals(self):
         error = "Failed to reorder Elementals in a Team"
+        self.team = TeamBuilder().with_elementals([]).build()
         monze = ElementalBuilder().build()
         lofy = ElementalBuilder().build()
         self.team.add_elemental(monze)  # Position 0
@@ -46,6 +47,7 @@ class TeamTests(unittest.TestCase):
 
     def test_reorder_empty(self):
         error = "Incorrectly reordered an Elemental into an empty slot"
+        self.team = TeamBuilder().with_elementals([]).build()
         monze = ElementalBuilder().build()
         self.team.add_elemental(monze)
         self.team.reorder(0, 3)
@@ -53,6 +55,7 @@ class TeamTests(unittest.TestCase):
 
     def test_remove_elemental(self):
         error = "Failed to remove an Elemental from the Team"
+        self.team = TeamBuilder().with_elementals([]).build()
         monze = ElementalBuilder().build()
         lofy = ElementalBuilder().build()
         self.team.add_elemental(monze)  # Position 0
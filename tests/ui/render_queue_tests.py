@@ -0,0 +1,172 @@
+import asyncio
+import time
+import unittest
+from unittest.mock import Mock
+
+import discord
+
+from src.ui.render_queue import RateLimitBucket, RenderQueue
+
+
+class FakeBot:
+    """
+    Records the edits it's asked to make, each taking a little while like a request would.
+    """
+
+    def __init__(self, deleted=False, errors=()):
+        self.edits = []  # [(message id, content)]
+        self.sent = []  # [(channel id, content)]
+        self.deleted = deleted  # If editing a message fails because it was deleted.
+        self.errors = list(errors)  # Raised by the first edits, one each.
+
+    async def edit_message(self, discord_message, content: str) -> None:
+        await asyncio.sleep(0.001)
+        if self.errors:
+            raise self.errors.pop(0)
+        if self.deleted:
+            raise discord.errors.NotFound(Mock(status=404, reason='Not Found'), 'Unknown Message')
+        self.edits.append((discord_message.id, content))
+
+    async def send_message(self, channel, content: str):
+        self.sent.append((channel.id, content))
+        return make_message('resent', channel.id)
+
+
+def make_message(message_id: str, channel_id: str):
+    return Mock(id=message_id, channel=Mock(id=channel_id))
+
+
+class RenderQueueTests(unittest.TestCase):
+
+    def setUp(self):
+        self.bot = FakeBot()
+        self.message = make_message('1', 'channel')
+
+    def test_sends(self):
+        error = "A frame wasn't shown"
+
+        async def render():
+            queue = RenderQueue(self.bot)
+            shown = await queue.submit(self.message, 'frame')
+            return queue, shown
+
+        queue, shown = asyncio.run(render())
+        self.assertTrue(shown, error)
+        self.assertEqual(self.bot.edits, [('1', 'frame')], error)
+        self.assertEqual(queue.num_sent, 1, error)
+        self.assertEqual(queue.num_pending, 0, error)
+
+    def test_latest_frame(self):
+        error = "Superseded frames weren't dropped in favour of the latest"
+
+        async def render():
+            queue = RenderQueue(self.bot, edits_per_period=1, period=0.05)
+            first = queue.submit(self.message, 'first')
+            await asyncio.sleep(0)  # The first frame is sent right away, then the rate limit holds back the rest.
+            for i in range(5):
+                queue.submit(self.message, f'frame {i}')
+            await queue.submit(self.message, 'latest')
+            return queue, first
+
+        queue, first = asyncio.run(render())
+        self.assertEqual(self.bot.edits, [('1', 'first'), ('1', 'latest')], error)
+        self.assertTrue(first.result(), error)
+        self.assertEqual(queue.num_sent, 2, error)
+        self.assertEqual(queue.num_dropped, 5, error)
+
+    def test_superseded_result(self):
+        error = "Waiting for a superseded frame didn't end when it was dropped"
+
+        async def render():
+            queue = RenderQueue(self.bot, edits_per_period=1, period=0.05)
+            queue.submit(self.message, 'first')
+            dropped = queue.submit(self.message, 'dropped')
+            queue.submit(self.message, 'latest')
+            return dropped.done() and not dropped.result()
+
+        self.assertTrue(asyncio.run(render()), error)
+
+    def test_rate_limit(self):
+        error = "Edits to a channel weren't held back by its rate limit"
+
+        async def render():
+            queue = RenderQueue(self.bot, edits_per_period=2, period=0.1)
+            start = time.perf_counter()
+            await asyncio.gather(*[queue.submit(make_message(message_id, 'channel'), 'frame')
+                                   for message_id in ['1', '2', '3', '4']])
+            return time.perf_counter() - start
+
+        # 2 edits right away, then 1 every 0.05 s.
+        self.assertGreaterEqual(asyncio.run(render()), 0.09, error)
+        self.assertEqual(len(self.bot.edits), 4, error)
+
+    def test_channels_separate(self):
+        error = "A channel's rate limit held back edits to another channel"
+
+        async def render():
+            queue = RenderQueue(self.bot, edits_per_period=1, period=10)
+            await queue.submit(make_message('1', 'channel'), 'frame')
+            start = time.perf_counter()
+            await queue.submit(make_message('2', 'other channel'), 'frame')
+            return time.perf_counter() - start
+
+        self.assertLess(asyncio.run(render()), 1, error)
+
+    def test_resend(self):
+        error = "A deleted message wasn't sent again"
+        bot = FakeBot(deleted=True)
+        resent = []
+
+        async def render():
+            queue = RenderQueue(bot)
+            await queue.submit(self.message, 'frame', on_resend=resent.append)
+            return queue
+
+        queue = asyncio.run(render())
+        self.assertEqual(bot.sent, [('channel', 'frame')], error)
+        self.assertEqual(resent[0].id, 'resent', error)
+        self.assertEqual(queue.num_sent, 1, error)
+
+    def test_failed_edit(self):
+        error = "A failed edit stopped the frames after it from being sent"
+        bot = FakeBot(errors=[asyncio.TimeoutError()])
+
+        async def render():
+            queue = RenderQueue(bot)
+            failed = queue.submit(self.message, 'failed')
+            await asyncio.sleep(0)
+            latest = queue.submit(self.message, 'latest')
+            return queue, await failed, await latest
+
+        queue, failed, latest = asyncio.run(render())
+        self.assertFalse(failed, error)
+        self.assertTrue(latest, error)
+        self.assertEqual(bot.edits, [('1', 'latest')], error)
+        self.assertEqual(queue.num_failed, 1, error)
+
+    def test_idle_buckets_dropped(self):
+        error = "The rate limit of a channel that wasn't edited anymore was kept"
+
+        async def render():
+            queue = RenderQueue(self.bot, edits_per_period=2, period=0.02)
+            await queue.submit(make_message('1', 'channel'), 'frame')
+            await asyncio.sleep(0.03)
+            await queue.submit(make_message('2', 'other channel'), 'frame')
+            return queue
+
+        self.assertEqual(asyncio.run(render()).num_buckets, 1, error)
+
+
+class RateLimitBucketTests(unittest.TestCase):
+
+    def test_delay(self):
+        error = "The bucket didn't run out after its capacity"
+        bucket = RateLimitBucket(capacity=2, period=10)
+
+        async def take(times: int):
+            for i in range(times):
+                await bucket.acquire()
+
+        asyncio.run(take(2))
+        self.assertGreater(bucket.delay(), 4, error)
+        self.assertLessEqual(bucket.delay(), 5, error)